@@ -1,12 +1,35 @@
 import gradio as gr
 import pandas as pd
 import json
+import asyncio
+import gzip
+import os
+import tempfile
+import uuid
+from html import escape as escape_html
 from itertools import combinations
 import random
 from roulette_data import (
     EVEN_MONEY, DOZENS, COLUMNS, STREETS, CORNERS, SIX_LINES, SPLITS,
     NEIGHBORS_EUROPEAN, LEFT_OF_ZERO_EUROPEAN, RIGHT_OF_ZERO_EUROPEAN
 )
+from session_files import read_session_file
+from spin_export import EXPORT_FORMATS, export_spin_history
+from backtest import StrategyTally, backtest_all
+from bias_tests import MIN_EXPECTED, SECTIONS, BiasTests
+from pattern_tracker import PatternTrackerSet, parse_grouping
+from payouts import BET_TYPE_PAYOUTS
+from progression_markov import SIMULATION_ONLY, analyze_progression
+from progression_sim import simulate_progression, summarize_simulation, MAX_SESSIONS, MAX_SPINS
+from progressions import make_progression
+from strategies import STRATEGIES, evaluate_strategy, evaluate_all_strategies, get_rankings, bet_numbers
+from strategy_dsl import compile_rule, mask_numbers, register_rule_strategy
+from wheel_sectors import WheelSectorTracker
+from gap_tracker import GapTracker
+from dealer_signature import DealerSignature
+from pocket_posterior import PocketPosterior
+from randomness_tests import run_battery
+from window_counters import WindowCounters
 
 def update_scores_batch(spins):
     """Update scores for a batch of spins and return actions for undo.new"""
@@ -59,6 +82,14 @@ def update_scores_batch(spins):
 
         # Update straight-up scores
         state.scores[spin_value] += 1
+        state.wheel_sectors.push(spin_value)
+        state.bias_tests.push(spin_value)
+        state.posterior.push(spin_value)
+        state.gaps.push(spin_value)
+        state.dealer_signature.push(spin_value)
+        state.strategy_tally.push(spin_value)
+        state.pattern_trackers.push(spin_value)
+        state.casino_window.push(spin_value)
         action["increments"].setdefault("scores", {})[spin_value] = 1
 
         # Update side scores (simplified integer comparison)
@@ -70,6 +101,7 @@ def update_scores_batch(spins):
             action["increments"].setdefault("side_scores", {})["Right Side of Zero"] = 1
 
         action_log.append(action)
+    state.version += 1
     return action_log
 
     
@@ -143,6 +175,8 @@ class RouletteState:
             "columns": {"1st Column": 0.0, "2nd Column": 0.0, "3rd Column": 0.0}
         }
         self.use_casino_winners = False  # Toggle to highlight casino winners
+        self.auto_casino_data = False  # Fill casino_data from the session's own last spins_count spins
+        self.casino_window = WindowCounters(self.casino_data["spins_count"])
 
         # New betting progression fields
         self.bankroll = 1000
@@ -154,12 +188,35 @@ class RouletteState:
         self.progression = "Martingale"
         self.current_bet = self.base_unit
         self.next_bet = self.base_unit
-        self.progression_state = None  # e.g., Fibonacci index or Labouchere list
+        self.labouchere_sequence = [1, 2, 3, 4]
+        self.progression_engine = None  # Progression state machine, see progressions.py
         self.is_stopped = False
         self.message = f"Start with base bet of {self.base_unit} on {self.bet_type} ({self.progression})"
         self.status = "Active"
         self.status_color = "white"  # Default color for active status
         self.last_dozen_alert_index = -1  # Track the last spin index where a Dozen alert was triggered
+
+        # Streaks and sequences of every grouping (dozens, columns, colors, ...), pushed and popped with the scores
+        self.pattern_trackers = PatternTrackerSet()
+
+        # Hot/cold wheel arcs, kept in step with scores spin by spin
+        self.wheel_sectors = WheelSectorTracker()
+        # Running chi-square/G tests and section z-scores for the Dealer's Spin Tracker
+        self.bias_tests = BiasTests()
+        # Dirichlet posterior over pocket probabilities for the Bayesian Hot Numbers strategy
+        self.posterior = PocketPosterior()
+        # Spins since each pocket/section last hit, pushed and popped with the scores
+        self.gaps = GapTracker()
+        # Wheel offsets between consecutive spins, for the Dealer Signature strategy
+        self.dealer_signature = DealerSignature()
+        # This session's rule strategies (see strategy_dsl), kept out of the shared STRATEGIES
+        self.custom_strategies = {}
+        # Out-of-sample hit rates of every strategy for the Strategy Dashboard, settled lazily
+        self.strategy_tally = StrategyTally(custom_strategies=self.custom_strategies)
+
+        # Bumped on every score change; strategy results are cached per version
+        self.version = 0
+        self.analysis_cache = {}
         
     def reset(self):
         self.scores = {n: 0 for n in range(37)}
@@ -174,6 +231,16 @@ class RouletteState:
         self.selected_numbers = set(int(s) for s in self.last_spins if s.isdigit())
         self.last_spins = []
         self.spin_history = []
+        self.wheel_sectors = WheelSectorTracker()
+        self.bias_tests = BiasTests()
+        self.posterior = PocketPosterior()
+        self.gaps = GapTracker()
+        self.dealer_signature = DealerSignature()
+        self.strategy_tally = StrategyTally(custom_strategies=self.custom_strategies)
+        # Custom groupings survive a reset; only their spins are dropped
+        self.pattern_trackers.clear()
+        self.casino_window.clear()
+        self.version += 1
 
         # Reset betting progression (optional: only if you want full reset to affect progression)
         # self.reset_progression()
@@ -181,14 +248,14 @@ class RouletteState:
     def reset_progression(self):
         self.current_bet = self.base_unit
         self.next_bet = self.base_unit
-        self.progression_state = None
+        self.progression_engine = make_progression(self.progression, self.base_unit, self.labouchere_sequence)
         self.is_stopped = False
         self.message = f"Progression reset. Start with base bet of {self.base_unit} on {self.bet_type} ({self.progression})"
         self.status = "Active"
         return self.bankroll, self.current_bet, self.next_bet, self.message, self.status
 
     def update_bankroll(self, won):
-        payout = {"Even Money": 1, "Dozens": 2, "Columns": 2, "Straight Bets": 35}[self.bet_type]
+        payout = BET_TYPE_PAYOUTS[self.bet_type]
         if won:
             self.bankroll += self.current_bet * payout
         else:
@@ -216,115 +283,14 @@ class RouletteState:
             self.message = "Cannot continue: Bankroll too low."
             return self.bankroll, self.current_bet, self.next_bet, self.message, self.status, self.status_color
     
-        if self.progression == "Martingale":
-            self.current_bet = self.next_bet
-            self.next_bet = self.base_unit if won else self.current_bet * 2
-            self.message = f"{'Win' if won else 'Loss'}! Next bet: {self.next_bet}"
-        elif self.progression == "Fibonacci":
-            fib = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55]
-            if self.progression_state is None:
-                self.progression_state = 0
-            self.current_bet = self.next_bet
-            if won:
-                self.progression_state = max(0, self.progression_state - 2)
-                self.next_bet = fib[self.progression_state] * self.base_unit
-                self.message = f"Win! Move back to {self.next_bet}"
-            else:
-                self.progression_state = min(len(fib) - 1, self.progression_state + 1)
-                self.next_bet = fib[self.progression_state] * self.base_unit
-                self.message = f"Loss! Next Fibonacci bet: {self.next_bet}"
-        elif self.progression == "Triple Martingale":
-            self.current_bet = self.next_bet
-            self.next_bet = self.base_unit if won else self.current_bet * 3
-            self.message = f"{'Win' if won else 'Loss'}! Next bet: {self.next_bet}"
-        elif self.progression == "Oscar’s Grind":
-            self.current_bet = self.next_bet
-            profit = self.bankroll - self.initial_bankroll
-            if won and profit > 0:
-                self.next_bet = self.base_unit
-                self.message = f"Win! Profit achieved, reset to {self.next_bet}"
-            elif won:
-                self.next_bet = self.current_bet + self.base_unit
-                self.message = f"Win! Increase to {self.next_bet}"
-            else:
-                self.next_bet = self.current_bet
-                self.message = f"Loss! Keep bet at {self.next_bet}"
-        elif self.progression == "Labouchere":
-            if self.progression_state is None:
-                # Parse the sequence from labouchere_sequence string
-                try:
-                    sequence = [int(x.strip()) for x in self.labouchere_sequence.split(",")]
-                    if not sequence:
-                        sequence = [1, 2, 3, 4]  # Default sequence
-                except ValueError:
-                    sequence = [1, 2, 3, 4]  # Default sequence on error
-                self.progression_state = sequence
-            self.current_bet = self.next_bet
-            if len(self.progression_state) == 0:
-                self.next_bet = self.base_unit
-                self.progression_state = [1, 2, 3, 4]  # Reset sequence
-                self.message = f"Sequence cleared! Reset to {self.next_bet}"
-            elif len(self.progression_state) == 1:
-                self.next_bet = self.progression_state[0] * self.base_unit
-                if won:
-                    self.progression_state = []
-                    self.message = f"Win! Sequence completed, next bet: {self.next_bet}"
-                else:
-                    self.message = f"Loss! Next bet: {self.next_bet}"
-            else:
-                if won:
-                    # Remove first and last numbers
-                    self.progression_state = self.progression_state[1:-1] if len(self.progression_state) > 2 else []
-                    self.next_bet = (self.progression_state[0] + self.progression_state[-1]) * self.base_unit if self.progression_state else self.base_unit
-                    self.message = f"Win! Sequence: {self.progression_state}, next bet: {self.next_bet}"
-                else:
-                    # Add the lost bet to the end
-                    self.progression_state.append(self.current_bet // self.base_unit)
-                    self.next_bet = (self.progression_state[0] + self.progression_state[-1]) * self.base_unit
-                    self.message = f"Loss! Sequence: {self.progression_state}, next bet: {self.next_bet}"
-        elif self.progression == "Ladder":
-            self.current_bet = self.next_bet
-            if won:
-                self.next_bet = self.current_bet + self.base_unit
-                self.message = f"Win! Increase to {self.next_bet}"
-            else:
-                self.next_bet = self.base_unit
-                self.message = f"Loss! Reset to {self.next_bet}"
-        elif self.progression == "D’Alembert":
-            self.current_bet = self.next_bet
-            if won:
-                self.next_bet = max(self.base_unit, self.current_bet - self.base_unit)
-                self.message = f"Win! Decrease to {self.next_bet}"
-            else:
-                self.next_bet = self.current_bet + self.base_unit
-                self.message = f"Loss! Increase to {self.next_bet}"
-        elif self.progression == "Double After a Win":
-            self.current_bet = self.next_bet
-            if won:
-                self.next_bet = self.current_bet * 2
-                self.message = f"Win! Double to {self.next_bet}"
-            else:
-                self.next_bet = self.base_unit
-                self.message = f"Loss! Reset to {self.next_bet}"
-        elif self.progression == "+1 Win / -1 Loss":
-            self.current_bet = self.next_bet
-            if won:
-                self.next_bet = self.current_bet + self.base_unit
-                self.message = f"Win! Increase to {self.next_bet}"
-            else:
-                self.next_bet = max(self.base_unit, self.current_bet - self.base_unit)
-                self.message = f"Loss! Decrease to {self.next_bet}"
-        elif self.progression == "+2 Win / -1 Loss":
-            self.current_bet = self.next_bet
-            if won:
-                self.next_bet = self.current_bet + (self.base_unit * 2)
-                self.message = f"Win! Increase by 2 units to {self.next_bet}"
-            else:
-                self.next_bet = max(self.base_unit, self.current_bet - self.base_unit)
-                self.message = f"Loss! Decrease to {self.next_bet}"
+        if self.progression_engine is None:
+            self.progression_engine = make_progression(self.progression, self.base_unit, self.labouchere_sequence)
+        profit = self.bankroll - self.initial_bankroll
+        self.current_bet = self.next_bet
+        self.next_bet = self.progression_engine.step(won, self.current_bet, profit)
+        self.message = self.progression_engine.describe(won, self.current_bet, profit, self.next_bet)
         
         # Check stop conditions
-        profit = self.bankroll - self.initial_bankroll
         if profit <= self.stop_loss:
             self.is_stopped = True
             self.status = "Stopped: Stop Loss Reached"
@@ -439,6 +405,52 @@ def render_sides_of_zero_display():
     
     # Prepare numbers with hit counts
     wheel_numbers = [(num, state.scores.get(num, 0)) for num in wheel_order]
+
+    # Outline the hottest contiguous arc of the wheel on the strip
+    hot_sector = state.wheel_sectors.strongest()
+    hot_sector_numbers = set(hot_sector["hot_numbers"]) if hot_sector and hot_sector["hot_hits"] > 0 else set()
+    if hot_sector_numbers:
+        sector_caption = (
+            f'<p class="sector-caption">Hottest Wheel Sector: {hot_sector["hot_numbers"][0]} to {hot_sector["hot_numbers"][-1]} '
+            f'({hot_sector["length"]} numbers, {hot_sector["hot_hits"]} hits, expected {hot_sector["expected"]:.1f})</p>'
+        )
+    else:
+        sector_caption = ""
+
+    # Bias statistics from the running counts (no pass over the spin history)
+    chi_square = state.bias_tests.chi_square()
+    if chi_square:
+        g_test = state.bias_tests.g_test()
+        bias_rows = "".join(
+            f"<tr><td>{label}: {name}</td><td>{hits}</td><td>{expected:.1f}</td><td>{z:+.2f}</td><td>{p:.3f}</td></tr>"
+            for label, name, hits, expected, z, p in state.bias_tests.most_unusual(5)
+        )
+        bias_caption = (
+            '<div class="bias-stats">'
+            f'<p>Uniformity over 37 pockets: chi-square = {chi_square[0]:.1f} (p = {chi_square[1]:.3f}), '
+            f'G = {g_test[0]:.1f} (p = {g_test[1]:.3f})'
+            + ("" if state.bias_tests.reliable() else f" — needs {37 * MIN_EXPECTED} spins to be reliable") + '</p>'
+            '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+            '<tr><th>Most Unusual Sections</th><th>Hits</th><th>Expected</th><th>z</th><th>p</th></tr>'
+            f'{bias_rows}</table>'
+            f'<p>With {len(SECTIONS)} sections tested, about {len(SECTIONS) // 20} p-values under 0.05 are expected by chance.</p>'
+            '</div>'
+        )
+    else:
+        bias_caption = ""
+
+    # Most common wheel offsets between consecutive spins and where they point next
+    signature = state.dealer_signature
+    signature_test = signature.chi_square()
+    if signature_test:
+        offsets = ", ".join(f"{offset:+d} ({hits}x)" for offset, hits in signature.top_offsets())
+        predicted = ", ".join(str(number) for number, _, distance in signature.predicted_sector() if distance == 0)
+        signature_caption = (
+            f'<p class="sector-caption">Dealer Signature: top offsets {offsets} of {signature.total} '
+            f'(p = {signature_test[1]:.3f}); predicted landing: {predicted}</p>'
+        )
+    else:
+        signature_caption = ""
     
     # Generate HTML for the single number list
     def generate_number_list(numbers):
@@ -449,7 +461,7 @@ def render_sides_of_zero_display():
         for num, hits in numbers:
             color = colors.get(str(num), "black")
             badge = f'<span class="hit-badge">{hits}</span>' if hits > 0 else ''
-            class_name = "number-item" + (" zero-number" if num == 0 else "")
+            class_name = "number-item" + (" zero-number" if num == 0 else "") + (" hot-sector" if num in hot_sector_numbers else "")
             number_html.append(
                 f'<span class="{class_name}" style="background-color: {color}; color: white;" data-hits="{hits}" data-number="{num}">{num}{badge}</span>'
             )
@@ -525,6 +537,22 @@ def render_sides_of_zero_display():
             position: relative;
             flex-shrink: 0;
         }}
+        .number-item.hot-sector {{
+            box-shadow: 0 0 0 2px #ffd700;
+        }}
+        .sector-caption {{
+            text-align: center;
+            font-size: 12px;
+            font-weight: bold;
+            margin: 5px 0 0 0;
+        }}
+        .bias-stats {{
+            font-size: 12px;
+            margin: 5px 0 0 0;
+        }}
+        .bias-stats table {{
+            margin: 0 auto;
+        }}
         .number-item.zero-number {{
             width: 60px;
             height: 60px;
@@ -644,6 +672,9 @@ def render_sides_of_zero_display():
             </div>
         </div>
         {number_list}
+        {sector_caption}
+        {signature_caption}
+        {bias_caption}
     </div>
     <script>
         function updateCircularProgress(id, progress) {{
@@ -724,7 +755,9 @@ def validate_spins_input(spins_input):
         print(f"validate_spins_input: Errors - {error_msg}")
         return "", f"<h4>Last Spins</h4><p>{error_msg}</p>"
 
-    # Update state.last_spins and spins_display
+    # The textbox replaces the whole spin list: start the scores and every tracker over,
+    # so update_scores_batch rebuilds them all from valid_spins alone
+    state.reset()
     state.last_spins = valid_spins
     state.selected_numbers = set(int(s) for s in valid_spins)
     action_log = update_scores_batch(valid_spins)
@@ -809,10 +842,39 @@ def clear_spins():
     state.spin_history = []  # Clear spin history as well
     state.side_scores = {"Left Side of Zero": 0, "Right Side of Zero": 0}  # Reset side scores
     state.scores = {n: 0 for n in range(37)}  # Reset straight-up scores
+    state.wheel_sectors.rebuild(state.scores)
+    state.bias_tests.rebuild(state.scores)
+    state.posterior.rebuild(state.scores)
+    state.gaps = GapTracker()
+    state.dealer_signature = DealerSignature()
+    state.strategy_tally = StrategyTally(custom_strategies=state.custom_strategies)
+    state.pattern_trackers.clear()
+    state.casino_window.clear()
+    state.version += 1
     return "", "", "Spins cleared successfully!", "<h4>Last Spins</h4><p>No spins yet.</p>", update_spin_counter(), render_sides_of_zero_display()
 
+# Per-session save files live in the system temp dir so concurrent users never share a file
+SESSION_SAVE_DIR = os.path.join(tempfile.gettempdir(), "roulette_sessions")
+
+def _write_session_file(payload, session_id, compress):
+    """Write serialized session JSON to a temp file, then atomically rename it into place."""
+    os.makedirs(SESSION_SAVE_DIR, exist_ok=True)
+    final_path = os.path.join(SESSION_SAVE_DIR, f"session-{session_id}.json" + (".gz" if compress else ""))
+    if compress:
+        payload = gzip.compress(payload, compresslevel=6)
+    fd, tmp_path = tempfile.mkstemp(dir=SESSION_SAVE_DIR, prefix=".session-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, final_path)  # Atomic on POSIX and Windows
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return final_path
+
 # Function to save the session
-def save_session():
+async def save_session(compress=False, request: gr.Request = None):
     session_data = {
         "spins": state.last_spins,
         "spin_history": state.spin_history,  # Include spin history
@@ -826,11 +888,43 @@ def save_session():
         "split_scores": state.split_scores,
         "side_scores": state.side_scores,
         "casino_data": state.casino_data,
-        "use_casino_winners": state.use_casino_winners
+        "use_casino_winners": state.use_casino_winners,
+        "auto_casino_data": state.auto_casino_data
     }
-    with open("session.json", "w") as f:
-        json.dump(session_data, f)
-    return "session.json"
+    # Serialize on the event loop, where no handler can change the state mid-dump (the
+    # per-spin action dicts included); only compression and disk I/O go to a worker thread
+    payload = json.dumps(session_data, separators=(",", ":")).encode("utf-8")
+    session_id = getattr(request, "session_hash", None) or uuid.uuid4().hex
+    return await asyncio.to_thread(_write_session_file, payload, session_id, bool(compress))
+
+def _write_history_export(spins, session_id, fmt):
+    """Export the annotated history to a temp name, then atomically rename it into place."""
+    os.makedirs(SESSION_SAVE_DIR, exist_ok=True)
+    extension = EXPORT_FORMATS[fmt]
+    final_path = os.path.join(SESSION_SAVE_DIR, f"history-{session_id}{extension}")
+    fd, tmp_path = tempfile.mkstemp(dir=SESSION_SAVE_DIR, prefix=".history-", suffix=extension)
+    os.close(fd)
+    try:
+        export_spin_history(spins, tmp_path, fmt)
+        os.replace(tmp_path, final_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return final_path
+
+# Function to export the annotated spin history for external analysis tools
+async def export_history(fmt, request: gr.Request = None):
+    if not state.last_spins:
+        gr.Warning("No spins to export yet.")
+        return None
+    spins = list(state.last_spins)
+    session_id = getattr(request, "session_hash", None) or uuid.uuid4().hex
+    try:
+        return await asyncio.to_thread(_write_history_export, spins, session_id, fmt)
+    except (ImportError, ValueError) as e:
+        gr.Warning(str(e))
+        return None
 
 # Function to load the session
 def load_session(file, strategy_name, neighbours_count, strong_numbers_count, *checkbox_args):
@@ -838,13 +932,13 @@ def load_session(file, strategy_name, neighbours_count, strong_numbers_count, *c
         if file is None:
             return ("", "", "Please upload a session file to load.", "", "", "", "", "", "", "", "", "", "", "", create_dynamic_table(strategy_name, neighbours_count, strong_numbers_count), "")
 
-        with open(file.name, "r") as f:
-            session_data = json.load(f)
+        session_data = read_session_file(file.name)
 
         # Load state data
         state.last_spins = session_data.get("spins", [])
         state.spin_history = session_data.get("spin_history", [])
-        state.scores = session_data.get("scores", {n: 0 for n in range(37)})
+        # JSON turns the integer number keys into strings
+        state.scores = {int(k): v for k, v in session_data.get("scores", {n: 0 for n in range(37)}).items()}
         state.even_money_scores = session_data.get("even_money_scores", {name: 0 for name in EVEN_MONEY.keys()})
         state.dozen_scores = session_data.get("dozen_scores", {name: 0 for name in DOZENS.keys()})
         state.column_scores = session_data.get("column_scores", {name: 0 for name in COLUMNS.keys()})
@@ -853,6 +947,15 @@ def load_session(file, strategy_name, neighbours_count, strong_numbers_count, *c
         state.six_line_scores = session_data.get("six_line_scores", {name: 0 for name in SIX_LINES.keys()})
         state.split_scores = session_data.get("split_scores", {name: 0 for name in SPLITS.keys()})
         state.side_scores = session_data.get("side_scores", {"Left Side of Zero": 0, "Right Side of Zero": 0})
+        state.wheel_sectors.rebuild(state.scores)
+        state.bias_tests.rebuild(state.scores)
+        state.posterior.rebuild(state.scores)
+        state.gaps.rebuild(state.last_spins)
+        state.dealer_signature.rebuild(state.last_spins)
+        state.strategy_tally.rebuild(state.last_spins)
+        state.pattern_trackers.rebuild(state.last_spins)
+        state.casino_window.rebuild(state.last_spins)
+        state.version += 1
         state.casino_data = session_data.get("casino_data", {
             "spins_count": 100,
             "hot_numbers": {},
@@ -864,6 +967,8 @@ def load_session(file, strategy_name, neighbours_count, strong_numbers_count, *c
             "columns": {"1st Column": 0.0, "2nd Column": 0.0, "3rd Column": 0.0}
         })
         state.use_casino_winners = session_data.get("use_casino_winners", False)
+        state.auto_casino_data = session_data.get("auto_casino_data", False)
+        state.casino_window.resize(state.casino_data.get("spins_count", 100))
 
         new_spins = ", ".join(state.last_spins)
         spin_analysis_output = f"Session loaded successfully with {len(state.last_spins)} spins."
@@ -957,308 +1062,13 @@ def create_strongest_numbers_with_neighbours_table():
     table_html += "</table>"
 
     return f"<h3>Strongest Numbers with Neighbours</h3>{table_html}"
-def highlight_even_money(strategy_name, sorted_sections, top_color, middle_color, lower_color):
-    """Highlight even money bets for relevant strategies."""
-    if sorted_sections is None:
-        return None, None, None, {}
-    trending, second, third = None, None, None
-    number_highlights = {}
-    if strategy_name in ["Best Even Money Bets", "Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Columns + Best Even Money Bets + Top Pick 18 Numbers"]:
-        even_money_hits = [item for item in sorted_sections["even_money"] if item[1] > 0]
-        if even_money_hits:
-            trending = even_money_hits[0][0]
-            second = even_money_hits[1][0] if len(even_money_hits) > 1 else None
-            third = even_money_hits[2][0] if len(even_money_hits) > 2 else None
-    elif strategy_name == "Hot Bet Strategy":
-        trending = sorted_sections["even_money"][0][0] if sorted_sections["even_money"] else None
-        second = sorted_sections["even_money"][1][0] if len(sorted_sections["even_money"]) > 1 else None
-    elif strategy_name == "Cold Bet Strategy":
-        sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1])
-        trending = sorted_even_money[0][0] if sorted_even_money else None
-        second = sorted_even_money[1][0] if len(sorted_even_money) > 1 else None
-    elif strategy_name in ["3-8-6 Rising Martingale", "Fibonacci To Fortune"]:
-        trending = sorted_sections["even_money"][0][0] if sorted_sections["even_money"] else None
-    return trending, second, third, number_highlights
-
-def highlight_dozens(strategy_name, sorted_sections, top_color, middle_color, lower_color):
-    """Highlight dozens for relevant strategies."""
-    if sorted_sections is None:
-        return None, None, {}
-    trending, second = None, None
-    number_highlights = {}
-    if strategy_name in ["Best Dozens", "Best Dozens + Top Pick 18 Numbers", 
-                         "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Dozens + Best Streets"]:
-        dozens_hits = [item for item in sorted_sections["dozens"] if item[1] > 0]
-        if dozens_hits:
-            trending = dozens_hits[0][0]
-            second = dozens_hits[1][0] if len(dozens_hits) > 1 else None
-    elif strategy_name == "Hot Bet Strategy":
-        trending = sorted_sections["dozens"][0][0] if sorted_sections["dozens"] else None
-        second = sorted_sections["dozens"][1][0] if len(sorted_sections["dozens"]) > 1 else None
-    elif strategy_name == "Cold Bet Strategy":
-        sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1])
-        trending = sorted_dozens[0][0] if sorted_dozens else None
-        second = sorted_dozens[1][0] if len(sorted_dozens) > 1 else None
-    elif strategy_name in ["Fibonacci Strategy", "Fibonacci To Fortune"]:
-        best_dozen_score = sorted_sections["dozens"][0][1] if sorted_sections["dozens"] else 0
-        best_column_score = sorted_sections["columns"][0][1] if sorted_sections["columns"] else 0
-        if best_dozen_score >= best_column_score:
-            trending = sorted_sections["dozens"][0][0] if sorted_sections["dozens"] else None
-    elif strategy_name == "1 Dozen +1 Column Strategy":
-        trending = sorted_sections["dozens"][0][0] if sorted_sections["dozens"] and sorted_sections["dozens"][0][1] > 0 else None
-    elif strategy_name == "Romanowksy Missing Dozen":
-        trending = sorted_sections["dozens"][0][0] if sorted_sections["dozens"] and sorted_sections["dozens"][0][1] > 0 else None
-        second = sorted_sections["dozens"][1][0] if len(sorted_sections["dozens"]) > 1 and sorted_sections["dozens"][1][1] > 0 else None
-        weakest_dozen = min(state.dozen_scores.items(), key=lambda x: x[1], default=("1st Dozen", 0))[0]
-        straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-        straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-        weak_numbers = [row["Number"] for _, row in straight_up_df.iterrows() if row["Number"] in DOZENS[weakest_dozen]][:8]
-        for num in weak_numbers:
-            number_highlights[str(num)] = top_color
-    return trending, second, number_highlights
-
-def highlight_columns(strategy_name, sorted_sections, top_color, middle_color, lower_color):
-    """Highlight columns for relevant strategies."""
-    if sorted_sections is None:
-        return None, None, {}
-    trending, second = None, None
-    number_highlights = {}
-    if strategy_name in ["Best Columns", "Best Columns + Top Pick 18 Numbers", 
-                         "Best Columns + Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Columns + Best Streets"]:
-        columns_hits = [item for item in sorted_sections["columns"] if item[1] > 0]
-        if columns_hits:
-            trending = columns_hits[0][0]
-            second = columns_hits[1][0] if len(columns_hits) > 1 else None
-    elif strategy_name == "Hot Bet Strategy":
-        trending = sorted_sections["columns"][0][0] if sorted_sections["columns"] else None
-        second = sorted_sections["columns"][1][0] if len(sorted_sections["columns"]) > 1 else None
-    elif strategy_name == "Cold Bet Strategy":
-        sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1])
-        trending = sorted_columns[0][0] if sorted_columns else None
-        second = sorted_columns[1][0] if len(sorted_columns) > 1 else None
-    elif strategy_name == "Fibonacci Strategy":
-        best_dozen_score = sorted_sections["dozens"][0][1] if sorted_sections["dozens"] else 0
-        best_column_score = sorted_sections["columns"][0][1] if sorted_sections["columns"] else 0
-        if best_column_score > best_dozen_score:
-            trending = sorted_sections["columns"][0][0] if sorted_sections["columns"] else None
-    elif strategy_name == "1 Dozen +1 Column Strategy":
-        trending = sorted_sections["columns"][0][0] if sorted_sections["columns"] and sorted_sections["columns"][0][1] > 0 else None
-    return trending, second, number_highlights
-
-def highlight_numbers(strategy_name, sorted_sections, top_color, middle_color, lower_color):
-    """Highlight straight-up numbers for relevant strategies."""
-    if sorted_sections is None:
-        return {}
-    number_highlights = {}
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-    
-    if strategy_name in ["Top Pick 18 Numbers without Neighbours", 
-                         "Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Dozens + Top Pick 18 Numbers", 
-                         "Best Columns + Top Pick 18 Numbers", 
-                         "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", 
-                         "Best Columns + Best Even Money Bets + Top Pick 18 Numbers"]:
-        if len(straight_up_df) >= 18:
-            top_18_numbers = straight_up_df["Number"].head(18).tolist()
-            for i, num in enumerate(top_18_numbers):
-                color = top_color if i < 6 else (middle_color if i < 12 else lower_color)
-                number_highlights[str(num)] = color
-    elif strategy_name == "Top Numbers with Neighbours (Tiered)":
-        num_to_take = min(8, len(straight_up_df))
-        top_numbers = set(straight_up_df["Number"].head(num_to_take).tolist())
-        number_groups = []
-        for num in top_numbers:
-            left, right = current_neighbors.get(num, (None, None))
-            group = [num]
-            if left is not None:
-                group.append(left)
-            if right is not None:
-                group.append(right)
-            number_groups.append((state.scores[num], group))
-        number_groups.sort(key=lambda x: x[0], reverse=True)
-        ordered_numbers = []
-        for _, group in number_groups:
-            ordered_numbers.extend(group)
-        ordered_numbers = ordered_numbers[:24]
-        for i, num in enumerate(ordered_numbers):
-            color = top_color if i < 8 else (middle_color if i < 16 else lower_color)
-            number_highlights[str(num)] = color
-    return number_highlights
-
-def highlight_other_bets(strategy_name, sorted_sections, top_color, middle_color, lower_color):
-    """Highlight streets, corners, splits, and double streets for relevant strategies."""
-    if sorted_sections is None:
-        return {}
-    number_highlights = {}
-    
-    if strategy_name == "Hot Bet Strategy":
-        for i, (street_name, _) in enumerate(sorted_sections["streets"][:9]):
-            numbers = STREETS[street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-        for i, (corner_name, _) in enumerate(sorted_sections["corners"][:9]):
-            numbers = CORNERS[corner_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-        for i, (split_name, _) in enumerate(sorted_sections["splits"][:9]):
-            numbers = SPLITS[split_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Cold Bet Strategy":
-        sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1])
-        sorted_corners = sorted(state.corner_scores.items(), key=lambda x: x[1])
-        sorted_splits = sorted(state.split_scores.items(), key=lambda x: x[1])
-        for i, (street_name, _) in enumerate(sorted_streets[:9]):
-            numbers = STREETS[street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-        for i, (corner_name, _) in enumerate(sorted_corners[:9]):
-            numbers = CORNERS[corner_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-        for i, (split_name, _) in enumerate(sorted_splits[:9]):
-            numbers = SPLITS[split_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Best Streets":
-        for i, (street_name, _) in enumerate(sorted_sections["streets"][:9]):
-            numbers = STREETS[street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name in ["Best Dozens + Best Streets", "Best Columns + Best Streets"]:
-        for i, (street_name, _) in enumerate(sorted_sections["streets"][:9]):
-            numbers = STREETS[street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Best Double Streets":
-        for i, (six_line_name, _) in enumerate(sorted_sections["six_lines"][:9]):
-            numbers = SIX_LINES[six_line_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Best Corners":
-        for i, (corner_name, _) in enumerate(sorted_sections["corners"][:9]):
-            numbers = CORNERS[corner_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Best Splits":
-        for i, (split_name, _) in enumerate(sorted_sections["splits"][:9]):
-            numbers = SPLITS[split_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Non-Overlapping Double Street Strategy":
-        non_overlapping_sets = [
-            ["1ST D.STREET – 1, 4", "3RD D.STREET – 7, 10", "5TH D.STREET – 13, 16", "7TH D.STREET – 19, 22", "9TH D.STREET – 25, 28"],
-            ["2ND D.STREET – 4, 7", "4TH D.STREET – 10, 13", "6TH D.STREET – 16, 19", "8TH D.STREET – 22, 25", "10TH D.STREET – 28, 31"]
-        ]
-        set_scores = []
-        for idx, non_overlapping_set in enumerate(non_overlapping_sets):
-            total_score = sum(state.six_line_scores.get(name, 0) for name in non_overlapping_set)
-            set_scores.append((idx, total_score, non_overlapping_set))
-        best_set = max(set_scores, key=lambda x: x[1], default=(0, 0, non_overlapping_sets[0]))
-        sorted_best_set = sorted(best_set[2], key=lambda name: state.six_line_scores.get(name, 0), reverse=True)[:9]
-        for i, double_street_name in enumerate(sorted_best_set):
-            numbers = SIX_LINES[double_street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Non-Overlapping Corner Strategy":
-        sorted_corners = sorted(state.corner_scores.items(), key=lambda x: x[1], reverse=True)
-        selected_corners = []
-        selected_numbers = set()
-        for corner_name, _ in sorted_corners:
-            if len(selected_corners) >= 9:
-                break
-            corner_numbers = set(CORNERS[corner_name])
-            if not corner_numbers & selected_numbers:
-                selected_corners.append(corner_name)
-                selected_numbers.update(corner_numbers)
-        for i, corner_name in enumerate(selected_corners):
-            numbers = CORNERS[corner_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "3-8-6 Rising Martingale":
-        top_streets = sorted_sections["streets"][:8]
-        for i, (street_name, _) in enumerate(top_streets):
-            numbers = STREETS[street_name]
-            color = top_color if i < 3 else (middle_color if 3 <= i < 6 else lower_color)
-            for num in numbers:
-                number_highlights[str(num)] = color
-    elif strategy_name == "Fibonacci To Fortune":
-        weakest_dozen = min(state.dozen_scores.items(), key=lambda x: x[1], default=("1st Dozen", 0))[0]
-        double_streets_in_weakest = [(name, state.six_line_scores.get(name, 0)) for name, numbers in SIX_LINES.items() if set(numbers).issubset(DOZENS[weakest_dozen])]
-        if double_streets_in_weakest:
-            top_double_street = max(double_streets_in_weakest, key=lambda x: x[1])[0]
-            for num in SIX_LINES[top_double_street]:
-                number_highlights[str(num)] = top_color
-    return number_highlights
-
-def highlight_neighbors(strategy_name, sorted_sections, neighbours_count, strong_numbers_count, top_color, middle_color):
-    """Highlight neighbors for the Neighbours of Strong Number strategy."""
-    if sorted_sections is None:
-        return {}
-    number_highlights = {}
-    if strategy_name == "Neighbours of Strong Number":
-        sorted_numbers = sorted(state.scores.items(), key=lambda x: (-x[1], x[0]))
-        numbers_hits = [item for item in sorted_numbers if item[1] > 0]
-        if numbers_hits:
-            strong_numbers_count = min(strong_numbers_count, len(numbers_hits))
-            top_numbers = set(item[0] for item in numbers_hits[:strong_numbers_count])
-            neighbors_set = set()
-            for strong_number in top_numbers:
-                current_number = strong_number
-                for _ in range(neighbours_count):
-                    left, _ = current_neighbors.get(current_number, (None, None))
-                    if left is not None:
-                        neighbors_set.add(left)
-                        current_number = left
-                    else:
-                        break
-                current_number = strong_number
-                for _ in range(neighbours_count):
-                    _, right = current_neighbors.get(current_number, (None, None))
-                    if right is not None:
-                        neighbors_set.add(right)
-                        current_number = right
-                    else:
-                        break
-            neighbors_set = neighbors_set - top_numbers
-            for num in top_numbers:
-                number_highlights[str(num)] = top_color
-            for num in neighbors_set:
-                number_highlights[str(num)] = middle_color
-    return number_highlights
 # Function to create the dynamic roulette table with highlighted trending sections
 def calculate_trending_sections():
     """Calculate trending sections based on current scores."""
     if not any(state.scores.values()) and not any(state.even_money_scores.values()):
         return None  # Indicates no data to process
 
-    return {
-        "even_money": sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True),
-        "dozens": sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True),
-        "columns": sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True),
-        "streets": sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True),
-        "six_lines": sorted(state.six_line_scores.items(), key=lambda x: x[1], reverse=True),
-        "corners": sorted(state.corner_scores.items(), key=lambda x: x[1], reverse=True),
-        "splits": sorted(state.split_scores.items(), key=lambda x: x[1], reverse=True)
-    }
+    return get_rankings(state)
 
 def apply_strategy_highlights(strategy_name, neighbours_count, strong_numbers_count, sorted_sections, top_color=None, middle_color=None, lower_color=None):
     """Apply highlights based on the selected strategy with custom colors."""
@@ -1281,36 +1091,31 @@ def apply_strategy_highlights(strategy_name, neighbours_count, strong_numbers_co
     trending_column, second_column = None, None
     number_highlights = {}
 
-    # Apply highlights based onShannon (state, strategy_name)
+    # Highlights come straight from the strategy's tiered bets (later bets override earlier ones)
     if strategy_name and strategy_name in STRATEGIES:
-        strategy_info = STRATEGIES[strategy_name]
-        if strategy_name == "Neighbours of Strong Number":
-            strategy_output = strategy_info["function"](neighbours_count, strong_numbers_count)
-        else:
-            strategy_output = strategy_info["function"]()
-        
-        # Delegate to helper functions
-        em_trending, em_second, em_third, em_highlights = highlight_even_money(strategy_name, sorted_sections, top_color, middle_color, lower_color)
-        dz_trending, dz_second, dz_highlights = highlight_dozens(strategy_name, sorted_sections, top_color, middle_color, lower_color)
-        col_trending, col_second, col_highlights = highlight_columns(strategy_name, sorted_sections, top_color, middle_color, lower_color)
-        num_highlights = highlight_numbers(strategy_name, sorted_sections, top_color, middle_color, lower_color)
-        other_highlights = highlight_other_bets(strategy_name, sorted_sections, top_color, middle_color, lower_color)
-        neighbor_highlights = highlight_neighbors(strategy_name, sorted_sections, neighbours_count, strong_numbers_count, top_color, middle_color)
-
-        # Combine highlights
-        trending_even_money = em_trending
-        second_even_money = em_second
-        third_even_money = em_third
-        trending_dozen = dz_trending
-        second_dozen = dz_second
-        trending_column = col_trending
-        second_column = col_second
-        number_highlights.update(em_highlights)
-        number_highlights.update(dz_highlights)
-        number_highlights.update(col_highlights)
-        number_highlights.update(num_highlights)
-        number_highlights.update(other_highlights)
-        number_highlights.update(neighbor_highlights)
+        result = evaluate_strategy(state, strategy_name, neighbours_count, strong_numbers_count)
+        tier_colors = [top_color, middle_color, lower_color]
+        for kind, name, _, tier in result.bets:
+            if kind == "even_money":
+                if tier == 0:
+                    trending_even_money = name
+                elif tier == 1:
+                    second_even_money = name
+                else:
+                    third_even_money = name
+            elif kind == "dozen":
+                if tier == 0:
+                    trending_dozen = name
+                else:
+                    second_dozen = name
+            elif kind == "column":
+                if tier == 0:
+                    trending_column = name
+                else:
+                    second_column = name
+            else:
+                for num in bet_numbers(kind, name):
+                    number_highlights[str(num)] = tier_colors[tier]
 
     # Dozen Tracker Logic (When No Strategy is Selected)
     if strategy_name == "None":
@@ -1444,11 +1249,58 @@ def render_dynamic_table_html(trending_even_money, second_even_money, third_even
     html += "</table>"
     return html
 
-def update_casino_data(spins_count, even_percent, odd_percent, red_percent, black_percent, low_percent, high_percent, dozen1_percent, dozen2_percent, dozen3_percent, col1_percent, col2_percent, col3_percent, use_winners):
-    """Parse casino data inputs, update state, and generate HTML output."""
+def render_casino_data(use_winners):
+    """HTML summary of state.casino_data, bolding the winner of each category."""
+    spins_count = state.casino_data["spins_count"]
+    has_data = {key: any(state.casino_data[key].values()) for key in ("even_odd", "red_black", "low_high", "dozens", "columns")}
+
+    # Check for empty data when highlighting is enabled
+    if use_winners and not any(has_data.values()):
+        if state.auto_casino_data:
+            return "<p>Waiting for spins: casino data will fill in from the session as spins are entered.</p>"
+        gr.Warning("Highlight Casino Winners is enabled, but no casino data is provided. Enter percentages to see highlights.")
+        return "<p>Warning: No casino data provided for highlighting. Please enter percentages for Even/Odd, Red/Black, Low/High, Dozens, or Columns.</p>"
+
+    # Generate HTML Output
+    if state.auto_casino_data:
+        output = f"<h4>Casino Data Insights (Last {state.casino_window.window} of {spins_count} Spins, from this session):</h4>"
+    else:
+        output = f"<h4>Casino Data Insights (Last {spins_count} Spins):</h4>"
+    for key, name in [
+        ("even_odd", "Even vs Odd"),
+        ("red_black", "Red vs Black"),
+        ("low_high", "Low vs High"),
+        ("dozens", "Dozens"),
+        ("columns", "Columns")
+    ]:
+        if has_data[key]:
+            winner = max(state.casino_data[key], key=state.casino_data[key].get)
+            output += f"<p>{name}: " + " vs ".join(
+                f"<b>{v:.1f}%</b>" if k == winner else f"{v:.1f}%" for k, v in state.casino_data[key].items()
+            ) + f" (Winner: {winner})</p>"
+        else:
+            output += f"<p>{name}: Not set</p>"
+    for key, name in [("hot_numbers", "Hot Numbers"), ("cold_numbers", "Cold Numbers")]:
+        if state.casino_data[key]:
+            output += f"<p>{name}: " + ", ".join(f"{number} ({v:.1f}%)" for number, v in state.casino_data[key].items()) + "</p>"
+    return output
+
+def refresh_casino_data():
+    """Refill casino_data from the last spins_count session spins when auto-fill is on."""
+    if state.auto_casino_data:
+        state.casino_data = state.casino_window.casino_data()
+
+def update_casino_data(spins_count, even_percent, odd_percent, red_percent, black_percent, low_percent, high_percent, dozen1_percent, dozen2_percent, dozen3_percent, col1_percent, col2_percent, col3_percent, use_winners, auto_fill=False):
+    """Parse casino data inputs (or derive them from the session's spins), update state, and generate HTML output."""
     try:
         state.casino_data["spins_count"] = int(spins_count)
         state.use_casino_winners = use_winners
+        state.auto_casino_data = bool(auto_fill)
+        state.casino_window.resize(int(spins_count))
+
+        if state.auto_casino_data:
+            refresh_casino_data()
+            return render_casino_data(use_winners)
 
         # Remove Hot/Cold Numbers parsing
         state.casino_data["hot_numbers"] = {}
@@ -1465,66 +1317,30 @@ def update_casino_data(spins_count, even_percent, odd_percent, red_percent, blac
         even_val = parse_percent(even_percent, "Even vs Odd", "Even")
         odd_val = parse_percent(odd_percent, "Even vs Odd", "Odd")
         state.casino_data["even_odd"] = {"Even": even_val, "Odd": odd_val}
-        has_even_odd = even_val > 0 or odd_val > 0
 
         # Red/Black
         red_val = parse_percent(red_percent, "Red vs Black", "Red")
         black_val = parse_percent(black_percent, "Red vs Black", "Black")
         state.casino_data["red_black"] = {"Red": red_val, "Black": black_val}
-        has_red_black = red_val > 0 or black_val > 0
 
         # Low/High
         low_val = parse_percent(low_percent, "Low vs High", "Low")
         high_val = parse_percent(high_percent, "Low vs High", "High")
         state.casino_data["low_high"] = {"Low": low_val, "High": high_val}
-        has_low_high = low_val > 0 or high_val > 0
 
         # Dozens
         d1_val = parse_percent(dozen1_percent, "Dozens", "1st Dozen")
         d2_val = parse_percent(dozen2_percent, "Dozens", "2nd Dozen")
         d3_val = parse_percent(dozen3_percent, "Dozens", "3rd Dozen")
         state.casino_data["dozens"] = {"1st Dozen": d1_val, "2nd Dozen": d2_val, "3rd Dozen": d3_val}
-        has_dozens = d1_val > 0 or d2_val > 0 or d3_val > 0
 
         # Columns
         c1_val = parse_percent(col1_percent, "Columns", "1st Column")
         c2_val = parse_percent(col2_percent, "Columns", "2nd Column")
         c3_val = parse_percent(col3_percent, "Columns", "3rd Column")
         state.casino_data["columns"] = {"1st Column": c1_val, "2nd Column": c2_val, "3rd Column": c3_val}
-        has_columns = c1_val > 0 or c2_val > 0 or c3_val > 0
 
-        # Check for empty data when highlighting is enabled
-        if use_winners and not any([has_even_odd, has_red_black, has_low_high, has_dozens, has_columns]):
-            gr.Warning("Highlight Casino Winners is enabled, but no casino data is provided. Enter percentages to see highlights.")
-            return "<p>Warning: No casino data provided for highlighting. Please enter percentages for Even/Odd, Red/Black, Low/High, Dozens, or Columns.</p>"
-
-        # Generate HTML Output
-        output = f"<h4>Casino Data Insights (Last {spins_count} Spins):</h4>"
-        for key, name, has_data in [
-            ("even_odd", "Even vs Odd", has_even_odd),
-            ("red_black", "Red vs Black", has_red_black),
-            ("low_high", "Low vs High", has_low_high)
-        ]:
-            if has_data:
-                winner = max(state.casino_data[key], key=state.casino_data[key].get)
-                output += f"<p>{name}: " + " vs ".join(
-                    f"<b>{v:.1f}%</b>" if k == winner else f"{v:.1f}%" for k, v in state.casino_data[key].items()
-                ) + f" (Winner: {winner})</p>"
-            else:
-                output += f"<p>{name}: Not set</p>"
-        for key, name, has_data in [
-            ("dozens", "Dozens", has_dozens),
-            ("columns", "Columns", has_columns)
-        ]:
-            if has_data:
-                winner = max(state.casino_data[key], key=state.casino_data[key].get)
-                output += f"<p>{name}: " + " vs ".join(
-                    f"<b>{v:.1f}%</b>" if k == winner else f"{v:.1f}%" for k, v in state.casino_data[key].items()
-                ) + f" (Winner: {winner})</p>"
-            else:
-                output += f"<p>{name}: Not set</p>"
-        print(f"Generated HTML Output: {output}")
-        return output
+        return render_casino_data(use_winners)
     except ValueError as e:
         return f"<p>Error: {str(e)}</p>"
     except Exception as e:
@@ -1543,6 +1359,7 @@ def reset_casino_data():
         "columns": {"1st Column": 0.0, "2nd Column": 0.0, "3rd Column": 0.0}
     }
     state.use_casino_winners = False
+    state.auto_casino_data = False
     return (
         "100",  # spins_count_dropdown
         "",     # hot_numbers_input
@@ -1558,6 +1375,7 @@ def reset_casino_data():
 
 def create_dynamic_table(strategy_name=None, neighbours_count=2, strong_numbers_count=1, dozen_tracker_spins=5, top_color=None, middle_color=None, lower_color=None):
     print(f"create_dynamic_table called with strategy: {strategy_name}, neighbours_count: {neighbours_count}, strong_numbers_count: {strong_numbers_count}, dozen_tracker_spins: {dozen_tracker_spins}, top_color: {top_color}, middle_color: {middle_color}, lower_color: {lower_color}")
+    refresh_casino_data()
     print(f"Using casino winners: {state.use_casino_winners}, Hot Numbers: {state.casino_data['hot_numbers']}, Cold Numbers: {state.casino_data['cold_numbers']}")
     sorted_sections = calculate_trending_sections()
     
@@ -1794,8 +1612,18 @@ def undo_last_spin(current_spins_display, undo_count, strategy_name, neighbours_
                     score_dict[key] -= value
                     if score_dict[key] < 0:  # Prevent negative scores
                         score_dict[key] = 0
+            if "scores" in action["increments"]:
+                state.wheel_sectors.pop(spin_value)
+                state.bias_tests.pop(spin_value)
+                state.posterior.pop(spin_value)
+                state.gaps.pop()
+                state.dealer_signature.pop()
+                state.strategy_tally.pop()
+                state.pattern_trackers.pop()
+                state.casino_window.pop()
 
             state.last_spins.pop()  # Remove from last_spins too
+            state.version += 1
 
         spins_input = ", ".join(state.last_spins) if state.last_spins else ""
         spin_analysis_output = f"Undo successful: Removed {undo_count} spin(s) - {', '.join(undone_spins)}"
@@ -1884,1139 +1712,6 @@ def generate_random_spins(num_spins, current_spins_display, last_spin_count):
         print(f"generate_random_spins: Unexpected error: {str(e)}")
         return current_spins_display, current_spins_display, f"Error generating spins: {str(e)}", update_spin_counter(), render_sides_of_zero_display()
 
-# Strategy functions
-def best_even_money_bets():
-    recommendations = []
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    
-    if not even_money_hits:
-        recommendations.append("Best Even Money Bets: No hits yet.")
-        return "\n".join(recommendations)
-
-    # Collect the top 3 bets, including ties
-    top_bets = []
-    scores_seen = set()
-    for name, score in sorted_even_money:
-        if len(top_bets) < 3 or score in scores_seen:
-            top_bets.append((name, score))
-            scores_seen.add(score)
-        else:
-            break
-
-    # Display the top 3 bets
-    recommendations.append("Best Even Money Bets (Top 3):")
-    for i, (name, score) in enumerate(top_bets[:3], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    # Check for ties among the top 3 positions
-    if len(top_bets) > 1:
-        # Check for ties at the 1st position
-        first_score = top_bets[0][1]
-        tied_first = [name for name, score in top_bets if score == first_score]
-        if len(tied_first) > 1:
-            recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-        # Check for ties at the 2nd position
-        if len(top_bets) > 1:
-            second_score = top_bets[1][1]
-            tied_second = [name for name, score in top_bets if score == second_score]
-            if len(tied_second) > 1:
-                recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-
-        # Check for ties at the 3rd position
-        if len(top_bets) > 2:
-            third_score = top_bets[2][1]
-            tied_third = [name for name, score in top_bets if score == third_score]
-            if len(tied_third) > 1:
-                recommendations.append(f"Note: Tie for 3rd place among {', '.join(tied_third)} with score {third_score}")
-
-    return "\n".join(recommendations)
-
-def hot_bet_strategy():
-    recommendations = []
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    if even_money_hits:
-        recommendations.append("Even Money (Top 2):")
-        for i, (name, score) in enumerate(even_money_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("Even Money: No hits yet.")
-
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_hits:
-        recommendations.append("\nDozens (Top 2):")
-        for i, (name, score) in enumerate(dozens_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nDozens: No hits yet.")
-
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_hits:
-        recommendations.append("\nColumns (Top 2):")
-        for i, (name, score) in enumerate(columns_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nColumns: No hits yet.")
-
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True)
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-    if streets_hits:
-        recommendations.append("\nStreets (Ranked):")
-        for i, (name, score) in enumerate(streets_hits, 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nStreets: No hits yet.")
-
-    sorted_corners = sorted(state.corner_scores.items(), key=lambda x: x[1], reverse=True)
-    corners_hits = [item for item in sorted_corners if item[1] > 0]
-    if corners_hits:
-        recommendations.append("\nCorners (Ranked):")
-        for i, (name, score) in enumerate(corners_hits, 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nCorners: No hits yet.")
-
-    sorted_six_lines = sorted(state.six_line_scores.items(), key=lambda x: x[1], reverse=True)
-    six_lines_hits = [item for item in sorted_six_lines if item[1] > 0]
-    if six_lines_hits:
-        recommendations.append("\nDouble Streets (Ranked):")
-        for i, (name, score) in enumerate(six_lines_hits, 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nDouble Streets: No hits yet.")
-
-    sorted_splits = sorted(state.split_scores.items(), key=lambda x: x[1], reverse=True)
-    splits_hits = [item for item in sorted_splits if item[1] > 0]
-    if splits_hits:
-        recommendations.append("\nSplits (Ranked):")
-        for i, (name, score) in enumerate(splits_hits, 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nSplits: No hits yet.")
-
-    sorted_sides = sorted(state.side_scores.items(), key=lambda x: x[1], reverse=True)
-    sides_hits = [item for item in sorted_sides if item[1] > 0]
-    if sides_hits:
-        recommendations.append("\nSides of Zero:")
-        recommendations.append(f"1. {sides_hits[0][0]}: {sides_hits[0][1]}")
-    else:
-        recommendations.append("\nSides of Zero: No hits yet.")
-
-    sorted_numbers = sorted(state.scores.items(), key=lambda x: x[1], reverse=True)
-    numbers_hits = [item for item in sorted_numbers if item[1] > 0]
-    if numbers_hits:
-        number_best = numbers_hits[0]
-        left_neighbor, right_neighbor = current_neighbors[number_best[0]]
-        recommendations.append(f"\nStrongest Number: {number_best[0]} (Score: {number_best[1]}) with neighbors {left_neighbor} and {right_neighbor}")
-    else:
-        recommendations.append("\nStrongest Number: No hits yet.")
-
-    return "\n".join(recommendations)
-
-# Function for Cold Bet Strategy
-def cold_bet_strategy():
-    recommendations = []
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1])
-    even_money_non_hits = [item for item in sorted_even_money if item[1] == 0]
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    if even_money_non_hits:
-        recommendations.append("Even Money (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in even_money_non_hits))
-    if even_money_hits:
-        recommendations.append("\nEven Money (Lowest Scores):")
-        for i, (name, score) in enumerate(even_money_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1])
-    dozens_non_hits = [item for item in sorted_dozens if item[1] == 0]
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_non_hits:
-        recommendations.append("\nDozens (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in dozens_non_hits))
-    if dozens_hits:
-        recommendations.append("\nDozens (Lowest Scores):")
-        for i, (name, score) in enumerate(dozens_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1])
-    columns_non_hits = [item for item in sorted_columns if item[1] == 0]
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_non_hits:
-        recommendations.append("\nColumns (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in columns_non_hits))
-    if columns_hits:
-        recommendations.append("\nColumns (Lowest Scores):")
-        for i, (name, score) in enumerate(columns_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1])
-    streets_non_hits = [item for item in sorted_streets if item[1] == 0]
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-    if streets_non_hits:
-        recommendations.append("\nStreets (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in streets_non_hits))
-    if streets_hits:
-        recommendations.append("\nStreets (Lowest Scores):")
-        for i, (name, score) in enumerate(streets_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_corners = sorted(state.corner_scores.items(), key=lambda x: x[1])
-    corners_non_hits = [item for item in sorted_corners if item[1] == 0]
-    corners_hits = [item for item in sorted_corners if item[1] > 0]
-    if corners_non_hits:
-        recommendations.append("\nCorners (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in corners_non_hits))
-    if corners_hits:
-        recommendations.append("\nCorners (Lowest Scores):")
-        for i, (name, score) in enumerate(corners_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_six_lines = sorted(state.six_line_scores.items(), key=lambda x: x[1])
-    six_lines_non_hits = [item for item in sorted_six_lines if item[1] == 0]
-    six_lines_hits = [item for item in sorted_six_lines if item[1] > 0]
-    if six_lines_non_hits:
-        recommendations.append("\nDouble Streets (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in six_lines_non_hits))
-    if six_lines_hits:
-        recommendations.append("\nDouble Streets (Lowest Scores):")
-        for i, (name, score) in enumerate(six_lines_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_splits = sorted(state.split_scores.items(), key=lambda x: x[1])
-    splits_non_hits = [item for item in sorted_splits if item[1] == 0]
-    splits_hits = [item for item in sorted_splits if item[1] > 0]
-    if splits_non_hits:
-        recommendations.append("\nSplits (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in splits_non_hits))
-    if splits_hits:
-        recommendations.append("\nSplits (Lowest Scores):")
-        for i, (name, score) in enumerate(splits_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-    sorted_sides = sorted(state.side_scores.items(), key=lambda x: x[1])
-    sides_non_hits = [item for item in sorted_sides if item[1] == 0]
-    sides_hits = [item for item in sorted_sides if item[1] > 0]
-    if sides_non_hits:
-        recommendations.append("\nSides of Zero (Not Hit):")
-        recommendations.append(", ".join(item[0] for item in sides_non_hits))
-    if sides_hits:
-        recommendations.append("\nSides of Zero (Lowest Score):")
-        recommendations.append(f"1. {sides_hits[0][0]}: {sides_hits[0][1]}")
-
-    sorted_numbers = sorted(state.scores.items(), key=lambda x: x[1])
-    numbers_non_hits = [item for item in sorted_numbers if item[1] == 0]
-    numbers_hits = [item for item in sorted_numbers if item[1] > 0]
-    if numbers_non_hits:
-        recommendations.append("\nNumbers (Not Hit):")
-        recommendations.append(", ".join(str(item[0]) for item in numbers_non_hits))
-    if numbers_hits:
-        number_worst = numbers_hits[0]
-        left_neighbor, right_neighbor = current_neighbors[number_worst[0]]
-        recommendations.append(f"\nColdest Number: {number_worst[0]} (Score: {number_worst[1]}) with neighbors {left_neighbor} and {right_neighbor}")
-
-    return "\n".join(recommendations)
-
-def best_dozens():
-    recommendations = []
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_hits:
-        recommendations.append("Best Dozens (Top 2):")
-        for i, (name, score) in enumerate(dozens_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("Best Dozens: No hits yet.")
-    return "\n".join(recommendations)
-
-def best_columns():
-    recommendations = []
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_hits:
-        recommendations.append("Best Columns (Top 2):")
-        for i, (name, score) in enumerate(columns_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("Best Columns: No hits yet.")
-    return "\n".join(recommendations)
-
-def fibonacci_strategy():
-    recommendations = []
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-
-    if not dozens_hits and not columns_hits:
-        recommendations.append("Fibonacci Strategy: No hits in Dozens or Columns yet.")
-        return "\n".join(recommendations)
-
-    best_dozen_score = dozens_hits[0][1] if dozens_hits else 0
-    best_column_score = columns_hits[0][1] if columns_hits else 0
-
-    if best_dozen_score > best_column_score:
-        recommendations.append("Best Category: Dozens")
-        recommendations.append(f"Best Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
-    elif best_column_score > best_dozen_score:
-        recommendations.append("Best Category: Columns")
-        recommendations.append(f"Best Column: {columns_hits[0][0]} (Score: {columns_hits[0][1]})")
-    else:
-        recommendations.append(f"Best Category (Tied): Dozens and Columns (Score: {best_dozen_score})")
-        if dozens_hits:
-            recommendations.append(f"Best Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
-        if columns_hits:
-            recommendations.append(f"Best Column: {columns_hits[0][0]} (Score: {columns_hits[0][1]})")
-
-    return "\n".join(recommendations)
-
-def best_streets():
-    recommendations = []
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True)
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-
-    if not streets_hits:
-        recommendations.append("Best Streets: No hits yet.")
-        return "\n".join(recommendations)
-
-    recommendations.append("Top 3 Streets:")
-    for i, (name, score) in enumerate(streets_hits[:3], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    recommendations.append("\nTop 6 Streets:")
-    for i, (name, score) in enumerate(streets_hits[:6], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def best_double_streets():
-    recommendations = []
-    sorted_six_lines = sorted(state.six_line_scores.items(), key=lambda x: x[1], reverse=True)
-    six_lines_hits = [item for item in sorted_six_lines if item[1] > 0]
-
-    if not six_lines_hits:
-        recommendations.append("Best Double Streets: No hits yet.")
-        return "\n".join(recommendations)
-
-    recommendations.append("Double Streets (Ranked):")
-    for i, (name, score) in enumerate(six_lines_hits, 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def best_corners():
-    recommendations = []
-    sorted_corners = sorted(state.corner_scores.items(), key=lambda x: x[1], reverse=True)
-    corners_hits = [item for item in sorted_corners if item[1] > 0]
-
-    if not corners_hits:
-        recommendations.append("Best Corners: No hits yet.")
-        return "\n".join(recommendations)
-
-    recommendations.append("Corners (Ranked):")
-    for i, (name, score) in enumerate(corners_hits, 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def best_splits():
-    recommendations = []
-    sorted_splits = sorted(state.split_scores.items(), key=lambda x: x[1], reverse=True)
-    splits_hits = [item for item in sorted_splits if item[1] > 0]
-
-    if not splits_hits:
-        recommendations.append("Best Splits: No hits yet.")
-        return "\n".join(recommendations)
-
-    recommendations.append("Splits (Ranked):")
-    for i, (name, score) in enumerate(splits_hits, 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def best_dozens_and_streets():
-    recommendations = []
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_hits:
-        recommendations.append("Best Dozens (Top 2):")
-        for i, (name, score) in enumerate(dozens_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("Best Dozens: No hits yet.")
-
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True)
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-    if streets_hits:
-        recommendations.append("\nTop 3 Streets (Yellow):")
-        for i, (name, score) in enumerate(streets_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-        recommendations.append("\nMiddle 3 Streets (Cyan):")
-        for i, (name, score) in enumerate(streets_hits[3:6], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-        recommendations.append("\nBottom 3 Streets (Green):")
-        for i, (name, score) in enumerate(streets_hits[6:9], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nBest Streets: No hits yet.")
-
-    return "\n".join(recommendations)
-
-def best_columns_and_streets():
-    recommendations = []
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_hits:
-        recommendations.append("Best Columns (Top 2):")
-        for i, (name, score) in enumerate(columns_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("Best Columns: No hits yet.")
-
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True)
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-    if streets_hits:
-        recommendations.append("\nTop 3 Streets (Yellow):")
-        for i, (name, score) in enumerate(streets_hits[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-        recommendations.append("\nMiddle 3 Streets (Cyan):")
-        for i, (name, score) in enumerate(streets_hits[3:6], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-        recommendations.append("\nBottom 3 Streets (Green):")
-        for i, (name, score) in enumerate(streets_hits[6:9], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nBest Streets: No hits yet.")
-
-    return "\n".join(recommendations)
-
-def non_overlapping_double_street_strategy():
-    non_overlapping_sets = [
-        ["1ST D.STREET – 1, 4", "3RD D.STREET – 7, 10", "5TH D.STREET – 13, 16", "7TH D.STREET – 19, 22", "9TH D.STREET – 25, 28"],
-        ["2ND D.STREET – 4, 7", "4TH D.STREET – 10, 13", "6TH D.STREET – 16, 19", "8TH D.STREET – 22, 25", "10TH D.STREET – 28, 31"]
-    ]
-
-    set_scores = []
-    for idx, non_overlapping_set in enumerate(non_overlapping_sets):
-        total_score = sum(state.six_line_scores[name] for name in non_overlapping_set)
-        set_scores.append((idx, total_score, non_overlapping_set))
-
-    best_set = max(set_scores, key=lambda x: x[1])
-    best_set_idx, best_set_score, best_set_streets = best_set
-
-    sorted_streets = sorted(best_set_streets, key=lambda name: state.six_line_scores[name], reverse=True)
-
-    recommendations = []
-    recommendations.append(f"Non-Overlapping Double Streets Strategy (Set {best_set_idx + 1} with Total Score: {best_set_score})")
-    recommendations.append("Hottest Non-Overlapping Double Streets (Sorted by Hotness):")
-    for i, name in enumerate(sorted_streets, 1):
-        score = state.six_line_scores[name]
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def non_overlapping_corner_strategy():
-    non_overlapping_sets = [
-        ["1ST CORNER – 1, 2, 4, 5", "5TH CORNER – 7, 8, 10, 11", "9TH CORNER – 13, 14, 16, 17", "13TH CORNER – 19, 20, 22, 23", "17TH CORNER – 25, 26, 28, 29", "21ST CORNER – 31, 32, 34, 35"],
-        ["2ND CORNER – 2, 3, 5, 6", "6TH CORNER – 8, 9, 11, 12", "10TH CORNER – 14, 15, 17, 18", "14TH CORNER – 20, 21, 23, 24", "18TH CORNER – 26, 27, 29, 30", "22ND CORNER – 32, 33, 35, 36"]
-    ]
-
-    set_scores = []
-    for idx, non_overlapping_set in enumerate(non_overlapping_sets):
-        total_score = sum(state.corner_scores[name] for name in non_overlapping_set)
-        set_scores.append((idx, total_score, non_overlapping_set))
-
-    best_set = max(set_scores, key=lambda x: x[1])
-    best_set_idx, best_set_score, best_set_corners = best_set
-
-    sorted_corners = sorted(best_set_corners, key=lambda name: state.corner_scores[name], reverse=True)
-
-    recommendations = []
-    recommendations.append(f"Non-Overlapping Corner Strategy (Set {best_set_idx + 1} with Total Score: {best_set_score})")
-    recommendations.append("Hottest Non-Overlapping Corners (Sorted by Hotness):")
-    for i, name in enumerate(sorted_corners, 1):
-        score = state.corner_scores[name]
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def romanowksy_missing_dozen_strategy():
-    recommendations = []
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    dozens_no_hits = [item for item in sorted_dozens if item[1] == 0]
-
-    if not dozens_hits and not dozens_no_hits:
-        recommendations.append("Romanowksy Missing Dozen Strategy: No spins recorded yet.")
-        return "\n".join(recommendations)
-
-    if len(dozens_hits) < 2:
-        recommendations.append("Romanowksy Missing Dozen Strategy: Not enough dozens have hit yet.")
-        if dozens_hits:
-            recommendations.append(f"Hottest Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
-        return "\n".join(recommendations)
-
-    top_dozens = []
-    scores_seen = set()
-    for name, score in sorted_dozens:
-        if len(top_dozens) < 2 or score in scores_seen:
-            top_dozens.append((name, score))
-            scores_seen.add(score)
-        else:
-            break
-
-    recommendations.append("Hottest Dozens (Top 2):")
-    for i, (name, score) in enumerate(top_dozens[:2], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-    if len(top_dozens) > 2 and top_dozens[1][1] == top_dozens[2][1]:
-        tied_dozens = [name for name, score in top_dozens if score == top_dozens[1][1]]
-        recommendations.append(f"Note: Tie detected among {', '.join(tied_dozens)} with score {top_dozens[1][1]}")
-
-    weakest_dozen = sorted_dozens[-1]
-    weakest_dozen_name, weakest_dozen_score = weakest_dozen
-    recommendations.append(f"\nWeakest Dozen: {weakest_dozen_name} (Score: {weakest_dozen_score})")
-
-    weakest_dozen_numbers = set(DOZENS[weakest_dozen_name])
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty:
-        recommendations.append("No strong numbers have hit yet in any dozen.")
-        return "\n".join(recommendations)
-
-    strong_numbers_in_weakest = []
-    neighbors_in_weakest = []
-    for _, row in straight_up_df.iterrows():
-        number = row["Number"]
-        score = row["Score"]
-        if number in weakest_dozen_numbers:
-            strong_numbers_in_weakest.append((number, score))
-        else:
-            if number in current_neighbors:
-                left, right = current_neighbors[number]
-                if left in weakest_dozen_numbers:
-                    neighbors_in_weakest.append((left, number, score))
-                if right in weakest_dozen_numbers:
-                    neighbors_in_weakest.append((right, number, score))
-
-    if strong_numbers_in_weakest:
-        recommendations.append("\nStrongest Numbers in Weakest Dozen:")
-        for number, score in strong_numbers_in_weakest:
-            recommendations.append(f"Number {number} (Score: {score})")
-    else:
-        recommendations.append("\nNo strong numbers directly in the Weakest Dozen.")
-
-    if neighbors_in_weakest:
-        recommendations.append("\nNeighbors of Strong Numbers in Weakest Dozen:")
-        for neighbor, strong_number, score in neighbors_in_weakest:
-            recommendations.append(f"Number {neighbor} (Neighbor of {strong_number}, Score: {score})")
-    else:
-        if not strong_numbers_in_weakest:
-            recommendations.append("No neighbors of strong numbers in the Weakest Dozen.")
-
-    return "\n".join(recommendations)
-
-def fibonacci_to_fortune_strategy():
-    recommendations = []
-
-    fib_recommendations = fibonacci_strategy()
-    recommendations.append("Fibonacci Strategy:")
-    recommendations.append(fib_recommendations)
-
-    even_money_sorted = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in even_money_sorted if item[1] > 0]
-    if even_money_hits:
-        best_even_money = even_money_hits[0]
-        name, score = best_even_money
-        recommendations.append("\nBest Even Money Bet:")
-        recommendations.append(f"1. {name}: {score}")
-    else:
-        recommendations.append("\nBest Even Money Bet: No hits yet.")
-
-    columns_sorted = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in columns_sorted if item[1] > 0]
-    if columns_hits:
-        recommendations.append("\nBest Two Columns:")
-        for i, (name, score) in enumerate(columns_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nBest Two Columns: No hits yet.")
-
-    dozens_sorted = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in dozens_sorted if item[1] > 0]
-    if dozens_hits:
-        recommendations.append("\nBest Two Dozens:")
-        for i, (name, score) in enumerate(dozens_hits[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-    else:
-        recommendations.append("\nBest Two Dozens: No hits yet.")
-
-    weakest_dozen = min(state.dozen_scores.items(), key=lambda x: x[1])
-    weakest_dozen_name, weakest_dozen_score = weakest_dozen
-    weakest_dozen_numbers = set(DOZENS[weakest_dozen_name])
-
-    top_two_dozens = [item[0] for item in dozens_sorted[:2]]
-    top_two_dozen_numbers = set()
-    for dozen_name in top_two_dozens:
-        top_two_dozen_numbers.update(DOZENS[dozen_name])
-
-    double_streets_in_weakest = []
-    for name, numbers in SIX_LINES.items():
-        numbers_set = set(numbers)
-        if numbers_set.issubset(weakest_dozen_numbers) and not numbers_set.intersection(top_two_dozen_numbers):
-            double_streets_in_weakest.append((name, state.six_line_scores[name]))
-
-    if double_streets_in_weakest:
-        double_streets_sorted = sorted(double_streets_in_weakest, key=lambda x: x[1], reverse=True)
-        best_double_street = double_streets_sorted[0]
-        name, score = best_double_street
-        recommendations.append(f"\nBest Double Street in Weakest Dozen ({weakest_dozen_name}):")
-        recommendations.append(f"1. {name}: {score}")
-    else:
-        recommendations.append(f"\nBest Double Street in Weakest Dozen ({weakest_dozen_name}): No suitable double street available.")
-
-    return "\n".join(recommendations)
-
-def three_eight_six_rising_martingale():
-    recommendations = []
-    sorted_streets = sorted(state.street_scores.items(), key=lambda x: x[1], reverse=True)
-    streets_hits = [item for item in sorted_streets if item[1] > 0]
-
-    if not streets_hits:
-        recommendations.append("3-8-6 Rising Martingale: No streets have hit yet.")
-        return "\n".join(recommendations)
-
-    recommendations.append("Top 3 Streets (Yellow):")
-    for i, (name, score) in enumerate(streets_hits[:3], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    recommendations.append("\nMiddle 3 Streets (Cyan):")
-    for i, (name, score) in enumerate(streets_hits[3:6], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    recommendations.append("\nBottom 2 Streets (Green):")
-    for i, (name, score) in enumerate(streets_hits[6:8], 1):
-        recommendations.append(f"{i}. {name}: {score}")
-
-    return "\n".join(recommendations)
-
-def one_dozen_one_column_strategy():
-    recommendations = []
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-
-    if not dozens_hits:
-        recommendations.append("Best Dozen: No dozens have hit yet.")
-    else:
-        top_score = dozens_hits[0][1]
-        top_dozens = [item for item in sorted_dozens if item[1] == top_score]
-        if len(top_dozens) == 1:
-            recommendations.append(f"Best Dozen: {top_dozens[0][0]}")
-        else:
-            recommendations.append("Best Dozens (Tied):")
-            for name, _ in top_dozens:
-                recommendations.append(f"- {name}")
-
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-
-    if not columns_hits:
-        recommendations.append("Best Column: No columns have hit yet.")
-    else:
-        top_score = columns_hits[0][1]
-        top_columns = [item for item in sorted_columns if item[1] == top_score]
-        if len(top_columns) == 1:
-            recommendations.append(f"Best Column: {top_columns[0][0]}")
-        else:
-            recommendations.append("Best Columns (Tied):")
-            for name, _ in top_columns:
-                recommendations.append(f"- {name}")
-
-    return "\n".join(recommendations)
-
-def top_pick_18_numbers_without_neighbours():
-    recommendations = []
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
-def best_even_money_and_top_18():
-    recommendations = []
-
-    # Best Even Money Bets (Top 3 with tie handling, same as best_even_money_bets)
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    
-    if even_money_hits:
-        # Collect the top 3 bets, including ties
-        top_bets = []
-        scores_seen = set()
-        for name, score in sorted_even_money:
-            if len(top_bets) < 3 or score in scores_seen:
-                top_bets.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 3 bets
-        recommendations.append("Best Even Money Bets (Top 3):")
-        for i, (name, score) in enumerate(top_bets[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 3 positions
-        if len(top_bets) > 1:
-            first_score = top_bets[0][1]
-            tied_first = [name for name, score in top_bets if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_bets) > 1:
-                second_score = top_bets[1][1]
-                tied_second = [name for name, score in top_bets if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-
-            if len(top_bets) > 2:
-                third_score = top_bets[2][1]
-                tied_third = [name for name, score in top_bets if score == third_score]
-                if len(tied_third) > 1:
-                    recommendations.append(f"Note: Tie for 3rd place among {', '.join(tied_third)} with score {third_score}")
-    else:
-        recommendations.append("Best Even Money Bets: No hits yet.")
-
-    # Top Pick 18 Numbers without Neighbours (same as top_pick_18_numbers_without_neighbours)
-    recommendations.append("")  # Add a blank line for separation
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
-def best_dozens_and_top_18():
-    recommendations = []
-
-    # Best Dozens (Top 2 with tie handling, same as best_dozens)
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_hits:
-        # Collect the top 2 dozens, including ties
-        top_dozens = []
-        scores_seen = set()
-        for name, score in sorted_dozens:
-            if len(top_dozens) < 2 or score in scores_seen:
-                top_dozens.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 2 dozens
-        recommendations.append("Best Dozens (Top 2):")
-        for i, (name, score) in enumerate(top_dozens[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 2 positions
-        if len(top_dozens) > 1:
-            first_score = top_dozens[0][1]
-            tied_first = [name for name, score in top_dozens if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_dozens) > 1:
-                second_score = top_dozens[1][1]
-                tied_second = [name for name, score in top_dozens if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-    else:
-        recommendations.append("Best Dozens: No hits yet.")
-
-    # Top Pick 18 Numbers without Neighbours (same as top_pick_18_numbers_without_neighbours)
-    recommendations.append("")  # Add a blank line for separation
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
-def best_columns_and_top_18():
-    recommendations = []
-
-    # Best Columns (Top 2 with tie handling, same as best_columns)
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_hits:
-        # Collect the top 2 columns, including ties
-        top_columns = []
-        scores_seen = set()
-        for name, score in sorted_columns:
-            if len(top_columns) < 2 or score in scores_seen:
-                top_columns.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 2 columns
-        recommendations.append("Best Columns (Top 2):")
-        for i, (name, score) in enumerate(top_columns[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 2 positions
-        if len(top_columns) > 1:
-            first_score = top_columns[0][1]
-            tied_first = [name for name, score in top_columns if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_columns) > 1:
-                second_score = top_columns[1][1]
-                tied_second = [name for name, score in top_columns if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-    else:
-        recommendations.append("Best Columns: No hits yet.")
-
-    # Top Pick 18 Numbers without Neighbours (same as top_pick_18_numbers_without_neighbours)
-    recommendations.append("")  # Add a blank line for separation
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
-def best_dozens_even_money_and_top_18():
-    recommendations = []
-
-    # Best Dozens (Top 2 with tie handling, same as best_dozens)
-    sorted_dozens = sorted(state.dozen_scores.items(), key=lambda x: x[1], reverse=True)
-    dozens_hits = [item for item in sorted_dozens if item[1] > 0]
-    if dozens_hits:
-        # Collect the top 2 dozens, including ties
-        top_dozens = []
-        scores_seen = set()
-        for name, score in sorted_dozens:
-            if len(top_dozens) < 2 or score in scores_seen:
-                top_dozens.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 2 dozens
-        recommendations.append("Best Dozens (Top 2):")
-        for i, (name, score) in enumerate(top_dozens[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 2 positions
-        if len(top_dozens) > 1:
-            first_score = top_dozens[0][1]
-            tied_first = [name for name, score in top_dozens if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_dozens) > 1:
-                second_score = top_dozens[1][1]
-                tied_second = [name for name, score in top_dozens if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-    else:
-        recommendations.append("Best Dozens: No hits yet.")
-
-    # Best Even Money Bets (Top 3 with tie handling, same as best_even_money_bets)
-    recommendations.append("")  # Add a blank line for separation
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    
-    if even_money_hits:
-        # Collect the top 3 bets, including ties
-        top_bets = []
-        scores_seen = set()
-        for name, score in sorted_even_money:
-            if len(top_bets) < 3 or score in scores_seen:
-                top_bets.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 3 bets
-        recommendations.append("Best Even Money Bets (Top 3):")
-        for i, (name, score) in enumerate(top_bets[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 3 positions
-        if len(top_bets) > 1:
-            first_score = top_bets[0][1]
-            tied_first = [name for name, score in top_bets if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_bets) > 1:
-                second_score = top_bets[1][1]
-                tied_second = [name for name, score in top_bets if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-
-            if len(top_bets) > 2:
-                third_score = top_bets[2][1]
-                tied_third = [name for name, score in top_bets if score == third_score]
-                if len(tied_third) > 1:
-                    recommendations.append(f"Note: Tie for 3rd place among {', '.join(tied_third)} with score {third_score}")
-    else:
-        recommendations.append("Best Even Money Bets: No hits yet.")
-
-    # Top Pick 18 Numbers without Neighbours (same as top_pick_18_numbers_without_neighbours)
-    recommendations.append("")  # Add a blank line for separation
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
-def best_columns_even_money_and_top_18():
-    recommendations = []
-
-    # Best Columns (Top 2 with tie handling, same as best_columns)
-    sorted_columns = sorted(state.column_scores.items(), key=lambda x: x[1], reverse=True)
-    columns_hits = [item for item in sorted_columns if item[1] > 0]
-    if columns_hits:
-        # Collect the top 2 columns, including ties
-        top_columns = []
-        scores_seen = set()
-        for name, score in sorted_columns:
-            if len(top_columns) < 2 or score in scores_seen:
-                top_columns.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 2 columns
-        recommendations.append("Best Columns (Top 2):")
-        for i, (name, score) in enumerate(top_columns[:2], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 2 positions
-        if len(top_columns) > 1:
-            first_score = top_columns[0][1]
-            tied_first = [name for name, score in top_columns if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_columns) > 1:
-                second_score = top_columns[1][1]
-                tied_second = [name for name, score in top_columns if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-    else:
-        recommendations.append("Best Columns: No hits yet.")
-
-    # Best Even Money Bets (Top 3 with tie handling, same as best_even_money_bets)
-    recommendations.append("")  # Add a blank line for separation
-    sorted_even_money = sorted(state.even_money_scores.items(), key=lambda x: x[1], reverse=True)
-    even_money_hits = [item for item in sorted_even_money if item[1] > 0]
-    
-    if even_money_hits:
-        # Collect the top 3 bets, including ties
-        top_bets = []
-        scores_seen = set()
-        for name, score in sorted_even_money:
-            if len(top_bets) < 3 or score in scores_seen:
-                top_bets.append((name, score))
-                scores_seen.add(score)
-            else:
-                break
-
-        # Display the top 3 bets
-        recommendations.append("Best Even Money Bets (Top 3):")
-        for i, (name, score) in enumerate(top_bets[:3], 1):
-            recommendations.append(f"{i}. {name}: {score}")
-
-        # Check for ties among the top 3 positions
-        if len(top_bets) > 1:
-            first_score = top_bets[0][1]
-            tied_first = [name for name, score in top_bets if score == first_score]
-            if len(tied_first) > 1:
-                recommendations.append(f"Note: Tie for 1st place among {', '.join(tied_first)} with score {first_score}")
-
-            if len(top_bets) > 1:
-                second_score = top_bets[1][1]
-                tied_second = [name for name, score in top_bets if score == second_score]
-                if len(tied_second) > 1:
-                    recommendations.append(f"Note: Tie for 2nd place among {', '.join(tied_second)} with score {second_score}")
-
-            if len(top_bets) > 2:
-                third_score = top_bets[2][1]
-                tied_third = [name for name, score in top_bets if score == third_score]
-                if len(tied_third) > 1:
-                    recommendations.append(f"Note: Tie for 3rd place among {', '.join(tied_third)} with score {third_score}")
-    else:
-        recommendations.append("Best Even Money Bets: No hits yet.")
-
-    # Top Pick 18 Numbers without Neighbours (same as top_pick_18_numbers_without_neighbours)
-    recommendations.append("")  # Add a blank line for separation
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty or len(straight_up_df) < 18:
-        recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
-        return "\n".join(recommendations)
-
-    top_18_df = straight_up_df.head(18)
-    top_18_numbers = top_18_df["Number"].tolist()
-
-    top_6 = top_18_numbers[:6]
-    next_6 = top_18_numbers[6:12]
-    last_6 = top_18_numbers[12:18]
-
-    recommendations.append("Top Pick 18 Numbers without Neighbours:")
-    recommendations.append("\nTop 6 Numbers (Yellow):")
-    for i, num in enumerate(top_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nNext 6 Numbers (Blue):")
-    for i, num in enumerate(next_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    recommendations.append("\nLast 6 Numbers (Green):")
-    for i, num in enumerate(last_6, 1):
-        score = top_18_df[top_18_df["Number"] == num]["Score"].iloc[0]
-        recommendations.append(f"{i}. Number {num} (Score: {score})")
-
-    return "\n".join(recommendations)
-
 def create_color_code_table():
     html = '''
     <div style="margin-top: 20px;">
@@ -3092,169 +1787,6 @@ def update_spin_counter():
     spin_count = len(state.last_spins)
     return f'<span class="spin-counter">Total Spins: {spin_count}</span>'
     
-def top_numbers_with_neighbours_tiered():
-    recommendations = []
-    straight_up_df = pd.DataFrame(list(state.scores.items()), columns=["Number", "Score"])
-    straight_up_df = straight_up_df[straight_up_df["Score"] > 0].sort_values(by="Score", ascending=False)
-
-    if straight_up_df.empty:
-        return "<p>Top Numbers with Neighbours (Tiered): No numbers have hit yet.</p>"
-
-    # Start with the HTML table for Strongest Numbers
-    table_html = '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
-    table_html += "<tr><th>Hit</th><th>Left N.</th><th>Right N.</th></tr>"  # Table header
-    for _, row in straight_up_df.iterrows():
-        num = str(row["Number"])
-        left, right = current_neighbors.get(row["Number"], ("", ""))
-        left = str(left) if left is not None else ""
-        right = str(right) if right is not None else ""
-        table_html += f"<tr><td>{num}</td><td>{left}</td><td>{right}</td></tr>"
-    table_html += "</table>"
-
-    # Wrap the table in a div with a heading
-    recommendations.append("<h3>Strongest Numbers:</h3>")
-    recommendations.append(table_html)
-
-    num_to_take = min(8, len(straight_up_df))
-    top_numbers = straight_up_df["Number"].head(num_to_take).tolist()
-
-    all_numbers = set()
-    number_scores = {}
-    for num in top_numbers:
-        neighbors = current_neighbors.get(num, (None, None))
-        left, right = neighbors
-        all_numbers.add(num)
-        number_scores[num] = state.scores[num]
-        if left is not None:
-            all_numbers.add(left)
-        if right is not None:
-            all_numbers.add(right)
-
-    number_groups = []
-    for num in top_numbers:
-        left, right = current_neighbors.get(num, (None, None))
-        group = [num]
-        if left is not None:
-            group.append(left)
-        if right is not None:
-            group.append(right)
-        number_groups.append((state.scores[num], group))
-
-    number_groups.sort(key=lambda x: x[0], reverse=True)
-    ordered_numbers = []
-    for _, group in number_groups:
-        ordered_numbers.extend(group)
-
-    ordered_numbers = ordered_numbers[:24]
-    top_8 = ordered_numbers[:8]
-    next_8 = ordered_numbers[8:16]
-    last_8 = ordered_numbers[16:24]
-
-    recommendations.append("<h3>Top Numbers with Neighbours (Tiered):</h3>")
-    recommendations.append("<p><strong>Top Tier (Yellow):</strong></p>")
-    for i, num in enumerate(top_8, 1):
-        score = number_scores.get(num, "Neighbor")
-        recommendations.append(f"<p>{i}. Number {num} (Score: {score})</p>")
-
-    recommendations.append("<p><strong>Second Tier (Blue):</strong></p>")
-    for i, num in enumerate(next_8, 1):
-        score = number_scores.get(num, "Neighbor")
-        recommendations.append(f"<p>{i}. Number {num} (Score: {score})</p>")
-
-    recommendations.append("<p><strong>Third Tier (Green):</strong></p>")
-    for i, num in enumerate(last_8, 1):
-        score = number_scores.get(num, "Neighbor")
-        recommendations.append(f"<p>{i}. Number {num} (Score: {score})</p>")
-
-    return "\n".join(recommendations)
-
-def neighbours_of_strong_number(neighbours_count, strong_numbers_count):
-    """Recommend numbers and their neighbors based on hit frequency."""
-    recommendations = []
-    
-    # Validate inputs
-    try:
-        neighbours_count = int(neighbours_count)
-        strong_numbers_count = int(strong_numbers_count)
-        if neighbours_count < 0 or strong_numbers_count < 0:
-            raise ValueError("Neighbours count and strong numbers count must be non-negative.")
-        if strong_numbers_count == 0:
-            raise ValueError("Strong numbers count must be at least 1.")
-    except (ValueError, TypeError) as e:
-        return f"Error: Invalid input - {str(e)}. Please use positive integers for neighbours and strong numbers."
-
-    # Check if current_neighbors is valid
-    if not isinstance(current_neighbors, dict):
-        return "Error: Neighbor data is not properly configured. Contact support."
-    for key, value in current_neighbors.items():
-        if not isinstance(key, int) or not isinstance(value, tuple) or len(value) != 2:
-            return "Error: Neighbor data is malformed. Contact support."
-
-    try:
-        print(f"neighbours_of_strong_number: Starting with neighbours_count = {neighbours_count}, strong_numbers_count = {strong_numbers_count}")
-        sorted_numbers = sorted(state.scores.items(), key=lambda x: (-x[1], x[0]))
-        numbers_hits = [item for item in sorted_numbers if item[1] > 0]
-        
-        if not numbers_hits:
-            recommendations.append("Neighbours of Strong Number: No numbers have hit yet.")
-            return "\n".join(recommendations)
-
-        # Limit strong_numbers_count to available hits
-        strong_numbers_count = min(strong_numbers_count, len(numbers_hits))
-        top_numbers = [item[0] for item in numbers_hits[:strong_numbers_count]]
-        top_scores = {item[0]: item[1] for item in numbers_hits[:strong_numbers_count]}
-        selected_numbers = set(top_numbers)
-        neighbors_set = set()
-
-        # Calculate neighbors for each strong number
-        for strong_number in top_numbers:
-            if strong_number not in current_neighbors:
-                recommendations.append(f"Warning: No neighbor data for number {strong_number}. Skipping its neighbors.")
-                continue
-            current_number = strong_number
-            # Left neighbors
-            for i in range(neighbours_count):
-                left, _ = current_neighbors.get(current_number, (None, None))
-                if left is not None:
-                    neighbors_set.add(left)
-                    current_number = left
-                else:
-                    break
-            # Right neighbors
-            current_number = strong_number
-            for i in range(neighbours_count):
-                _, right = current_neighbors.get(current_number, (None, None))
-                if right is not None:
-                    neighbors_set.add(right)
-                    current_number = right
-                else:
-                    break
-
-        # Remove overlap (strong numbers take precedence)
-        neighbors_set = neighbors_set - selected_numbers
-        print(f"neighbours_of_strong_number: Strong numbers = {sorted(list(selected_numbers))}")
-        print(f"neighbours_of_strong_number: Neighbors = {sorted(list(neighbors_set))}")
-
-        # Format recommendations
-        recommendations.append(f"Top {strong_numbers_count} Strongest Numbers and Their Neighbours:")
-        recommendations.append("\nStrongest Numbers (Yellow):")
-        for i, num in enumerate(sorted(top_numbers), 1):
-            score = top_scores[num]
-            recommendations.append(f"{i}. Number {num} (Score: {score})")
-        
-        if neighbors_set:
-            recommendations.append(f"\nNeighbours ({neighbours_count} Left + {neighbours_count} Right, Cyan):")
-            for i, num in enumerate(sorted(list(neighbors_set)), 1):
-                recommendations.append(f"{i}. Number {num}")
-        else:
-            recommendations.append(f"\nNeighbours ({neighbours_count} Left + {neighbours_count} Right, Cyan): None")
-
-        return "\n".join(recommendations)
-
-    except Exception as e:
-        print(f"neighbours_of_strong_number: Unexpected error: {str(e)}")
-        return f"Error in Neighbours of Strong Number: Unexpected issue - {str(e)}. Please try again or contact support."
-
 def dozen_tracker(num_spins_to_check, consecutive_hits_threshold, alert_enabled, sequence_length, follow_up_spins, sequence_alert_enabled):
     """Track and display the history of Dozen hits for the last N spins, with optional alerts for consecutive hits and sequence matching."""
     recommendations = []
@@ -3289,65 +1821,29 @@ def dozen_tracker(num_spins_to_check, consecutive_hits_threshold, alert_enabled,
     if not recent_spins:
         return "Dozen Tracker: No spins recorded yet.", "<p>Dozen Tracker: No spins recorded yet.</p>", "<p>Dozen Tracker: No spins recorded yet.</p>"
 
-    # Map each spin to its Dozen
+    # Read the window off the run-length state instead of mapping and rescanning every spin
+    dozens = state.pattern_trackers["Dozens"]
+    window_start = len(state.last_spins) - len(recent_spins)
+    dozen_runs = dozens.runs(window_start)
     dozen_pattern = []
     dozen_counts = {"1st Dozen": 0, "2nd Dozen": 0, "3rd Dozen": 0, "Not in Dozen": 0}
-    for spin in recent_spins:
-        spin_value = int(spin)
-        if spin_value == 0:
-            dozen_pattern.append("Not in Dozen")
-            dozen_counts["Not in Dozen"] += 1
-        else:
-            found = False
-            for name, numbers in DOZENS.items():
-                if spin_value in numbers:
-                    dozen_pattern.append(name)
-                    dozen_counts[name] += 1
-                    found = True
-                    break
-            if not found:
-                dozen_pattern.append("Not in Dozen")
-                dozen_counts["Not in Dozen"] += 1
-    # Map the entire spin history to Dozens for sequence matching
-    full_dozen_pattern = []
-    for spin in state.last_spins:
-        spin_value = int(spin)
-        if spin_value == 0:
-            full_dozen_pattern.append("Not in Dozen")
-        else:
-            found = False
-            for name, numbers in DOZENS.items():
-                if spin_value in numbers:
-                    full_dozen_pattern.append(name)
-                    found = True
-                    break
-            if not found:
-                full_dozen_pattern.append("Not in Dozen")
-
+    for dozen, _, length in dozen_runs:
+        dozen_pattern.extend([dozen] * length)
+        dozen_counts[dozen] += length
     # Detect consecutive Dozen hits (only if alert is enabled)
-    current_streak = 1
-    current_dozen = None
     max_streak = 1
     max_streak_dozen = None
     max_streak_end_index = -1  # Track the end index of the maximum streak
     if alert_enabled:
-        for i in range(len(dozen_pattern)):
-            dozen = dozen_pattern[i]
+        for dozen, offset, length in dozen_runs:
             if dozen == "Not in Dozen":  # 0 breaks the streak
-                current_streak = 1
-                current_dozen = None
                 continue
-            if current_dozen is None or dozen != current_dozen:
-                current_dozen = dozen
-                current_streak = 1
-            else:
-                current_streak += 1
-                # Only consider streaks that end after the last alerted index
-                if current_streak >= consecutive_hits_threshold and i > state.last_dozen_alert_index:
-                    if current_streak > max_streak:
-                        max_streak = current_streak
-                        max_streak_dozen = current_dozen
-                        max_streak_end_index = i
+            # Only consider streaks that end after the last alerted index; the first longest run wins
+            end_index = offset + length - 1
+            if length >= consecutive_hits_threshold and end_index > state.last_dozen_alert_index and length > max_streak:
+                max_streak = length
+                max_streak_dozen = dozen
+                max_streak_end_index = end_index
         # Trigger alert only for the maximum streak that ends after the last alerted index
         if max_streak_end_index > state.last_dozen_alert_index and max_streak >= consecutive_hits_threshold:
             gr.Warning(f"Alert: {max_streak_dozen} has hit {max_streak} times consecutively!")
@@ -3357,34 +1853,16 @@ def dozen_tracker(num_spins_to_check, consecutive_hits_threshold, alert_enabled,
 
     # Detect sequence matches (only if sequence alert is enabled)
     sequence_matches = []
-    sequence_follow_ups = []
     if sequence_alert_enabled and len(dozen_pattern) >= sequence_length:
-        # Collect all sequences of length X
-        sequences = []
-        for i in range(len(dozen_pattern) - sequence_length + 1):
-            seq = tuple(dozen_pattern[i:i + sequence_length])
-            sequences.append((i, seq))
-
-        # Find matching sequences
-        for i in range(len(sequences)):
-            for j in range(i + 1, len(sequences)):
-                if sequences[i][1] == sequences[j][1]:
-                    start_idx = sequences[j][0]
-                    sequence_matches.append((start_idx, sequences[j][1]))
-                    # Get the next Y spins after the first occurrence
-                    first_start_idx = sequences[i][0]
-                    follow_up_start = first_start_idx + sequence_length
-                    follow_up_end = follow_up_start + follow_up_spins
-                    if follow_up_end <= len(dozen_pattern):
-                        follow_up = dozen_pattern[follow_up_start:follow_up_end]
-                        sequence_follow_ups.append((start_idx, sequences[j][1], follow_up))
+        # Look sequences up in the incremental n-gram index instead of comparing every pair of windows
+        sequence_matches = [(position - window_start, seq) for position, seq in dozens.repeat_pairs(sequence_length, window_start)]
 
         # If a match is found, provide betting recommendations
-        if sequence_matches:
-            latest_match = max(sequence_matches, key=lambda x: x[0])  # Latest match by start index
-            latest_start_idx, matched_sequence = latest_match
-            # Find the follow-up spins for the first occurrence of this sequence
-            first_occurrence = min((seq for seq in sequences if seq[1] == matched_sequence), key=lambda x: x[0])[0]
+        latest_match = dozens.latest_repeat(sequence_length, window_start)
+        if latest_match:
+            latest_start_idx, first_occurrence = (position - window_start for position in latest_match)
+            matched_sequence = tuple(dozen_pattern[latest_start_idx:latest_start_idx + sequence_length])
+            # Follow-up spins after the first occurrence of this sequence
             follow_up_start = first_occurrence + sequence_length
             follow_up_end = follow_up_start + follow_up_spins
             if follow_up_end <= len(dozen_pattern):
@@ -3400,28 +1878,6 @@ def dozen_tracker(num_spins_to_check, consecutive_hits_threshold, alert_enabled,
                     else:
                         dozens_to_bet = [d for d in all_dozens if d != dozen]
                         sequence_recommendations.append(f"Spin {idx + 1}: Bet against {dozen} - Bet on {', '.join(dozens_to_bet)}")
-        else:
-            sequence_html_output = "<h4>Sequence Matching Results:</h4>"
-            if not sequence_alert_enabled:
-                sequence_html_output += "<p>Sequence matching is disabled. Enable it to see results.</p>"
-            elif len(dozen_pattern) < sequence_length:
-                sequence_html_output += f"<p>Not enough spins to match a sequence of length {sequence_length}.</p>"
-            elif not sequence_matches:
-                sequence_html_output += "<p>No sequence matches found yet.</p>"
-            else:
-                sequence_html_output += "<ul style='list-style-type: none; padding-left: 0;'>"
-                for start_idx, seq in sequence_matches:
-                    sequence_html_output += f"<li>Match found at spins {start_idx + 1} to {start_idx + sequence_length}: {', '.join(seq)}</li>"
-                sequence_html_output += "</ul>"
-                if sequence_recommendations:
-                    sequence_html_output += "<h4>Latest Match Details:</h4>"
-                    sequence_html_output += "<ul style='list-style-type: none; padding-left: 0;'>"
-                    for rec in sequence_recommendations:
-                        if "Alert:" in rec:
-                            sequence_html_output += f"<li style='color: red; font-weight: bold;'>{rec}</li>"
-                        else:
-                            sequence_html_output += f"<li>{rec}</li>"
-                    sequence_html_output += "</ul>"
 
     # Text summary for Dozen Tracker
     recommendations.append(f"Dozen Tracker (Last {len(recent_spins)} Spins):")
@@ -3514,67 +1970,45 @@ def even_money_tracker(spins_to_check, consecutive_hits_threshold, alert_enabled
     if not categories_to_track:
         categories_to_track = ["Red", "Black", "Even", "Odd", "Low", "High"]
 
-    # Map spins to even money categories and track full trait combinations
+    # Read the window off the run-length state of (Color, Parity, Range) traits
+    trait_runs = state.pattern_trackers["Even Money Traits"].runs(len(state.last_spins) - len(recent_spins))
+    match = all if combination_mode == "And" else any
     pattern = []
     category_counts = {name: 0 for name in EVEN_MONEY.keys()}
-    trait_combinations = []  # Store the full trait combination for each spin (e.g., "Red, Odd, Low")
-    for spin in recent_spins:
-        spin_value = int(spin)
-        spin_categories = []
-        for name, numbers in EVEN_MONEY.items():
-            if spin_value in numbers:
-                spin_categories.append(name)
-                category_counts[name] += 1
-
-        # Determine if the spin matches the tracked combination
-        if combination_mode == "And":
-            if all(cat in spin_categories for cat in categories_to_track):
-                pattern.append("Hit")
-            else:
-                pattern.append("Miss")
-        else:  # Or mode
-            if any(cat in spin_categories for cat in categories_to_track):
-                pattern.append("Hit")
-            else:
-                pattern.append("Miss")
-
-        # Build the full trait combination for this spin (Color, Parity, Range)
-        color = "Red" if "Red" in spin_categories else ("Black" if "Black" in spin_categories else "None")
-        parity = "Even" if "Even" in spin_categories else ("Odd" if "Odd" in spin_categories else "None")
-        range_ = "Low" if "Low" in spin_categories else ("High" if "High" in spin_categories else "None")
-        trait_combination = f"{color}, {parity}, {range_}"
-        trait_combinations.append(trait_combination)
-
-    # Track consecutive hits of the selected combination
-    current_streak = 1
+    # Track consecutive hits of the selected combination; a hit run may span several trait runs
+    current_streak = 0
+    current_start = 0
     max_streak = 1
     max_streak_start = 0
-    for i in range(1, len(pattern)):
-        if pattern[i] == "Hit" and pattern[i-1] == "Hit":
-            current_streak += 1
-            if current_streak > max_streak:
-                max_streak = current_streak
-                max_streak_start = i - current_streak + 1
-        else:
-            current_streak = 1 if pattern[i] == "Hit" else 0
+    for combination, offset, length in trait_runs:
+        traits = combination.split(", ")
+        for name in traits:
+            if name in category_counts:
+                category_counts[name] += length
+        hit = match(cat in traits for cat in categories_to_track)
+        pattern.extend(["Hit" if hit else "Miss"] * length)
+        if not hit:
+            current_streak = 0
+            continue
+        if current_streak == 0:
+            current_start = offset
+        current_streak += length
+        if current_streak > max_streak:
+            max_streak = current_streak
+            max_streak_start = current_start
 
     # Track consecutive identical trait combinations (independent of category selection)
     identical_recommendations = []
     identical_html_output = ""
     betting_recommendation = None
     if identical_traits_enabled:
-        # Detect consecutive identical trait combinations
-        identical_streak = 1
-        identical_streak_start = 0
+        # Each run of one non-zero trait combination long enough is a match at its start
         identical_matches = []
-        for i in range(1, len(trait_combinations)):
-            if trait_combinations[i] == trait_combinations[i-1] and trait_combinations[i] != "None, None, None":
-                identical_streak += 1
-                if identical_streak == consecutive_identical_count:
-                    identical_matches.append((i - consecutive_identical_count + 1, trait_combinations[i]))
-                    identical_streak_start = i - consecutive_identical_count + 1
-            else:
-                identical_streak = 1
+        if consecutive_identical_count > 1:
+            identical_matches = [
+                (offset, combination) for combination, offset, length in trait_runs
+                if length >= consecutive_identical_count and combination != "Zero"
+            ]
 
         if identical_matches:
             # Process the most recent match
@@ -3695,34 +2129,98 @@ def even_money_tracker(spins_to_check, consecutive_hits_threshold, alert_enabled
 
     return "\n".join(recommendations), html_output
 
-STRATEGIES = {
-    "Hot Bet Strategy": {"function": hot_bet_strategy, "categories": ["even_money", "dozens", "columns", "streets", "corners", "six_lines", "splits", "sides", "numbers"]},
-    "Cold Bet Strategy": {"function": cold_bet_strategy, "categories": ["even_money", "dozens", "columns", "streets", "corners", "six_lines", "splits", "sides", "numbers"]},
-    "Best Even Money Bets": {"function": best_even_money_bets, "categories": ["even_money"]},
-    "Best Even Money Bets + Top Pick 18 Numbers": {"function": best_even_money_and_top_18, "categories": ["even_money", "numbers"]},
-    "Best Dozens": {"function": best_dozens, "categories": ["dozens"]},
-    "Best Dozens + Top Pick 18 Numbers": {"function": best_dozens_and_top_18, "categories": ["dozens", "numbers"]},
-    "Best Columns": {"function": best_columns, "categories": ["columns"]},
-    "Best Columns + Top Pick 18 Numbers": {"function": best_columns_and_top_18, "categories": ["columns", "numbers"]},
-    "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers": {"function": best_dozens_even_money_and_top_18, "categories": ["dozens", "even_money", "numbers", "trends"]},
-    "Best Columns + Best Even Money Bets + Top Pick 18 Numbers": {"function": best_columns_even_money_and_top_18, "categories": ["columns", "even_money", "numbers", "trends"]},
-    "Fibonacci Strategy": {"function": fibonacci_strategy, "categories": ["dozens", "columns"]},
-    "Best Streets": {"function": best_streets, "categories": ["streets"]},
-    "Best Double Streets": {"function": best_double_streets, "categories": ["six_lines"]},
-    "Best Corners": {"function": best_corners, "categories": ["corners"]},
-    "Best Splits": {"function": best_splits, "categories": ["splits"]},
-    "Best Dozens + Best Streets": {"function": best_dozens_and_streets, "categories": ["dozens", "streets"]},
-    "Best Columns + Best Streets": {"function": best_columns_and_streets, "categories": ["columns", "streets"]},
-    "Non-Overlapping Double Street Strategy": {"function": non_overlapping_double_street_strategy, "categories": ["six_lines"]},
-    "Non-Overlapping Corner Strategy": {"function": non_overlapping_corner_strategy, "categories": ["corners"]},
-    "Romanowksy Missing Dozen": {"function": romanowksy_missing_dozen_strategy, "categories": ["dozens", "numbers"]},
-    "Fibonacci To Fortune": {"function": fibonacci_to_fortune_strategy, "categories": ["even_money", "dozens", "columns", "six_lines"]},
-    "3-8-6 Rising Martingale": {"function": three_eight_six_rising_martingale, "categories": ["streets"]},
-    "1 Dozen +1 Column Strategy": {"function": one_dozen_one_column_strategy, "categories": ["dozens", "columns"]},
-    "Top Pick 18 Numbers without Neighbours": {"function": top_pick_18_numbers_without_neighbours, "categories": ["numbers"]},
-    "Top Numbers with Neighbours (Tiered)": {"function": top_numbers_with_neighbours_tiered, "categories": ["numbers"]},
-    "Neighbours of Strong Number": {"function": neighbours_of_strong_number, "categories": ["neighbours"]}
-}
+def pattern_tracker(grouping, num_spins_to_check, streak_threshold, alert_enabled, sequence_length, follow_up_spins):
+    """Streaks, repeated sequences and follow-ups of any grouping (columns, streets, colors, custom groups, ...)."""
+    try:
+        num_spins_to_check = int(num_spins_to_check)
+        streak_threshold = int(streak_threshold)
+        sequence_length = int(sequence_length)
+        follow_up_spins = int(follow_up_spins)
+        if min(num_spins_to_check, streak_threshold, sequence_length, follow_up_spins) < 1:
+            return "<p>Error: Inputs must be at least 1.</p>"
+    except (ValueError, TypeError):
+        return "<p>Error: Invalid inputs. Use positive integers.</p>"
+    if grouping not in state.pattern_trackers:
+        return f"<p>Unknown grouping '{escape_html(str(grouping))}'.</p>"
+
+    tracker = state.pattern_trackers[grouping]
+    window_start = max(0, len(state.last_spins) - num_spins_to_check)
+    runs = tracker.runs(window_start)
+    if not runs:
+        return f"<p>{escape_html(grouping)} Tracker: No spins recorded yet.</p>"
+    window_size = len(state.last_spins) - window_start
+
+    counts = {}
+    longest = {}
+    for category, _, length in runs:
+        counts[category] = counts.get(category, 0) + length
+        longest[category] = max(longest.get(category, 0), length)
+    current_category, _, current_length = runs[-1]
+
+    html_output = f"<h4>{escape_html(grouping)} Tracker (Last {window_size} Spins):</h4>"
+    html_output += "<p>History: " + ", ".join(escape_html(str(category)) for category in tracker.symbols[window_start:]) + "</p>"
+    if current_length >= streak_threshold:
+        alert = f"Alert: {current_category} has hit {current_length} times consecutively!"
+        if alert_enabled:
+            gr.Warning(alert)
+        html_output += f'<p style="color: red; font-weight: bold;">{escape_html(alert)}</p>'
+    html_output += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+    html_output += "<tr><th>Category</th><th>Hits</th><th>Longest Streak</th></tr>"
+    for category, count in sorted(counts.items(), key=lambda x: x[1], reverse=True):
+        html_output += f"<tr><td>{escape_html(str(category))}</td><td>{count}</td><td>{longest[category]}</td></tr>"
+    html_output += "</table>"
+
+    # Whole-session repeats from the suffix automaton, independent of the window
+    html_output += "<h4>Longest Repeats (Whole Session):</h4>"
+    longest = tracker.longest_repeat()
+    if longest is None:
+        html_output += "<p>No run has repeated yet.</p>"
+    else:
+        length, first_end, end = longest
+        run = ", ".join(str(category) for category in tracker.symbols[end - length + 1:end + 1])
+        html_output += f"<p>Longest repeated run ({length} spins): {escape_html(run)} — spins {first_end - length + 2} to {first_end + 1}, again at spins {end - length + 2} to {end + 1}.</p>"
+    tail_length, tail_first_end = tracker.tail_repeat()
+    if tail_length:
+        html_output += f"<p>The last {tail_length} spin(s) already happened at spins {tail_first_end - tail_length + 2} to {tail_first_end + 1}.</p>"
+    else:
+        html_output += "<p>The latest spin starts a run not seen before.</p>"
+
+    html_output += "<h4>Sequence Matching Results:</h4>"
+    matches = tracker.repeats(sequence_length, window_start)
+    follow = tracker.follow_ups(sequence_length, follow_up_spins, window_start)
+    if follow is None:
+        html_output += f"<p>Not enough spins to match a sequence of length {sequence_length}.</p>"
+        return html_output
+    html_output += f"<p>Repeated sequences of {sequence_length} in this window: {len(matches)}</p>"
+    sequence, occurrences, follow_counts = follow
+    html_output += f"<p>Latest sequence: {escape_html(', '.join(str(category) for category in sequence))}</p>"
+    if not occurrences:
+        html_output += "<p>The latest sequence has not appeared earlier in this window.</p>"
+        return html_output
+    html_output += f"<p>Seen {len(occurrences)} time(s) before, at spins " + ", ".join(str(p - window_start + 1) for p in occurrences) + "</p>"
+    total = sum(follow_counts.values())
+    if total:
+        html_output += f"<p>What came in the next {follow_up_spins} spins:</p>"
+        html_output += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+        html_output += "<tr><th>Category</th><th>Hits</th><th>Share</th></tr>"
+        for category, count in sorted(follow_counts.items(), key=lambda x: x[1], reverse=True):
+            html_output += f"<tr><td>{escape_html(str(category))}</td><td>{count}</td><td>{count / total * 100:.1f}%</td></tr>"
+        html_output += "</table>"
+    return html_output
+
+def add_pattern_grouping(name, definition, num_spins_to_check, streak_threshold, alert_enabled, sequence_length, follow_up_spins):
+    """Track a custom grouping such as "Voisins: 22, 18, 29; Tiers: 27, 13, 36" alongside the built-in ones."""
+    try:
+        name = (name or "").strip()
+        if not name:
+            raise ValueError("Please give the grouping a name.")
+        state.pattern_trackers.add(name, parse_grouping(definition or ""))
+        return gr.update(choices=state.pattern_trackers.names(), value=name), pattern_tracker(name, num_spins_to_check, streak_threshold, alert_enabled, sequence_length, follow_up_spins)
+    except ValueError as e:
+        return gr.update(), f"<p>Could not add grouping: {escape_html(str(e))}</p>"
+    except Exception as e:
+        print(f"add_pattern_grouping: Error: {str(e)}")
+        return gr.update(), f"<p>Error adding grouping: {str(e)}</p>"
 
 def show_strategy_recommendations(strategy_name, neighbours_count, strong_numbers_count, *args):
     try:
@@ -3740,9 +2238,6 @@ def show_strategy_recommendations(strategy_name, neighbours_count, strong_number
                 return "<p>No spins yet. Default Even Money Bets to consider:<br>1. Red<br>2. Black<br>3. Even</p>"
             return "<p>Please analyze some spins first to generate scores.</p>"
 
-        strategy_info = STRATEGIES[strategy_name]
-        strategy_func = strategy_info["function"]
-
         if strategy_name == "Neighbours of Strong Number":
             try:
                 neighbours_count = int(neighbours_count)
@@ -3752,24 +2247,205 @@ def show_strategy_recommendations(strategy_name, neighbours_count, strong_number
                 print(f"show_strategy_recommendations: Error converting inputs: {str(e)}, defaulting to 2 and 1.")
                 neighbours_count = 2
                 strong_numbers_count = 1
-            recommendations = strategy_func(neighbours_count, strong_numbers_count)
-        else:
-            recommendations = strategy_func()
+        result = evaluate_strategy(state, strategy_name, neighbours_count, strong_numbers_count)
 
-        print(f"show_strategy_recommendations: Strategy {strategy_name} output = {recommendations}")
+        print(f"show_strategy_recommendations: Strategy {strategy_name} output = {result.text}")
 
         # If the output is already HTML, return it as is
-        if strategy_name == "Top Numbers with Neighbours (Tiered)":
-            return recommendations
+        if result.is_html:
+            return result.text
         # Otherwise, convert plain text to HTML
         else:
-            lines = recommendations.split("\n")
+            lines = result.text.split("\n")
             html_lines = [f"<p>{line}</p>" for line in lines if line.strip()]
             return "".join(html_lines)
     except Exception as e:
         print(f"show_strategy_recommendations: Error: {str(e)}")
         return f"<p>Error generating strategy recommendations: {str(e)}</p>"
 
+def render_strategy_dashboard(neighbours_count, strong_numbers_count):
+    """Compare every strategy's coverage and out-of-sample hit rate side by side."""
+    try:
+        if not any(state.scores.values()):
+            return "<p>Please analyze some spins first to compare strategies.</p>"
+        try:
+            neighbours_count = int(neighbours_count)
+            strong_numbers_count = int(strong_numbers_count)
+        except (ValueError, TypeError):
+            neighbours_count, strong_numbers_count = 2, 1
+        rows = evaluate_all_strategies(state, neighbours_count, strong_numbers_count)
+        rates = state.strategy_tally.rates(neighbours_count, strong_numbers_count)
+        # Strategies that never placed a bet sort last
+        rows = sorted(rows, key=lambda row: rates[row["strategy"]][1] - rates[row["strategy"]][2] if row["strategy"] in rates else -1, reverse=True)
+
+        html = '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif; width: 100%;">'
+        html += "<tr><th>Strategy</th><th>Coverage</th><th>Overlap</th><th>Shared</th><th>Rounds</th><th>Hit Rate</th><th>Expected</th><th>Stake</th><th>Std Dev/Spin</th></tr>"
+        for row in rows:
+            if row["strategy"] in rates:
+                rounds, hit_rate, expected = rates[row["strategy"]]
+                edge_color = "#2e7d32" if hit_rate > expected else ("#c62828" if hit_rate < expected else "inherit")
+                rate_cells = f"<td>{rounds}</td><td style='color: {edge_color}; font-weight: bold;'>{hit_rate:.1%}</td><td>{expected:.1%}</td>"
+            else:
+                rate_cells = "<td>0</td><td>-</td><td>-</td>"
+            html += (
+                f"<tr><td style='text-align: left;'>{row['strategy']}</td><td>{row['coverage']}/37</td>"
+                f"<td>{row['overlap']}</td><td>{row['shared']}</td>{rate_cells}"
+                f"<td>{row['stake']}</td><td>{row['std_dev']:.2f}</td></tr>"
+            )
+        html += "</table>"
+        html += "<p style='font-size: 12px;'>Coverage: numbers bet on. Overlap: numbers bet more than once. Shared: covered numbers also covered by another strategy. Rounds and Hit Rate: spins so far scored against the bets recommended before each one (no look-ahead). Expected: hit rate of random bets with the same coverage as those rounds. Stake and Std Dev/Spin: units bet and spread of the net result with 1 unit per recommended bet.</p>"
+        return html
+    except Exception as e:
+        print(f"render_strategy_dashboard: Error: {str(e)}")
+        return f"<p>Error comparing strategies: {str(e)}</p>"
+
+def render_strategy_backtest(neighbours_count, strong_numbers_count):
+    """Replay the current session through every strategy and show units won or lost."""
+    try:
+        if len(state.last_spins) < 2:
+            return "<p>Need at least 2 spins to backtest the strategies.</p>"
+        try:
+            neighbours_count = int(neighbours_count)
+            strong_numbers_count = int(strong_numbers_count)
+        except (ValueError, TypeError):
+            neighbours_count, strong_numbers_count = 2, 1
+        summaries = backtest_all(state.last_spins, neighbours_count, strong_numbers_count, custom_strategies=state.custom_strategies)
+        summaries.sort(key=lambda summary: summary["units_won"], reverse=True)
+
+        html = f"<p>Backtest over {len(state.last_spins)} spins, 1 unit on every recommended bet before each spin.</p>"
+        html += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif; width: 100%;">'
+        html += "<tr><th>Strategy</th><th>Units Won</th><th>Units Staked</th><th>Return/Unit</th><th>Hit Rate</th><th>Max Drawdown</th></tr>"
+        for summary in summaries:
+            units_color = "#2e7d32" if summary["units_won"] > 0 else ("#c62828" if summary["units_won"] < 0 else "inherit")
+            html += (
+                f"<tr><td style='text-align: left;'>{summary['strategy']}</td>"
+                f"<td style='color: {units_color}; font-weight: bold;'>{summary['units_won']}</td><td>{summary['units_staked']}</td>"
+                f"<td>{summary['return_per_unit']:.3f}</td><td>{summary['hit_rate']:.1%}</td><td>{summary['max_drawdown']}</td></tr>"
+            )
+        html += "</table>"
+        return html
+    except Exception as e:
+        print(f"render_strategy_backtest: Error: {str(e)}")
+        return f"<p>Error backtesting strategies: {str(e)}</p>"
+
+def render_randomness_battery():
+    """Run the randomness test battery on every spin of the session."""
+    try:
+        if len(state.last_spins) < 2:
+            return "<p>Need at least 2 spins to run the randomness tests.</p>"
+        rows = run_battery(state.last_spins)
+        verdict_colors = {"Fail": "#c62828", "Suspicious": "#ef6c00", "Pass": "#2e7d32"}
+        html = f"<p>Randomness tests over {len(state.last_spins)} spins (zeros are left out of the Red/Black and Even/Odd tests).</p>"
+        html += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif; width: 100%;">'
+        html += "<tr><th>Test</th><th>Statistic</th><th>p-value</th><th>Verdict</th><th>Detail</th></tr>"
+        for row in rows:
+            statistic = f"{row['statistic']:.3f}" if row["statistic"] is not None else "-"
+            p_value = f"{row['p_value']:.4f}" if row["p_value"] is not None else "-"
+            color = verdict_colors.get(row["verdict"], "inherit")
+            html += (
+                f"<tr><td style='text-align: left;'>{row['test']}</td><td>{statistic}</td><td>{p_value}</td>"
+                f"<td style='color: {color}; font-weight: bold;'>{row['verdict']}</td><td>{row['detail']}</td></tr>"
+            )
+        html += "</table>"
+        html += "<p>About 1 test in 20 is Suspicious and 1 in 100 Fails on a fair wheel; only a result that repeats on fresh spins points to a pattern.</p>"
+        return html
+    except Exception as e:
+        print(f"render_randomness_battery: Error: {str(e)}")
+        return f"<p>Error running randomness tests: {str(e)}</p>"
+
+def evaluate_custom_rule(rule):
+    """Show which numbers a custom strategy rule selects on the current scores."""
+    try:
+        rule = (rule or "").strip()
+        if not rule:
+            return "<p>Please enter a rule, e.g. top 2 dozens ∩ not(top street) ∪ neighbours(top 3, 2).</p>"
+        numbers = mask_numbers(compile_rule(rule)(state))
+        total_spins = sum(state.scores.values())
+        html = f"<p><b>{escape_html(rule)}</b> selects {len(numbers)}/37 numbers: {', '.join(str(num) for num in numbers) or 'none'}</p>"
+        if total_spins:
+            hits = sum(state.scores[num] for num in numbers)
+            html += f"<p>Hit rate so far: {hits / total_spins:.1%} (expected {len(numbers) / 37:.1%} for the same coverage)</p>"
+        return html
+    except ValueError as e:
+        return f"<p>Invalid rule: {escape_html(str(e))}</p>"
+    except Exception as e:
+        print(f"evaluate_custom_rule: Error: {str(e)}")
+        return f"<p>Error evaluating rule: {str(e)}</p>"
+
+def add_custom_rule_strategy(name, rule, neighbours_count, strong_numbers_count):
+    """Register a custom rule as a strategy so the dashboard and backtests include it."""
+    try:
+        register_rule_strategy(state.custom_strategies, name or "", (rule or "").strip())
+        # A replaced rule must not reuse results cached under the same name
+        state.analysis_cache.clear()
+        return f"<p>Added '{escape_html(name.strip())}' to the strategy dashboard.</p>", render_strategy_dashboard(neighbours_count, strong_numbers_count)
+    except ValueError as e:
+        return f"<p>Could not add rule: {escape_html(str(e))}</p>", render_strategy_dashboard(neighbours_count, strong_numbers_count)
+    except Exception as e:
+        print(f"add_custom_rule_strategy: Error: {str(e)}")
+        return f"<p>Error adding rule: {str(e)}</p>", render_strategy_dashboard(neighbours_count, strong_numbers_count)
+
+def simulate_progression_outcomes(n_sessions, max_spins, sequence):
+    """Monte Carlo outcome distribution for the progression currently configured in the tracker."""
+    try:
+        n_sessions = max(1, int(n_sessions))
+        max_spins = max(1, int(max_spins))
+        # The server is shared, so oversized runs are cut down instead of exhausting memory
+        clamped = []
+        if n_sessions > MAX_SESSIONS:
+            n_sessions = MAX_SESSIONS
+            clamped.append(f"sessions capped at {MAX_SESSIONS:,}")
+        if max_spins > MAX_SPINS:
+            max_spins = MAX_SPINS
+            clamped.append(f"spins per session capped at {MAX_SPINS:,}")
+        try:
+            labouchere = [int(x.strip()) for x in sequence.split(",")] or [1, 2, 3, 4]
+        except (ValueError, AttributeError):
+            labouchere = [1, 2, 3, 4]
+        result = simulate_progression(
+            state.progression, state.bet_type, state.initial_bankroll, state.base_unit, state.stop_loss, state.stop_win,
+            n_sessions=n_sessions, max_spins=max_spins, labouchere_sequence=labouchere
+        )
+        summary = summarize_simulation(result, state.initial_bankroll)
+        html = f"<p><b>{state.progression}</b> on {state.bet_type}: {summary['sessions']:,} sessions of up to {max_spins} spins.</p>"
+        if clamped:
+            html += f"<p><i>Request too large: {'; '.join(clamped)}.</i></p>"
+        html += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+        html += "<tr><th>Outcome</th><th>Probability</th></tr>"
+        for name, probability in summary["probabilities"].items():
+            html += f"<tr><td>{name}</td><td>{probability:.2%}</td></tr>"
+        html += "</table>"
+        percentiles = ", ".join(f"{k}: {v:+.0f}" for k, v in summary["profit_percentiles"].items())
+        html += f"<p>Mean profit: {summary['mean_profit']:+.2f} | Profit percentiles: {percentiles} | Mean spins played: {summary['mean_spins']:.1f}</p>"
+        return html
+    except Exception as e:
+        print(f"simulate_progression_outcomes: Error: {str(e)}")
+        return f"<p>Error running simulation: {str(e)}</p>"
+
+def analyze_progression_exact(max_spins):
+    """Exact stop win / stop loss / ruin probabilities for the configured progression."""
+    try:
+        if state.progression in SIMULATION_ONLY:
+            return f"<p>{state.progression} is simulation-only (its state space is too large to solve exactly); use Simulate Outcomes instead.</p>"
+        max_spins = max(1, int(max_spins))
+        result = analyze_progression(
+            state.progression, state.bet_type, state.initial_bankroll, state.base_unit, state.stop_loss, state.stop_win,
+            max_spins=max_spins
+        )
+        html = f"<p><b>{state.progression}</b> on {state.bet_type}: exact probabilities within {max_spins} spins.</p>"
+        html += '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+        html += "<tr><th>Outcome</th><th>Probability</th></tr>"
+        for label, key in [("Stop Win", "stop_win"), ("Stop Loss", "stop_loss"), ("Insufficient Bankroll", "ruin"), ("Still Active", "active")]:
+            html += f"<tr><td>{label}</td><td>{result[key]:.4%}</td></tr>"
+        html += "</table>"
+        html += f"<p>Expected spins played: {result['expected_spins']:.2f}</p>"
+        return html
+    except ValueError as e:
+        return f"<p>{str(e)}</p>"
+    except Exception as e:
+        print(f"analyze_progression_exact: Error: {str(e)}")
+        return f"<p>Error running exact analysis: {str(e)}</p>"
+
 def clear_outputs():
     return "", "", "", "", "", "", "", "", "", "", "", "", "", "", ""
 
@@ -3814,6 +2490,8 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
             value=render_sides_of_zero_display(),
             elem_classes=["sides-of-zero-container"]
         )
+        randomness_button = gr.Button("Run Randomness Tests", elem_id="randomness-btn")
+        randomness_output = gr.HTML(label="Randomness Tests")
     last_spin_display = gr.HTML(
         label="Last Spins",
         value='<h4>Last Spins</h4><p>No spins yet.</p>',
@@ -3885,15 +2563,15 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
 
     # Define strategy categories and choices
     strategy_categories = {
-        "Trends": ["Cold Bet Strategy", "Hot Bet Strategy", "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", "Best Columns + Best Even Money Bets + Top Pick 18 Numbers"],
+        "Trends": ["Cold Bet Strategy", "Hot Bet Strategy", "Sleepers", "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", "Best Columns + Best Even Money Bets + Top Pick 18 Numbers"],
         "Even Money Strategies": ["Best Even Money Bets", "Best Even Money Bets + Top Pick 18 Numbers", "Fibonacci To Fortune"],
-        "Dozen Strategies": ["1 Dozen +1 Column Strategy", "Best Dozens", "Best Dozens + Top Pick 18 Numbers", "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", "Best Dozens + Best Streets", "Fibonacci Strategy", "Romanowksy Missing Dozen"],
+        "Dozen Strategies": ["1 Dozen +1 Column Strategy", "Best Dozens", "Best Dozens + Top Pick 18 Numbers", "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers", "Best Dozens + Best Streets", "Dozen Tracker", "Fibonacci Strategy", "Romanowksy Missing Dozen"],
         "Column Strategies": ["1 Dozen +1 Column Strategy", "Best Columns", "Best Columns + Top Pick 18 Numbers", "Best Columns + Best Even Money Bets + Top Pick 18 Numbers", "Best Columns + Best Streets"],
         "Street Strategies": ["3-8-6 Rising Martingale", "Best Streets", "Best Columns + Best Streets", "Best Dozens + Best Streets"],
         "Double Street Strategies": ["Best Double Streets", "Non-Overlapping Double Street Strategy"],
         "Corner Strategies": ["Best Corners", "Non-Overlapping Corner Strategy"],
         "Split Strategies": ["Best Splits"],
-        "Number Strategies": ["Top Numbers with Neighbours (Tiered)", "Top Pick 18 Numbers without Neighbours"],
+        "Number Strategies": ["Top Numbers with Neighbours (Tiered)", "Top Pick 18 Numbers without Neighbours", "Hottest Wheel Sector", "Bayesian Hot Numbers", "Dealer Signature", "Sleepers"],
         "Neighbours Strategies": ["Neighbours of Strong Number"]
     }
     category_choices = ["None"] + sorted(strategy_categories.keys())
@@ -4088,6 +2766,11 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                     value=False,
                     interactive=True
                 )
+                auto_casino_data_checkbox = gr.Checkbox(
+                    label="Auto-Fill from Session Spins (uses Past Spins Count)",
+                    value=False,
+                    interactive=True
+                )
                 reset_casino_data_button = gr.Button(
                     "Reset Casino Data",
                     elem_classes=["action-button"]
@@ -4226,6 +2909,59 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                         label="Even Money Tracker",
                         value="<p>Select categories to track and analyze spins to see even money bet history.</p>"
                     )
+                with gr.Accordion("Any Bet Family", open=False, elem_id="pattern-tracker"):
+                    pattern_tracker_grouping_dropdown = gr.Dropdown(
+                        label="Grouping to Track",
+                        choices=state.pattern_trackers.names(),
+                        value="Columns",
+                        interactive=True
+                    )
+                    pattern_tracker_spins_dropdown = gr.Dropdown(
+                        label="Number of Spins to Track",
+                        choices=["5", "10", "15", "20", "25", "30", "40", "50", "75", "100", "150", "200"],
+                        value="20",
+                        interactive=True
+                    )
+                    pattern_tracker_streak_dropdown = gr.Dropdown(
+                        label="Alert on Consecutive Hits",
+                        choices=["2", "3", "4", "5", "6", "7", "8"],
+                        value="3",
+                        interactive=True
+                    )
+                    pattern_tracker_alert_checkbox = gr.Checkbox(
+                        label="Enable Consecutive Hits Alert",
+                        value=False,
+                        interactive=True
+                    )
+                    pattern_tracker_sequence_length_dropdown = gr.Dropdown(
+                        label="Sequence Length to Match (X)",
+                        choices=["2", "3", "4", "5"],
+                        value="3",
+                        interactive=True
+                    )
+                    pattern_tracker_follow_up_spins_dropdown = gr.Dropdown(
+                        label="Follow-Up Spins to Track (Y)",
+                        choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+                        value="3",
+                        interactive=True
+                    )
+                    with gr.Row():
+                        pattern_grouping_name_input = gr.Textbox(label="Custom Grouping Name", placeholder="e.g., Wheel Thirds")
+                        pattern_grouping_input = gr.Textbox(
+                            label="Custom Groups",
+                            placeholder="e.g., Voisins: 22, 18, 29, 7, 28; Tiers: 27, 13, 36, 11, 30; Orphelins: 1, 20, 14, 31, 9"
+                        )
+                    with gr.Row():
+                        pattern_tracker_button = gr.Button("Track Patterns", variant="primary")
+                        add_pattern_grouping_button = gr.Button("Add Custom Grouping", variant="secondary")
+                    pattern_tracker_output = gr.HTML(
+                        label="Pattern Tracker",
+                        value="<p>Choose a grouping and analyze spins to see its streaks and repeated sequences.</p>"
+                    )
+                    pattern_tracker_inputs = [
+                        pattern_tracker_grouping_dropdown, pattern_tracker_spins_dropdown, pattern_tracker_streak_dropdown,
+                        pattern_tracker_alert_checkbox, pattern_tracker_sequence_length_dropdown, pattern_tracker_follow_up_spins_dropdown
+                    ]
         with gr.Column(scale=2):
             pass  # Empty column to maintain layout balance
 
@@ -4264,6 +3000,12 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
             with gr.Row():
                 message_output = gr.Textbox(label="Message", value="Start with base bet of 10 on Even Money (Martingale)", interactive=False)
                 status_output = gr.HTML(label="Status", value='<div style="background-color: white; padding: 5px; border-radius: 3px;">Active</div>') 
+            with gr.Row():
+                simulation_sessions_input = gr.Number(label="Simulated Sessions", value=10000, precision=0)
+                simulation_spins_input = gr.Number(label="Max Spins per Session", value=500, precision=0)
+                simulate_button = gr.Button("Simulate Outcomes")
+                exact_analysis_button = gr.Button("Exact Analysis")
+            simulation_output = gr.HTML(label="Simulation Results")
                 
     # 9. Row 9: Color Code Key (Collapsible, with Color Pickers Inside)
     with gr.Accordion("Color Code Key", open=False, elem_id="color-code-key"):
@@ -4319,6 +3061,25 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                 visible=False  # Hide the textbox
             )
 
+    with gr.Accordion("Strategy Comparison Dashboard 📊", open=False, elem_id="strategy-dashboard"):
+        strategy_dashboard_output = gr.HTML(
+            label="Strategy Comparison",
+            value=render_strategy_dashboard(2, 1)
+        )
+        backtest_button = gr.Button("Backtest All Strategies on Current Spins", elem_id="backtest-btn")
+        backtest_output = gr.HTML(label="Strategy Backtest")
+        with gr.Row():
+            custom_rule_input = gr.Textbox(
+                label="Custom Strategy Rule",
+                placeholder="top 2 dozens ∩ not(top street) ∪ neighbours(top 3, 2)",
+                scale=3
+            )
+            custom_rule_name_input = gr.Textbox(label="Strategy Name", value="My Custom Strategy", scale=1)
+        with gr.Row():
+            evaluate_rule_button = gr.Button("Evaluate Rule", elem_id="evaluate-rule-btn")
+            add_rule_button = gr.Button("Add Rule to Dashboard", elem_id="add-rule-btn")
+        custom_rule_output = gr.HTML(label="Custom Rule")
+
     with gr.Accordion("Aggregated Scores", open=False, elem_id="aggregated-scores"):
         with gr.Row():
             with gr.Column():
@@ -4354,7 +3115,17 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
         with gr.Row():
             save_button = gr.Button("Save Session", elem_id="save-session-btn")
             load_input = gr.File(label="Upload Session")
+        compress_session_checkbox = gr.Checkbox(label="Compress Save File (gzip)", value=False)
         save_output = gr.File(label="Download Session")
+        with gr.Row():
+            export_format_dropdown = gr.Dropdown(
+                label="Export Spin History Format",
+                choices=list(EXPORT_FORMATS.keys()),
+                value="Parquet",
+                interactive=True
+            )
+            export_history_button = gr.Button("Export Annotated Spin History", elem_id="export-history-btn")
+        export_output = gr.File(label="Download Spin History")
 
     # 11. Row 11: Top Strategies with Roulette Spin Analyzer (Moved to be Independent)
     with gr.Row():
@@ -4776,6 +3547,14 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                 even_money_tracker_consecutive_identical_dropdown
             ],
             outputs=[gr.State(), even_money_tracker_output]
+        ).then(
+            fn=pattern_tracker,
+            inputs=pattern_tracker_inputs,
+            outputs=[pattern_tracker_output]
+        ).then(
+            fn=render_strategy_dashboard,
+            inputs=[neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[strategy_dashboard_output]
         )
     except Exception as e:
         print(f"Error in spins_textbox.change handler: {str(e)}")
@@ -4810,7 +3589,8 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                 spins_display, spins_textbox, spin_analysis_output, last_spin_display,
                 even_money_output, dozens_output, columns_output, streets_output,
                 corners_output, six_lines_output, splits_output, sides_output,
-                straight_up_html, top_18_html, strongest_numbers_output, spin_counter
+                straight_up_html, top_18_html, strongest_numbers_output, spin_counter,
+                sides_of_zero_display
             ]
         ).then(
             fn=clear_outputs,
@@ -4823,7 +3603,7 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
             ]
         ).then(
             fn=dozen_tracker,
-            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, kbox],
+            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, dozen_tracker_sequence_alert_checkbox],
             outputs=[gr.State(), dozen_tracker_output, dozen_tracker_sequence_output]
         )
     except Exception as e:
@@ -4941,19 +3721,90 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                 even_money_tracker_consecutive_identical_dropdown
             ],
             outputs=[gr.State(), even_money_tracker_output]
+        ).then(
+            fn=pattern_tracker,
+            inputs=pattern_tracker_inputs,
+            outputs=[pattern_tracker_output]
+        ).then(
+            fn=render_strategy_dashboard,
+            inputs=[neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[strategy_dashboard_output]
         )
     except Exception as e:
         print(f"Error in analyze_button.click handler: {str(e)}")
 
+    try:
+        backtest_button.click(
+            fn=render_strategy_backtest,
+            inputs=[neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[backtest_output]
+        )
+    except Exception as e:
+        print(f"Error in backtest_button.click handler: {str(e)}")
+
+    try:
+        randomness_button.click(
+            fn=render_randomness_battery,
+            inputs=[],
+            outputs=[randomness_output]
+        )
+    except Exception as e:
+        print(f"Error in randomness_button.click handler: {str(e)}")
+
+    try:
+        evaluate_rule_button.click(
+            fn=evaluate_custom_rule,
+            inputs=[custom_rule_input],
+            outputs=[custom_rule_output]
+        )
+    except Exception as e:
+        print(f"Error in evaluate_rule_button.click handler: {str(e)}")
+
+    try:
+        add_rule_button.click(
+            fn=add_custom_rule_strategy,
+            inputs=[custom_rule_name_input, custom_rule_input, neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[custom_rule_output, strategy_dashboard_output]
+        )
+    except Exception as e:
+        print(f"Error in add_rule_button.click handler: {str(e)}")
+
+    try:
+        pattern_tracker_button.click(
+            fn=pattern_tracker,
+            inputs=pattern_tracker_inputs,
+            outputs=[pattern_tracker_output]
+        )
+    except Exception as e:
+        print(f"Error in pattern_tracker_button.click handler: {str(e)}")
+
+    try:
+        add_pattern_grouping_button.click(
+            fn=add_pattern_grouping,
+            inputs=[pattern_grouping_name_input, pattern_grouping_input] + pattern_tracker_inputs[1:],
+            outputs=[pattern_tracker_grouping_dropdown, pattern_tracker_output]
+        )
+    except Exception as e:
+        print(f"Error in add_pattern_grouping_button.click handler: {str(e)}")
+
     try:
         save_button.click(
             fn=save_session,
-            inputs=[],
+            inputs=[compress_session_checkbox],
             outputs=[save_output]
         )
     except Exception as e:
         print(f"Error in save_button.click handler: {str(e)}")
 
+    try:
+        export_history_button.click(
+            fn=export_history,
+            inputs=[export_format_dropdown],
+            outputs=[export_output]
+        )
+    except Exception as e:
+        print(f"Error in export_history_button.click handler: {str(e)}")
+
     try:
         load_input.change(
             fn=load_session,
@@ -4967,6 +3818,10 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
             fn=lambda strategy, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color: create_dynamic_table(strategy if strategy != "None" else None, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color),
             inputs=[strategy_dropdown, neighbours_count_slider, strong_numbers_count_slider, dozen_tracker_spins_dropdown, top_color_picker, middle_color_picker, lower_color_picker],
             outputs=[dynamic_table_output]
+        ).then(
+            fn=render_strategy_dashboard,
+            inputs=[neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[strategy_dashboard_output]
         ).then(
             fn=format_spins_as_html,
             inputs=[spins_display, last_spin_count],
@@ -4977,7 +3832,7 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
             outputs=[color_code_output]
         ).then(
             fn=dozen_tracker,
-            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, kbox],
+            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, dozen_tracker_sequence_alert_checkbox],
             outputs=[gr.State(), dozen_tracker_output, dozen_tracker_sequence_output]
         )
     except Exception as e:
@@ -4992,15 +3847,19 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
                 streets_output, corners_output, six_lines_output, splits_output,
                 sides_output, straight_up_html, top_18_html, strongest_numbers_output,
                 spins_textbox, spins_display, dynamic_table_output, strategy_output,
-                color_code_output, spin_counter
+                color_code_output, spin_counter, sides_of_zero_display
             ]
         ).then(
             fn=lambda strategy, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color: create_dynamic_table(strategy if strategy != "None" else None, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color),
             inputs=[strategy_dropdown, neighbours_count_slider, strong_numbers_count_slider, dozen_tracker_spins_dropdown, top_color_picker, middle_color_picker, lower_color_picker],
             outputs=[dynamic_table_output]
+        ).then(
+            fn=render_strategy_dashboard,
+            inputs=[neighbours_count_slider, strong_numbers_count_slider],
+            outputs=[strategy_dashboard_output]
         ).then(
             fn=dozen_tracker,
-            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, kbox],
+            inputs=[dozen_tracker_spins_dropdown, dozen_tracker_consecutive_hits_dropdown, dozen_tracker_alert_checkbox, dozen_tracker_sequence_length_dropdown, dozen_tracker_follow_up_spins_dropdown, dozen_tracker_sequence_alert_checkbox],
             outputs=[gr.State(), dozen_tracker_output, dozen_tracker_sequence_output]
         )
     except Exception as e:
@@ -5314,12 +4173,18 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
         ],
         outputs=[gr.State(), even_money_tracker_output]
     )
+    for component in pattern_tracker_inputs:
+        component.change(
+            fn=pattern_tracker,
+            inputs=pattern_tracker_inputs,
+            outputs=[pattern_tracker_output]
+        )
 
     # Casino data event handlers
     inputs_list = [
         spins_count_dropdown, even_percent, odd_percent, red_percent, black_percent,
         low_percent, high_percent, dozen1_percent, dozen2_percent, dozen3_percent,
-        col1_percent, col2_percent, col3_percent, use_winners_checkbox
+        col1_percent, col2_percent, col3_percent, use_winners_checkbox, auto_casino_data_checkbox
     ]
     try:
         spins_count_dropdown.change(
@@ -5451,17 +4316,30 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
     except Exception as e:
         print(f"Error in use_winners_checkbox.change handler: {str(e)}")
 
+    try:
+        auto_casino_data_checkbox.change(
+            fn=update_casino_data,
+            inputs=inputs_list,
+            outputs=[casino_data_output]
+        ).then(
+            fn=lambda strategy, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color: create_dynamic_table(strategy if strategy != "None" else None, neighbours_count, strong_numbers_count, dozen_tracker_spins, top_color, middle_color, lower_color),
+            inputs=[strategy_dropdown, neighbours_count_slider, strong_numbers_count_slider, dozen_tracker_spins_dropdown, top_color_picker, middle_color_picker, lower_color_picker],
+            outputs=[dynamic_table_output]
+        )
+    except Exception as e:
+        print(f"Error in auto_casino_data_checkbox.change handler: {str(e)}")
+
     try:
         reset_casino_data_button.click(
             fn=lambda: (
-                "100", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", False,
+                "100", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", "00", False, False,
                 "<p>Casino data reset to defaults.</p>"
             ),
             inputs=[],
             outputs=[
                 spins_count_dropdown, even_percent, odd_percent, red_percent, black_percent,
                 low_percent, high_percent, dozen1_percent, dozen2_percent, dozen3_percent,
-                col1_percent, col2_percent, col3_percent, use_winners_checkbox, casino_data_output
+                col1_percent, col2_percent, col3_percent, use_winners_checkbox, auto_casino_data_checkbox, casino_data_output
             ]
         ).then(
             fn=create_dynamic_table,
@@ -5482,9 +4360,10 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
         state.progression = progression
         if progression == "Labouchere":
             try:
-                state.progression_state = [int(x.strip()) for x in sequence.split(",")]
+                state.labouchere_sequence = [int(x.strip()) for x in sequence.split(",")]
             except ValueError:
-                state.progression_state = [1, 2, 3, 4]  # Default sequence on error
+                state.labouchere_sequence = [1, 2, 3, 4]  # Default sequence on error
+                state.reset_progression()
                 return bankroll, base_unit, base_unit, "Invalid sequence, using default [1, 2, 3, 4]", '<div style="background-color: white; padding: 5px; border-radius: 3px;">Active</div>'
         state.reset_progression()
         return state.bankroll, state.current_bet, state.next_bet, state.message, f'<div style="background-color: {state.status_color}; padding: 5px; border-radius: 3px;">{state.status}</div>'
@@ -5574,6 +4453,24 @@ with gr.Blocks(title="Roulette Spin Analyzer") as demo:
     except Exception as e:
         print(f"Error in lose_button.click handler: {str(e)}")
 
+    try:
+        simulate_button.click(
+            fn=simulate_progression_outcomes,
+            inputs=[simulation_sessions_input, simulation_spins_input, labouchere_sequence],
+            outputs=[simulation_output]
+        )
+    except Exception as e:
+        print(f"Error in simulate_button.click handler: {str(e)}")
+
+    try:
+        exact_analysis_button.click(
+            fn=analyze_progression_exact,
+            inputs=[simulation_spins_input],
+            outputs=[simulation_output]
+        )
+    except Exception as e:
+        print(f"Error in exact_analysis_button.click handler: {str(e)}")
+
     try:
         reset_progression_button.click(
             fn=lambda: state.reset_progression(),
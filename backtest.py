@@ -0,0 +1,244 @@
+# backtest.py
+"""Replay a spin history through a strategy and settle its bets spin by spin.
+
+ScoreBoard is an incremental scoring engine exposing the same score attributes
+as RouletteState (plus version/analysis_cache), so the strategies in
+strategies.py run against it unchanged. Each push() is a handful of dict
+increments from a per-pocket table; nothing is re-scanned. The heavier
+trackers (wheel_sectors, gaps, dealer_signature, posterior) are only built
+for the strategies that list them under "needs" in STRATEGIES.
+
+StrategyTally keeps the out-of-sample hit rate of every strategy for a live
+session: each spin is scored against the bets recommended before it, as in a
+backtest, but the replay only catches up on the spins added since it was
+last read.
+"""
+from roulette_data import BET_FAMILIES
+from dealer_signature import DealerSignature
+from gap_tracker import GapTracker
+from payouts import BET_LOOKUP
+from pocket_posterior import PocketPosterior
+from strategies import STRATEGIES, evaluate_strategy, bet_numbers, find_strategy, strategy_names
+from wheel_sectors import WheelSectorTracker
+
+# RouletteState keeps each family's scores in "<kind>_scores" (straight-ups in plain "scores")
+_SCORE_SECTIONS = [(f"{kind}_scores", sections) for kind, sections in BET_FAMILIES.items() if kind != "number"]
+
+# Trackers a strategy can ask for, by state attribute: (class, whether pop() takes the spin)
+TRACKERS = {
+    "wheel_sectors": (WheelSectorTracker, True),
+    "gaps": (GapTracker, False),
+    "dealer_signature": (DealerSignature, False),
+    "posterior": (PocketPosterior, True)
+}
+
+
+class ScoreBoard:
+    """Incremental scores with push/pop, duck-typed to RouletteState for the strategies."""
+    __slots__ = ("scores", "even_money_scores", "dozen_scores", "column_scores", "street_scores",
+                 "corner_scores", "six_line_scores", "split_scores", "side_scores",
+                 "last_spins", "wheel_sectors", "gaps", "dealer_signature", "posterior", "version", "analysis_cache",
+                 "custom_strategies", "_increments", "_trackers")
+
+    def __init__(self, spins=(), needs=tuple(TRACKERS), custom_strategies=None):
+        self.scores = {n: 0 for n in range(37)}
+        for attr, sections in _SCORE_SECTIONS:
+            setattr(self, attr, {name: 0 for name in sections})
+        self.last_spins = []
+        # Trackers nobody reads stay None and cost nothing per spin
+        self._trackers = []
+        for name, (tracker_class, pop_takes_spin) in TRACKERS.items():
+            tracker = tracker_class() if name in needs else None
+            setattr(self, name, tracker)
+            if tracker is not None:
+                self._trackers.append((tracker, pop_takes_spin))
+        self.version = 0
+        self.analysis_cache = {}
+        # A session's own rule strategies, looked up like RouletteState.custom_strategies
+        self.custom_strategies = custom_strategies if custom_strategies is not None else {}
+        # For each pocket, the (score dict, key) pairs one spin of it increments
+        self._increments = []
+        for pocket in range(37):
+            pairs = [(self.scores, pocket)]
+            for attr, sections in _SCORE_SECTIONS:
+                score_dict = getattr(self, attr)
+                pairs.extend((score_dict, name) for name, numbers in sections.items() if pocket in numbers)
+            self._increments.append(pairs)
+        for spin in spins:
+            self.push(spin)
+
+    def push(self, spin):
+        spin = int(spin)
+        for score_dict, key in self._increments[spin]:
+            score_dict[key] += 1
+        for tracker, _ in self._trackers:
+            tracker.push(spin)
+        self.last_spins.append(spin)
+        self.version += 1
+
+    def pop(self):
+        spin = self.last_spins.pop()
+        for score_dict, key in self._increments[spin]:
+            score_dict[key] -= 1
+        for tracker, pop_takes_spin in self._trackers:
+            if pop_takes_spin:
+                tracker.pop(spin)
+            else:
+                tracker.pop()
+        self.version += 1
+        return spin
+
+
+def settle(bets, spin):
+    """Net units for one unit staked on each bet when `spin` comes in. Returns (net, staked, hit)."""
+    bit = 1 << spin
+    net = 0
+    try:
+        for kind, name, _, _ in bets:
+            payout, mask = BET_LOOKUP[(kind, name)]
+            net += payout if mask & bit else -1
+    except KeyError:
+        raise ValueError(f"Unknown bet '{name}' of kind '{kind}'.") from None
+    staked = len(bets)
+    # Nothing hit only when the whole stake is lost
+    return net, staked, net > -staked
+
+
+def backtest_strategy(spins, strategy_name, neighbours_count=2, strong_numbers_count=1, warmup=1, keep_curve=False,
+                      params=None, custom_strategies=None):
+    """Replay spins through one strategy, betting one unit per recommended bet.
+
+    Before each spin the strategy is evaluated on the scores of the spins already
+    seen (no look-ahead); its bets are then settled against that spin. The first
+    `warmup` spins only build up scores. params sets the strategy's own knobs
+    (see evaluate_strategy); custom_strategies adds a session's rule strategies.
+    Only the bets are asked for, so strategies skip their display text.
+    """
+    needs = find_strategy(strategy_name, custom_strategies).get("needs", ())
+    board = ScoreBoard(needs=needs, custom_strategies=custom_strategies)
+    units = 0
+    peak = 0
+    max_drawdown = 0
+    staked = 0
+    rounds = 0
+    hits = 0
+    curve = [] if keep_curve else None
+    for index, spin in enumerate(spins):
+        spin = int(spin)
+        if index >= warmup:
+            bets = evaluate_strategy(board, strategy_name, neighbours_count, strong_numbers_count, params, with_text=False).bets
+            if bets:
+                net, stake, hit = settle(bets, spin)
+                units += net
+                staked += stake
+                rounds += 1
+                hits += hit
+                if units > peak:
+                    peak = units
+                elif peak - units > max_drawdown:
+                    max_drawdown = peak - units
+            if keep_curve:
+                curve.append(units)
+        board.push(spin)
+    summary = {
+        "strategy": strategy_name,
+        "spins": len(board.last_spins),
+        "rounds_bet": rounds,
+        "units_staked": staked,
+        "units_won": units,
+        "return_per_unit": units / staked if staked else 0.0,
+        "hit_rate": hits / rounds if rounds else 0.0,
+        "max_drawdown": max_drawdown
+    }
+    if keep_curve:
+        summary["equity_curve"] = curve
+    return summary
+
+
+def backtest_all(spins, neighbours_count=2, strong_numbers_count=1, warmup=1, custom_strategies=None):
+    """Backtest every strategy (and any custom ones) on the same spins. Returns a list of summaries."""
+    spins = [int(s) for s in spins]
+    return [
+        backtest_strategy(spins, name, neighbours_count, strong_numbers_count, warmup, custom_strategies=custom_strategies)
+        for name in strategy_names(custom_strategies)
+    ]
+
+
+class StrategyTally:
+    """Out-of-sample hit counts of every strategy, pushed and popped with the session's spins.
+
+    push() only queues the spin; rates() evaluates the strategies on the spins
+    before each queued one and settles it, so nothing runs until the counts are
+    read. Each settled spin keeps its per-strategy (coverage, hit) record so
+    pop() can take it back off the totals.
+    """
+    __slots__ = ("custom_strategies", "params", "board", "pending", "records", "totals")
+
+    def __init__(self, spins=(), custom_strategies=None):
+        # Shared with the session, so rules it adds later are picked up by rates()
+        self.custom_strategies = custom_strategies if custom_strategies is not None else {}
+        self.params = None
+        self.rebuild(spins)
+
+    def rebuild(self, spins):
+        """Start over from a spin list; the replay happens on the next rates() call."""
+        self.board = ScoreBoard(custom_strategies=self.custom_strategies)
+        self.pending = [int(spin) for spin in spins]
+        self.records = []
+        # strategy -> [rounds bet, hits, pockets covered summed over those rounds]
+        self.totals = {}
+
+    def push(self, spin):
+        self.pending.append(int(spin))
+
+    def pop(self):
+        if self.pending:
+            return self.pending.pop()
+        if not self.records:
+            return None
+        for name, coverage, hit in self.records.pop():
+            total = self.totals[name]
+            total[0] -= 1
+            total[1] -= hit
+            total[2] -= coverage
+        return self.board.pop()
+
+    def _settle(self, spin, neighbours_count, strong_numbers_count):
+        record = []
+        for name in strategy_names(self.custom_strategies):
+            bets = evaluate_strategy(self.board, name, neighbours_count, strong_numbers_count, with_text=False).bets
+            if not bets:
+                continue
+            mask = 0
+            for kind, bet_name, _, _ in bets:
+                for num in bet_numbers(kind, bet_name):
+                    mask |= 1 << num
+            coverage = bin(mask).count("1")
+            hit = mask >> spin & 1
+            total = self.totals.setdefault(name, [0, 0, 0])
+            total[0] += 1
+            total[1] += hit
+            total[2] += coverage
+            record.append((name, coverage, hit))
+        self.records.append(record)
+        self.board.push(spin)
+
+    def rates(self, neighbours_count=2, strong_numbers_count=1):
+        """{strategy: (rounds bet, hit rate, expected hit rate)} over every spin so far.
+
+        The expected rate is the mean coverage / 37 of the bets actually placed,
+        what a random layout of the same sizes would have hit.
+        """
+        rules = tuple((name, strategy.get("rule")) for name, strategy in self.custom_strategies.items())
+        params = (neighbours_count, strong_numbers_count, tuple(STRATEGIES), rules)
+        if params != self.params:
+            # Counts made under other settings (or another strategy list) do not carry over
+            self.rebuild(self.board.last_spins + self.pending)
+            self.params = params
+        pending, self.pending = self.pending, []
+        for spin in pending:
+            self._settle(spin, neighbours_count, strong_numbers_count)
+        return {
+            name: (rounds, hits / rounds, covered / rounds / 37)
+            for name, (rounds, hits, covered) in self.totals.items() if rounds
+        }
@@ -0,0 +1,119 @@
+# batch_backtest.py
+"""Run every (strategy, session) backtest across all cores.
+
+Sessions are concatenated into one flat spin archive (see spin_archive.py) with
+an offsets index next to it. Worker processes memory-map the archive once and
+slice their session out of it, so only tiny job tuples cross the process
+boundary instead of pickled spin lists.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backtest import backtest_strategy
+from session_files import read_session_file
+from spin_archive import ARCHIVE_EXTENSION, open_archive, write_archive
+from strategies import STRATEGIES
+
+OFFSETS_SUFFIX = ".offsets.npy"
+
+# Per-process archive view, opened once by the pool initializer
+_worker_archive = None
+
+
+def read_session_spins(path):
+    """Spins from a saved session file (plain or gzip-compressed JSON)."""
+    return [int(s) for s in read_session_file(path).get("spins", [])]
+
+
+def build_session_archive(sessions, path):
+    """Concatenate sessions (lists of spins) into one archive. Returns the offsets array.
+
+    Session i occupies archive[offsets[i]:offsets[i + 1]]; the offsets are also
+    saved beside the archive so workers can be pointed at the path alone.
+    """
+    offsets = [0]
+    with open(path, "wb"):
+        pass
+    for spins in sessions:
+        offsets.append(offsets[-1] + write_archive(path, spins, append=True))
+    offsets = np.asarray(offsets, dtype=np.int64)
+    np.save(path + OFFSETS_SUFFIX, offsets)
+    return offsets
+
+
+def load_offsets(path):
+    return np.load(path + OFFSETS_SUFFIX)
+
+
+def _init_worker(archive_path):
+    global _worker_archive
+    _worker_archive = open_archive(archive_path)
+
+
+def _run_job(job):
+    strategy_name, session_index, start, stop, neighbours_count, strong_numbers_count, warmup = job
+    spins = _worker_archive[start:stop].tolist()
+    summary = backtest_strategy(spins, strategy_name, neighbours_count, strong_numbers_count, warmup)
+    summary["session"] = session_index
+    return summary
+
+
+def run_backtests(archive_path, strategy_names=None, neighbours_count=2, strong_numbers_count=1,
+                  warmup=1, max_workers=None):
+    """Backtest each strategy on each archived session. Returns one DataFrame row per job."""
+    offsets = load_offsets(archive_path)
+    strategy_names = list(strategy_names or STRATEGIES)
+    jobs = [
+        (name, i, int(offsets[i]), int(offsets[i + 1]), neighbours_count, strong_numbers_count, warmup)
+        for i in range(len(offsets) - 1)
+        for name in strategy_names
+    ]
+    max_workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker keeps the pool balanced without per-job IPC overhead
+    chunksize = max(1, len(jobs) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(archive_path,)) as pool:
+        rows = list(pool.map(_run_job, jobs, chunksize=chunksize))
+    return pd.DataFrame(rows)
+
+
+def summarize_backtests(results):
+    """Merge per-session results into one row per strategy, best total first."""
+    grouped = results.groupby("strategy")
+    summary = pd.DataFrame({
+        "sessions": grouped["session"].count(),
+        "spins": grouped["spins"].sum(),
+        "units_won": grouped["units_won"].sum(),
+        "units_staked": grouped["units_staked"].sum(),
+        "winning_sessions": grouped["units_won"].apply(lambda units: int((units > 0).sum())),
+        "mean_units_per_session": grouped["units_won"].mean(),
+        "worst_drawdown": grouped["max_drawdown"].max()
+    })
+    summary["return_per_unit"] = summary["units_won"] / summary["units_staked"].where(summary["units_staked"] > 0)
+    return summary.sort_values("units_won", ascending=False).reset_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest all strategies across saved session files.")
+    parser.add_argument("sessions", nargs="+", help="Saved session files (.json or gzip-compressed)")
+    parser.add_argument("--archive", default="sessions" + ARCHIVE_EXTENSION, help="Where to write the combined spin archive")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--neighbours", type=int, default=2)
+    parser.add_argument("--strong-numbers", type=int, default=1)
+    parser.add_argument("--output", default=None, help="Optional CSV path for the per-strategy summary")
+    args = parser.parse_args()
+
+    build_session_archive((read_session_spins(p) for p in args.sessions), args.archive)
+    results = run_backtests(args.archive, neighbours_count=args.neighbours,
+                            strong_numbers_count=args.strong_numbers, max_workers=args.workers)
+    summary = summarize_backtests(results)
+    print(summary.to_string(index=False))
+    if args.output:
+        summary.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# bet_cover.py
+"""Highest-scoring sets of pairwise non-overlapping bets.
+
+best_cover() picks exactly `count` bets of one family (six lines, corners,
+streets, splits, dozens, columns, even-money bets or sides of zero) that
+share no pocket and have the largest total score. Bets are visited in order
+of their lowest pocket, so once bet i is reached no later bet can touch a
+pocket below it: the memo key only needs the used pockets at or above that
+point, which keeps the state space to a few rows of the layout and the solve
+to well under a millisecond for the table-sized families.
+"""
+from roulette_data import BET_FAMILIES
+
+
+def _mask(numbers):
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
+# Per family: (name, pocket mask, lowest pocket), ordered by lowest pocket (stable in layout order)
+_FAMILY_BETS = {
+    kind: tuple(sorted(((name, _mask(numbers), min(numbers)) for name, numbers in sections.items()), key=lambda bet: bet[2]))
+    # Straight-ups never overlap, so there is nothing to solve for them
+    for kind, sections in BET_FAMILIES.items() if kind != "number"
+}
+# Per family, for each bet i: the mask of pockets at or above its lowest pocket
+_FAMILY_FUTURE = {kind: tuple(~((1 << low) - 1) for _, _, low in bets) for kind, bets in _FAMILY_BETS.items()}
+
+
+def _capacities(bets):
+    """capacity[i]: the most pairwise-disjoint bets among bets[i:] (0 past the end)."""
+    memo = {}
+
+    def most(i, used):
+        if i == len(bets):
+            return 0
+        used &= ~((1 << bets[i][2]) - 1)
+        key = (i, used)
+        if key not in memo:
+            best = most(i + 1, used)
+            if not used & bets[i][1]:
+                best = max(best, 1 + most(i + 1, used | bets[i][1]))
+            memo[key] = best
+        return memo[key]
+    return tuple(most(i, 0) for i in range(len(bets))) + (0,)
+
+
+# Upper bound on what is still placeable, so solve() drops hopeless branches at once
+_FAMILY_CAPACITY = {kind: _capacities(bets) for kind, bets in _FAMILY_BETS.items()}
+
+
+def best_cover(score_dict, kind, count):
+    """Return (total_score, names) of the best `count` pairwise non-overlapping bets of a family.
+
+    Ties go to the bets earliest on the layout. Returns None when `count`
+    disjoint bets do not exist.
+    """
+    if kind not in _FAMILY_BETS:
+        raise ValueError(f"Unknown bet family '{kind}'.")
+    bets = _FAMILY_BETS[kind]
+    n_bets = len(bets)
+    scores = [score_dict.get(name, 0) for name, _, _ in bets]
+    masks = [mask for _, mask, _ in bets]
+    future = _FAMILY_FUTURE[kind]
+    capacity = _FAMILY_CAPACITY[kind]
+    unreachable = float("-inf")
+    memo = {}
+
+    def solve(i, used, remaining):
+        # Best total from bets i.. with `remaining` still to place
+        if remaining == 0:
+            return 0
+        if capacity[i] < remaining:
+            return unreachable
+        # Pockets below this bet can never be touched again
+        used &= future[i]
+        key = (i, used, remaining)
+        if key in memo:
+            return memo[key][0]
+        best, take = solve(i + 1, used, remaining), False
+        if not used & masks[i]:
+            total = solve(i + 1, used | masks[i], remaining - 1)
+            if total != unreachable:
+                total += scores[i]
+                if total >= best:
+                    best, take = total, True
+        memo[key] = (best, take)
+        return best
+
+    if count < 0:
+        raise ValueError("Bet count must be non-negative.")
+    remaining = count
+    if solve(0, 0, remaining) == unreachable:
+        return None
+
+    # Walk the recorded decisions to recover the chosen bets
+    names = []
+    used = 0
+    for i in range(n_bets):
+        if remaining == 0:
+            break
+        used &= future[i]
+        if memo.get((i, used, remaining), (None, False))[1]:
+            names.append(bets[i][0])
+            used |= masks[i]
+            remaining -= 1
+    return sum(score_dict.get(name, 0) for name in names), names
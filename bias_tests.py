@@ -0,0 +1,169 @@
+# bias_tests.py
+"""Running goodness-of-fit tests for wheel bias.
+
+BiasTests keeps the hit count of every pocket and every section of the
+layout, plus the two sums the uniformity tests need:
+
+    chi-square = 37 / N * sum(O^2) - N
+    G          = 2 * (sum(O ln O) - N ln(N / 37))
+
+A spin changes one pocket count from c to c + 1, so each sum moves by a
+closed-form delta and every section covering the pocket gains a hit: the
+update is O(sections) and no test ever looks at the raw spin history again.
+Section z-scores compare each section's hits with the binomial expectation
+N * k / 37 for a section of k pockets.
+"""
+import math
+
+import numpy as np
+
+from roulette_data import BET_FAMILIES
+
+# Display label of each family, in the order the tests are listed
+FAMILY_LABELS = {
+    "even_money": "Even Money",
+    "dozen": "Dozen",
+    "column": "Column",
+    "street": "Street",
+    "six_line": "Double Street",
+    "corner": "Corner",
+    "split": "Split",
+    "side": "Side",
+    "number": "Number"
+}
+# (family label, section name, pockets) for every section tested
+SECTIONS = [
+    (label, str(name), numbers)
+    for kind, label in FAMILY_LABELS.items()
+    for name, numbers in BET_FAMILIES[kind].items()
+]
+# For each pocket, the indices of the sections covering it
+_POCKET_SECTIONS = [
+    np.array([i for i, (_, _, numbers) in enumerate(SECTIONS) if pocket in numbers], dtype=np.int64)
+    for pocket in range(37)
+]
+_SECTION_PROBABILITY = np.array([len(numbers) / 37 for _, _, numbers in SECTIONS])
+# Expected hits per pocket at which the chi-square approximation is trusted
+MIN_EXPECTED = 5
+
+
+def _xlogx(x):
+    return x * math.log(x) if x > 0 else 0.0
+
+
+def _gamma_q(a, x):
+    """Regularized upper incomplete gamma Q(a, x) (series or continued fraction)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Lentz's method for the continued fraction
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi_square_p_value(statistic, df):
+    """P(X >= statistic) for a chi-square variable with df degrees of freedom."""
+    return _gamma_q(df / 2, statistic / 2)
+
+
+def normal_p_value(z):
+    """Two-sided p-value of a standard normal z-score."""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+class BiasTests:
+    """Pocket and section counts with running chi-square and G statistics."""
+    __slots__ = ("counts", "section_counts", "total", "_sum_squares", "_sum_xlogx")
+
+    def __init__(self, scores=None):
+        self.rebuild(scores or {})
+
+    def rebuild(self, scores):
+        """Recompute everything from a {number: hits} dict."""
+        self.counts = [int(scores.get(n, 0)) for n in range(37)]
+        self.section_counts = np.zeros(len(SECTIONS), dtype=np.int64)
+        for pocket, count in enumerate(self.counts):
+            self.section_counts[_POCKET_SECTIONS[pocket]] += count
+        self.total = sum(self.counts)
+        self._sum_squares = sum(c * c for c in self.counts)
+        self._sum_xlogx = sum(_xlogx(c) for c in self.counts)
+
+    def push(self, spin):
+        pocket = int(spin)
+        count = self.counts[pocket]
+        self.counts[pocket] = count + 1
+        self.section_counts[_POCKET_SECTIONS[pocket]] += 1
+        self.total += 1
+        self._sum_squares += 2 * count + 1
+        self._sum_xlogx += _xlogx(count + 1) - _xlogx(count)
+
+    def pop(self, spin):
+        pocket = int(spin)
+        count = self.counts[pocket]
+        # Mirrors the undo handler, which never lets a score go negative
+        if count == 0:
+            return
+        self.counts[pocket] = count - 1
+        self.section_counts[_POCKET_SECTIONS[pocket]] -= 1
+        self.total -= 1
+        self._sum_squares -= 2 * count - 1
+        self._sum_xlogx += _xlogx(count - 1) - _xlogx(count)
+
+    def chi_square(self):
+        """(statistic, p-value) of Pearson's test that all 37 pockets are equally likely, or None without spins."""
+        if self.total == 0:
+            return None
+        statistic = max(0.0, 37 * self._sum_squares / self.total - self.total)
+        return statistic, chi_square_p_value(statistic, 36)
+
+    def g_test(self):
+        """(statistic, p-value) of the likelihood-ratio (G) test of uniformity, or None without spins."""
+        if self.total == 0:
+            return None
+        statistic = max(0.0, 2 * (self._sum_xlogx - self.total * math.log(self.total / 37)))
+        return statistic, chi_square_p_value(statistic, 36)
+
+    def reliable(self):
+        """Whether every pocket's expected count is high enough for the chi-square approximation."""
+        return self.total / 37 >= MIN_EXPECTED
+
+    def section_z_scores(self):
+        """Binomial z-score per section as a numpy array aligned with SECTIONS (zeros without spins)."""
+        if self.total == 0:
+            return np.zeros(len(SECTIONS))
+        expected = self.total * _SECTION_PROBABILITY
+        return (self.section_counts - expected) / np.sqrt(expected * (1 - _SECTION_PROBABILITY))
+
+    def most_unusual(self, count=5):
+        """The `count` sections furthest from expectation: (label, name, hits, expected, z, p-value)."""
+        z_scores = self.section_z_scores()
+        rows = []
+        for i in np.argsort(-np.abs(z_scores), kind="stable")[:count]:
+            label, name, numbers = SECTIONS[i]
+            z = float(z_scores[i])
+            rows.append((label, name, int(self.section_counts[i]), self.total * len(numbers) / 37, z, normal_p_value(z)))
+        return rows
@@ -0,0 +1,92 @@
+# dealer_signature.py
+"""Wheel distance between consecutive spins ("dealer signature").
+
+A dealer with a steady release tends to land a similar number of pockets
+away from the previous result. DealerSignature keeps a 37-bin histogram of
+the offset, in WHEEL_EUROPEAN order, from each spin to the next, so a spin is
+one bin increment and pop() one decrement. The histogram is tested for
+uniformity like the pocket counts, and the most common offsets applied to
+the latest spin give a predicted sector to bet.
+"""
+from bias_tests import chi_square_p_value
+from roulette_data import WHEEL_EUROPEAN, WHEEL_POSITION
+
+_POCKETS = len(WHEEL_EUROPEAN)
+
+
+def signed_offset(offset):
+    """Offset 0-36 as -18..18 (positive = clockwise in WHEEL_EUROPEAN order)."""
+    return offset if offset <= _POCKETS // 2 else offset - _POCKETS
+
+
+class DealerSignature:
+    """Histogram of wheel offsets between consecutive spins, with push/pop."""
+    __slots__ = ("positions", "histogram", "_sum_squares")
+
+    def __init__(self, spins=()):
+        self.rebuild(spins)
+
+    def rebuild(self, spins):
+        """Start over from a list of spins."""
+        self.positions = []
+        self.histogram = [0] * _POCKETS
+        self._sum_squares = 0
+        for spin in spins:
+            self.push(spin)
+
+    def push(self, spin):
+        position = WHEEL_POSITION[int(spin)]
+        if self.positions:
+            offset = (position - self.positions[-1]) % _POCKETS
+            self._sum_squares += 2 * self.histogram[offset] + 1
+            self.histogram[offset] += 1
+        self.positions.append(position)
+
+    def pop(self):
+        if not self.positions:
+            return None
+        position = self.positions.pop()
+        if self.positions:
+            offset = (position - self.positions[-1]) % _POCKETS
+            self.histogram[offset] -= 1
+            self._sum_squares -= 2 * self.histogram[offset] + 1
+        return WHEEL_EUROPEAN[position]
+
+    @property
+    def total(self):
+        """Number of offsets recorded (one fewer than the spins)."""
+        return max(0, len(self.positions) - 1)
+
+    def chi_square(self):
+        """(statistic, p-value) of the test that every offset is equally likely, or None without offsets."""
+        total = self.total
+        if total == 0:
+            return None
+        statistic = max(0.0, _POCKETS * self._sum_squares / total - total)
+        return statistic, chi_square_p_value(statistic, _POCKETS - 1)
+
+    def top_offsets(self, count=3):
+        """The `count` most common (signed offset, hits), ties to the smaller distance."""
+        ranked = sorted(range(_POCKETS), key=lambda offset: (-self.histogram[offset], abs(signed_offset(offset))))
+        return [(signed_offset(offset), self.histogram[offset]) for offset in ranked[:count] if self.histogram[offset] > 0]
+
+    def predicted_sector(self, count=3, spread=1):
+        """Pockets the top offsets point to from the latest spin.
+
+        Returns a list of (number, offset, distance) in prediction order, where
+        distance is how many pockets the number sits from the exact landing
+        spot (0 up to `spread`). Empty without offsets.
+        """
+        if not self.positions:
+            return []
+        last = self.positions[-1]
+        predicted = []
+        seen = set()
+        for offset, _ in self.top_offsets(count):
+            for distance in range(spread + 1):
+                for step in ((0,) if distance == 0 else (-distance, distance)):
+                    number = WHEEL_EUROPEAN[(last + offset + step) % _POCKETS]
+                    if number not in seen:
+                        seen.add(number)
+                        predicted.append((number, offset, distance))
+        return predicted
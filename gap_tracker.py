@@ -0,0 +1,133 @@
+# gap_tracker.py
+"""Spins since the last hit, and the distribution of gaps, for every pocket and section.
+
+A gap is the number of spins between two hits of the same bet. GapTracker
+keeps the last hit index of every number, even-money bet, dozen, column,
+street, corner, double street, split and side of zero, with a histogram and
+the longest of its completed gaps. A spin only touches the handful of bets
+covering its pocket, and logs what it changed so pop() undoes it exactly.
+
+Against an unbiased wheel a bet covering k pockets has geometric gaps with
+P(gap >= g) = (1 - k/37) ** g, so percentile() says how unusual the current
+drought is.
+"""
+from operator import itemgetter
+
+from roulette_data import BET_FAMILIES
+
+# For each pocket, the (kind, name) of every bet covering it
+_POCKET_KEYS = [
+    [(kind, name) for kind, sections in BET_FAMILIES.items() for name, numbers in sections.items() if pocket in numbers]
+    for pocket in range(37)
+]
+_HIT_PROBABILITY = {
+    (kind, name): len(numbers) / 37 for kind, sections in BET_FAMILIES.items() for name, numbers in sections.items()
+}
+
+
+class GapTracker:
+    """Last hit index and gap histogram per bet, with push/pop."""
+    __slots__ = ("spins", "last_seen", "gaps", "longest", "_log")
+
+    def __init__(self, spins=()):
+        self.rebuild(spins)
+
+    def rebuild(self, spins):
+        """Start over from a list of spins."""
+        self.spins = []
+        self.last_seen = {}  # (kind, name) -> index of the latest hit
+        self.gaps = {}       # (kind, name) -> {gap: count} of completed gaps
+        self.longest = {}    # (kind, name) -> longest completed gap
+        self._log = []
+        for spin in spins:
+            self.push(spin)
+
+    def push(self, spin):
+        spin = int(spin)
+        index = len(self.spins)
+        changes = []
+        for key in _POCKET_KEYS[spin]:
+            previous = self.last_seen.get(key)
+            changes.append((key, previous, self.longest.get(key)))
+            if previous is not None:
+                gap = index - previous - 1
+                histogram = self.gaps.setdefault(key, {})
+                histogram[gap] = histogram.get(gap, 0) + 1
+                if gap > self.longest.get(key, -1):
+                    self.longest[key] = gap
+            self.last_seen[key] = index
+        self.spins.append(spin)
+        self._log.append(changes)
+
+    def pop(self):
+        if not self.spins:
+            return None
+        spin = self.spins.pop()
+        index = len(self.spins)
+        for key, previous, longest in reversed(self._log.pop()):
+            if previous is None:
+                del self.last_seen[key]
+                continue
+            gap = index - previous - 1
+            histogram = self.gaps[key]
+            histogram[gap] -= 1
+            if not histogram[gap]:
+                del histogram[gap]
+                if not histogram:
+                    del self.gaps[key]
+            if longest is None:
+                del self.longest[key]
+            else:
+                self.longest[key] = longest
+            self.last_seen[key] = previous
+        return spin
+
+    def since_last_hit(self, kind, name):
+        """Spins since the bet last hit (all spins so far if it never has)."""
+        last = self.last_seen.get((kind, name))
+        return len(self.spins) - 1 - last if last is not None else len(self.spins)
+
+    def longest_gap(self, kind, name):
+        """Longest gap so far, counting the current drought; None without spins."""
+        if not self.spins:
+            return None
+        return max(self.longest.get((kind, name), 0), self.since_last_hit(kind, name))
+
+    def expected_gap(self, kind, name):
+        p = _HIT_PROBABILITY[(kind, name)]
+        return (1 - p) / p
+
+    def percentile(self, kind, name):
+        """Share (0-100) of gaps on an unbiased wheel that are shorter than the current drought."""
+        p = _HIT_PROBABILITY[(kind, name)]
+        return 100 * (1 - (1 - p) ** self.since_last_hit(kind, name))
+
+    def ranked(self, kind, count=None):
+        """(percentile, name, since) of the first `count` bets of one kind (all by default),
+        most unusual drought first; sleepers() without the display fields."""
+        spins = len(self.spins)
+        ranked = []
+        for name in BET_FAMILIES[kind]:
+            key = (kind, name)
+            last = self.last_seen.get(key)
+            since = spins - 1 - last if last is not None else spins
+            ranked.append((100 * (1 - (1 - _HIT_PROBABILITY[key]) ** since), name, since))
+        ranked.sort(key=itemgetter(0), reverse=True)
+        return ranked[:count]
+
+    def sleepers(self, kind, count=None):
+        """Bets of one kind, most unusual drought first, as dicts ready for display.
+
+        Only the first `count` bets (all by default) are turned into dicts.
+        """
+        return [
+            {
+                "name": name,
+                "since": since,
+                "longest": self.longest_gap(kind, name),
+                "expected": self.expected_gap(kind, name),
+                "percentile": percentile,
+                "hits": sum(self.gaps.get((kind, name), {}).values()) + ((kind, name) in self.last_seen)
+            }
+            for percentile, name, since in self.ranked(kind, count)
+        ]
@@ -0,0 +1,101 @@
+# ngram_index.py
+"""Hash index of n-grams over a stream of spin categories.
+
+NGramIndex maps every n-gram of the category stream (e.g. the dozen of each
+spin) to the ascending list of positions where it starts. Appending or
+removing a spin touches one entry per indexed n, so finding whether the
+newest n-gram has been seen before, and where, is a dict lookup instead of a
+pairwise comparison of all windows. An index for a new n is built once from
+the stored stream the first time it is asked for.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class NGramIndex:
+    """n-gram -> start positions of the pushed spins' categories, with undo."""
+    __slots__ = ("symbol_of", "symbols", "_indexes")
+
+    def __init__(self, symbol_of):
+        self.symbol_of = symbol_of
+        self.clear()
+
+    def push(self, spin):
+        symbols = self.symbols
+        symbols.append(self.symbol_of(spin))
+        size = len(symbols)
+        for n, index in self._indexes.items():
+            if size >= n:
+                gram = tuple(symbols[size - n:])
+                positions = index.get(gram)
+                if positions is None:
+                    index[gram] = [size - n]
+                else:
+                    positions.append(size - n)
+
+    def pop(self):
+        symbols = self.symbols
+        size = len(symbols)
+        for n, index in self._indexes.items():
+            if size >= n:
+                gram = tuple(symbols[size - n:])
+                positions = index[gram]
+                positions.pop()
+                if not positions:
+                    del index[gram]
+        symbols.pop()
+
+    def clear(self):
+        self.symbols = []
+        self._indexes = {}
+
+    def index(self, n):
+        """The n-gram -> positions dict, built on first use."""
+        index = self._indexes.get(n)
+        if index is None:
+            index = self._indexes[n] = {}
+            symbols = self.symbols
+            for start in range(len(symbols) - n + 1):
+                index.setdefault(tuple(symbols[start:start + n]), []).append(start)
+        return index
+
+    def _first_from(self, positions, start):
+        return positions[bisect_left(positions, start)]
+
+    def latest_repeat(self, n, start=0):
+        """(position, first_position) of the latest n-gram at or after `start` that already
+        appeared at or after `start`, or None. Checks the newest n-gram first, so a repeat
+        ending on the latest spin is found with one lookup."""
+        index = self.index(n)
+        symbols = self.symbols
+        for position in range(len(symbols) - n, start - 1, -1):
+            first = self._first_from(index[tuple(symbols[position:position + n])], start)
+            if first < position:
+                return position, first
+        return None
+
+    def repeats(self, n, start=0):
+        """Every (position, n-gram) at or after `start` whose n-gram occurred earlier at or after `start`."""
+        index = self.index(n)
+        symbols = self.symbols
+        matches = []
+        for position in range(start, len(symbols) - n + 1):
+            gram = tuple(symbols[position:position + n])
+            if self._first_from(index[gram], start) < position:
+                matches.append((position, gram))
+        return matches
+
+    def repeat_pairs(self, n, start=0):
+        """(later position, n-gram) for every pair of occurrences of an n-gram at or after `start`.
+
+        A later occurrence is listed once per earlier one, ordered by the earlier
+        then the later position, which is how the Dozen Tracker has always listed
+        its matches; the index only saves it from comparing every pair of windows.
+        """
+        index = self.index(n)
+        symbols = self.symbols
+        matches = []
+        for position in range(start, len(symbols) - n + 1):
+            gram = tuple(symbols[position:position + n])
+            positions = index[gram]
+            matches.extend((later, gram) for later in positions[bisect_right(positions, position):])
+        return matches
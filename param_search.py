@@ -0,0 +1,266 @@
+# param_search.py
+"""Grid and random search over strategy knobs, backtested on stored sessions.
+
+Each session in a spin archive (see batch_backtest.build_session_archive) is
+cut into consecutive folds. Every (session, fold, strategy, parameters) job is
+a backtest that bets only inside its fold while scoring all earlier spins, so
+there is no look-ahead. Jobs run in a process pool over the memory-mapped
+archive. Results are cached on disk per session hash, so re-running after
+adding sessions only backtests the new ones.
+
+walk_forward() guards against overfitting: for fold k the parameters are
+picked on folds before k and scored on fold k only.
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from backtest import backtest_strategy
+from batch_backtest import build_session_archive, load_offsets, read_session_spins
+from spin_archive import ARCHIVE_EXTENSION, open_archive
+from strategies import STRATEGIES
+
+SEARCH_CACHE_DIR = os.path.join(tempfile.gettempdir(), "roulette_param_search_cache")
+# Bump when backtest rules change so stale cache entries are ignored
+CACHE_VERSION = 2
+
+# Knobs evaluate_strategy passes through, with the ranges the UI allows
+STRATEGY_PARAMETERS = {
+    "Neighbours of Strong Number": {
+        "neighbours_count": list(range(1, 6)),
+        "strong_numbers_count": list(range(1, 19))
+    },
+    "Top Numbers with Neighbours (Tiered)": {
+        "top_count": [4, 6, 8, 10, 12],
+        "tier_size": [4, 6, 8, 10, 12]
+    },
+    "Dozen Tracker": {
+        "window": [5, 10, 20, 50, 100],
+        "streak_threshold": [3, 4, 5],
+        "sequence_length": [3, 4, 5]
+    }
+}
+DEFAULT_PARAMETERS = {"neighbours_count": 2, "strong_numbers_count": 1}
+
+# Columns of rank_parameters() and walk_forward(), also given to their empty tables
+RANKING_COLUMNS = ["strategy", "params", "units_won", "units_staked", "worst_drawdown", "return_per_unit"]
+WALK_FORWARD_COLUMNS = ["strategy", "fold", "params", "in_sample_units", "out_of_sample_units",
+                        "out_of_sample_staked", "out_of_sample_drawdown"]
+
+# Per-process archive view, opened once by the pool initializer
+_worker_archive = None
+
+
+def parameter_space(strategy_name):
+    """Values to search for each knob of a strategy (empty for strategies without knobs)."""
+    if strategy_name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy_name}'.")
+    return dict(STRATEGY_PARAMETERS.get(strategy_name, {}))
+
+
+def grid(space):
+    """Every combination of the values in space, as parameter dicts."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_sample(space, n_samples, seed=None):
+    """n_samples distinct combinations drawn uniformly from the grid."""
+    combinations = grid(space)
+    if n_samples >= len(combinations):
+        return combinations
+    return random.Random(seed).sample(combinations, n_samples)
+
+
+def fold_bounds(n_spins, n_folds):
+    """Start/stop indices of n_folds consecutive, near-equal folds."""
+    n_folds = max(1, min(n_folds, n_spins))
+    return [(n_spins * k // n_folds, n_spins * (k + 1) // n_folds) for k in range(n_folds)]
+
+
+def session_hash(spins):
+    return hashlib.sha256(bytes(spins)).hexdigest()
+
+
+def _params_key(params):
+    return json.dumps(params, sort_keys=True)
+
+
+def _job_key(strategy_name, params, fold, start, stop):
+    return f"{CACHE_VERSION}|{strategy_name}|{_params_key(params)}|{fold}|{start}|{stop}"
+
+
+def _cache_path(digest):
+    return os.path.join(SEARCH_CACHE_DIR, f"{digest}.json")
+
+
+def _load_cache(digest):
+    try:
+        with open(_cache_path(digest), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(digest, entries):
+    os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=SEARCH_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(temp_path, _cache_path(digest))
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _init_worker(archive_path):
+    global _worker_archive
+    _worker_archive = open_archive(archive_path)
+
+
+def _run_job(job):
+    strategy_name, params, session_start, start, stop = job
+    # Score everything before the fold, bet only inside it
+    spins = _worker_archive[session_start:session_start + stop].tolist()
+    knobs = {name: value for name, value in params.items() if name not in DEFAULT_PARAMETERS}
+    summary = backtest_strategy(
+        spins, strategy_name,
+        params.get("neighbours_count", DEFAULT_PARAMETERS["neighbours_count"]),
+        params.get("strong_numbers_count", DEFAULT_PARAMETERS["strong_numbers_count"]),
+        warmup=max(start, 1), params=knobs
+    )
+    return {key: summary[key] for key in ("rounds_bet", "units_staked", "units_won", "max_drawdown")}
+
+
+def search(archive_path, strategy_names=None, n_folds=4, n_samples=None, seed=None,
+           max_workers=None, use_cache=True):
+    """Backtest parameter combinations on every fold of every archived session.
+
+    Searches the full grid of each strategy's parameter_space, or n_samples
+    random combinations of it. Returns one DataFrame row per
+    (strategy, parameters, session, fold).
+    """
+    offsets = load_offsets(archive_path)
+    archive = open_archive(archive_path)
+    strategy_names = list(strategy_names or STRATEGIES)
+    candidates = {
+        name: (grid(parameter_space(name)) if n_samples is None else random_sample(parameter_space(name), n_samples, seed))
+        for name in strategy_names
+    }
+
+    rows = []
+    jobs = []
+    pending = []  # (row index, session digest, job key) of each job to run
+    caches = {}
+    for session in range(len(offsets) - 1):
+        session_start, session_stop = int(offsets[session]), int(offsets[session + 1])
+        digest = session_hash(archive[session_start:session_stop])
+        cache = caches[digest] = _load_cache(digest) if use_cache else {}
+        for fold, (start, stop) in enumerate(fold_bounds(session_stop - session_start, n_folds)):
+            for name, combinations in candidates.items():
+                for params in combinations:
+                    key = _job_key(name, params, fold, start, stop)
+                    row = {"strategy": name, "params": _params_key(params), **params,
+                           "session": session, "session_hash": digest, "fold": fold}
+                    if key in cache:
+                        row.update(cache[key])
+                    else:
+                        pending.append((len(rows), digest, key))
+                        jobs.append((name, params, session_start, start, stop))
+                    rows.append(row)
+
+    if jobs:
+        max_workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(archive_path,)) as pool:
+            for (index, digest, key), summary in zip(pending, pool.map(_run_job, jobs, chunksize=chunksize)):
+                rows[index].update(summary)
+                caches[digest][key] = summary
+        if use_cache:
+            for digest in {digest for _, digest, _ in pending}:
+                _save_cache(digest, caches[digest])
+    return pd.DataFrame(rows)
+
+
+def rank_parameters(results):
+    """Total return and worst drawdown per (strategy, parameters), best first.
+
+    Empty results (no sessions, or no parameter samples) give an empty table.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=RANKING_COLUMNS)
+    grouped = results.groupby(["strategy", "params"])
+    ranking = pd.DataFrame({
+        "units_won": grouped["units_won"].sum(),
+        "units_staked": grouped["units_staked"].sum(),
+        "worst_drawdown": grouped["max_drawdown"].max()
+    })
+    ranking["return_per_unit"] = ranking["units_won"] / ranking["units_staked"].where(ranking["units_staked"] > 0)
+    # Ties on return go to the smoother equity curve
+    return ranking.sort_values(["units_won", "worst_drawdown"], ascending=[False, True]).reset_index()
+
+
+def walk_forward(results):
+    """Out-of-sample check: for each fold k >= 1, choose parameters on folds < k and score them on fold k.
+
+    Returns one row per (strategy, fold) with the chosen parameters, their
+    in-sample units and their out-of-sample units on the fold; empty when there
+    are no results or only one fold.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=WALK_FORWARD_COLUMNS)
+    per_fold = results.groupby(["strategy", "params", "fold"])[["units_won", "units_staked", "max_drawdown"]].agg(
+        {"units_won": "sum", "units_staked": "sum", "max_drawdown": "max"}
+    ).reset_index()
+    rows = []
+    for strategy_name, frame in per_fold.groupby("strategy"):
+        for fold in sorted(frame["fold"].unique())[1:]:
+            in_sample = frame[frame["fold"] < fold].groupby("params").agg({"units_won": "sum", "max_drawdown": "max"})
+            best = in_sample.sort_values(["units_won", "max_drawdown"], ascending=[False, True]).index[0]
+            out_of_sample = frame[(frame["fold"] == fold) & (frame["params"] == best)].iloc[0]
+            rows.append({
+                "strategy": strategy_name,
+                "fold": int(fold),
+                "params": best,
+                "in_sample_units": int(in_sample.loc[best, "units_won"]),
+                "out_of_sample_units": int(out_of_sample["units_won"]),
+                "out_of_sample_staked": int(out_of_sample["units_staked"]),
+                "out_of_sample_drawdown": int(out_of_sample["max_drawdown"])
+            })
+    return pd.DataFrame(rows, columns=WALK_FORWARD_COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search strategy parameters across saved session files.")
+    parser.add_argument("sessions", nargs="+", help="Saved session files (.json or gzip-compressed)")
+    parser.add_argument("--archive", default="sessions" + ARCHIVE_EXTENSION, help="Where to write the combined spin archive")
+    parser.add_argument("--strategy", action="append", default=None, help="Strategy to tune (repeatable; default: all)")
+    parser.add_argument("--folds", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=None, help="Random combinations per strategy instead of the full grid")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--output", default=None, help="Optional CSV path for the parameter ranking")
+    args = parser.parse_args()
+
+    build_session_archive((read_session_spins(p) for p in args.sessions), args.archive)
+    results = search(args.archive, args.strategy, n_folds=args.folds, n_samples=args.samples, seed=args.seed,
+                     max_workers=args.workers, use_cache=not args.no_cache)
+    ranking = rank_parameters(results)
+    print(ranking.to_string(index=False))
+    print()
+    print(walk_forward(results).to_string(index=False))
+    if args.output:
+        ranking.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
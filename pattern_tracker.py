@@ -0,0 +1,200 @@
+# pattern_tracker.py
+"""Streaks, repeated sequences and follow-ups for any grouping of pockets.
+
+A grouping is a 37-entry table giving the category of each pocket (its
+dozen, column, colour, ...). PatternTracker follows one grouping with a
+run-length StreakTracker for streaks, an NGramIndex for fixed-length
+repeated sequences and a SuffixAutomaton for the longest repeated runs.
+PatternTrackerSet holds the one spin list they share: each new or undone
+spin is pushed to or popped from every grouping in one pass, so the Dozen,
+Even Money and Pattern trackers only read the results.
+"""
+from roulette_data import (
+    EVEN_MONEY, DOZENS, COLUMNS, STREETS, colors,
+    POCKET_DOZEN, POCKET_COLUMN, POCKET_STREET, POCKET_SIX_LINE, POCKET_SIDE
+)
+from ngram_index import NGramIndex
+from streaks import StreakTracker
+from suffix_automaton import SuffixAutomaton
+
+
+def grouping_table(groups, default="Other"):
+    """Pocket -> category table from {category: numbers}; unlisted pockets get `default`."""
+    table = [default] * 37
+    seen = {}
+    for name, numbers in groups.items():
+        for n in numbers:
+            if not 0 <= n <= 36:
+                raise ValueError(f"Number {n} is not on the wheel.")
+            if n in seen:
+                raise ValueError(f"Number {n} is in both '{seen[n]}' and '{name}'.")
+            seen[n] = name
+            table[n] = name
+    return tuple(table)
+
+
+def parse_grouping(text):
+    """Parse "Name: 1, 2, 3; Other name: 4, 5" into a pocket -> category table."""
+    groups = {}
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        if ":" not in part:
+            raise ValueError(f"'{part.strip()}' should look like 'Name: 1, 2, 3'.")
+        name, numbers = part.split(":", 1)
+        name = name.strip()
+        if not name:
+            raise ValueError("Every group needs a name.")
+        try:
+            groups[name] = [int(n) for n in numbers.split(",") if n.strip()]
+        except ValueError:
+            raise ValueError(f"Group '{name}' must list numbers separated by commas.")
+        if not groups[name]:
+            raise ValueError(f"Group '{name}' has no numbers.")
+    if not groups:
+        raise ValueError("Please define at least one group.")
+    return grouping_table(groups)
+
+
+def _even_money_traits(n):
+    # "Color, Parity, Range" of a pocket, e.g. "Red, Odd, Low"
+    if n == 0:
+        return "Zero"
+    pairs = (("Red", "Black"), ("Even", "Odd"), ("Low", "High"))
+    return ", ".join(next(name for name in pair if n in EVEN_MONEY[name]) for pair in pairs)
+
+
+# Built-in groupings; the category names are the ones the trackers show
+GROUPINGS = {
+    "Numbers": tuple(range(37)),
+    "Dozens": tuple(("Not in Dozen", *DOZENS)[POCKET_DOZEN[n]] for n in range(37)),
+    "Columns": tuple(("Not in Column", *COLUMNS)[POCKET_COLUMN[n]] for n in range(37)),
+    "Streets": tuple(("Zero", *STREETS)[POCKET_STREET[n]] for n in range(37)),
+    "Double Streets": tuple("Zero" if n == 0 else f"{6 * POCKET_SIX_LINE[n] - 5}-{6 * POCKET_SIX_LINE[n]}" for n in range(37)),
+    "Sides of Zero": tuple(("Zero", "Left Side of Zero", "Right Side of Zero")[POCKET_SIDE[n]] for n in range(37)),
+    "Colors": tuple(colors[str(n)].capitalize() for n in range(37)),
+    "Even Money Traits": tuple(_even_money_traits(n) for n in range(37))
+}
+
+
+class PatternTracker:
+    """Streaks and n-gram repeats of one grouping's category stream."""
+    __slots__ = ("table", "streaks", "ngrams", "automaton")
+
+    def __init__(self, table):
+        if len(table) != 37:
+            raise ValueError("A grouping needs a category for each of the 37 pockets.")
+        self.table = tuple(table)
+        symbol_of = lambda spin, table=self.table: table[int(spin)]
+        self.streaks = StreakTracker(symbol_of)
+        self.ngrams = NGramIndex(symbol_of)
+        self.automaton = SuffixAutomaton(symbol_of)
+
+    def push(self, spin):
+        self.streaks.push(spin)
+        self.ngrams.push(spin)
+        self.automaton.push(spin)
+
+    def pop(self):
+        self.streaks.pop()
+        self.ngrams.pop()
+        self.automaton.pop()
+
+    def clear(self):
+        self.streaks.clear()
+        self.ngrams.clear()
+        self.automaton.clear()
+
+    @property
+    def symbols(self):
+        return self.ngrams.symbols
+
+    def runs(self, start=0):
+        """(category, offset, length) runs from spin `start` on; see StreakTracker.runs."""
+        return self.streaks.runs(start)
+
+    def repeats(self, length, start=0):
+        return self.ngrams.repeats(length, start)
+
+    def repeat_pairs(self, length, start=0):
+        return self.ngrams.repeat_pairs(length, start)
+
+    def latest_repeat(self, length, start=0):
+        return self.ngrams.latest_repeat(length, start)
+
+    def longest_repeat(self):
+        """(length, first_end, end) of the longest run of categories seen twice this session, or None."""
+        return self.automaton.longest_repeat()
+
+    def tail_repeat(self):
+        """(length, first_end) of the longest run ending on the latest spin that happened before."""
+        return self.automaton.tail_repeat()
+
+    def follow_ups(self, length, follow, start=0):
+        """What followed earlier occurrences of the latest `length`-spin sequence.
+
+        Returns (sequence, occurrences, counts): the latest sequence, the start of
+        every earlier occurrence at or after `start`, and how often each category
+        appeared in the `follow` spins after them. None with too few spins.
+        """
+        symbols = self.symbols
+        if len(symbols) - start < length:
+            return None
+        latest = len(symbols) - length
+        sequence = tuple(symbols[latest:])
+        occurrences = [p for p in self.ngrams.index(length).get(sequence, []) if start <= p < latest]
+        counts = {}
+        for p in occurrences:
+            for category in symbols[p + length:min(p + length + follow, len(symbols))]:
+                counts[category] = counts.get(category, 0) + 1
+        return sequence, occurrences, counts
+
+
+class PatternTrackerSet:
+    """A PatternTracker per grouping, all fed from one spin list."""
+    __slots__ = ("spins", "trackers")
+
+    def __init__(self, groupings=None):
+        self.spins = []
+        self.trackers = {name: PatternTracker(table) for name, table in (groupings or GROUPINGS).items()}
+
+    def __getitem__(self, name):
+        return self.trackers[name]
+
+    def __contains__(self, name):
+        return name in self.trackers
+
+    def names(self):
+        return list(self.trackers)
+
+    def add(self, name, table):
+        """Add (or replace) a grouping, indexed over the spins seen so far."""
+        tracker = PatternTracker(table)
+        for spin in self.spins:
+            tracker.push(spin)
+        self.trackers[name] = tracker
+        return tracker
+
+    def push(self, spin):
+        self.spins.append(spin)
+        for tracker in self.trackers.values():
+            tracker.push(spin)
+
+    def pop(self):
+        if not self.spins:
+            return None
+        for tracker in self.trackers.values():
+            tracker.pop()
+        return self.spins.pop()
+
+    def clear(self):
+        """Forget every spin, keeping the groupings."""
+        self.spins = []
+        for tracker in self.trackers.values():
+            tracker.clear()
+
+    def rebuild(self, spins):
+        """Start over from a whole spin list (e.g. a loaded session)."""
+        self.clear()
+        for spin in spins:
+            self.push(int(spin))
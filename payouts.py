@@ -0,0 +1,135 @@
+# payouts.py
+"""Net-return vectors for any layout of chips on a single-zero wheel.
+
+A layout (chips on straights, splits, streets, corners, six-lines, dozens,
+columns and even-money bets) is represented by a 37-element vector whose
+entry n is the net result in units when pocket n comes in. Settling a spin is
+then an index, and expected value or variance is a reduction over the vector,
+because every pocket is equally likely.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from roulette_data import BET_FAMILIES
+
+# Net units won per unit staked, by bet kind
+PAYOUTS = {
+    "even_money": 1,
+    "dozen": 2,
+    "column": 2,
+    "six_line": 5,
+    "corner": 8,
+    "street": 11,
+    "split": 17,
+    "number": 35
+}
+
+# The progression tracker's bet types and the bet kind each one stands for
+BET_TYPE_KINDS = {"Even Money": "even_money", "Dozens": "dozen", "Columns": "column", "Straight Bets": "number"}
+BET_TYPE_PAYOUTS = {bet_type: PAYOUTS[kind] for bet_type, kind in BET_TYPE_KINDS.items()}
+# Single-zero wheel
+BET_TYPE_WIN_PROBABILITY = {"Even Money": 18 / 37, "Dozens": 12 / 37, "Columns": 12 / 37, "Straight Bets": 1 / 37}
+
+def _unit_vector(kind, numbers):
+    vector = np.full(37, -1, dtype=np.int64)
+    vector[list(numbers)] = PAYOUTS[kind]
+    vector.flags.writeable = False
+    return vector
+
+
+# One unit on each named bet, built once
+_UNIT_VECTORS = {
+    (kind, name): _unit_vector(kind, numbers)
+    for kind in PAYOUTS
+    for name, numbers in BET_FAMILIES[kind].items()
+}
+
+
+# (kind, name) -> (net units won per unit, bitmask of the pockets covered), for settling a
+# single spin with a bit test instead of building the layout's vector
+BET_LOOKUP = {
+    (kind, name): (PAYOUTS[kind], sum(1 << n for n in numbers))
+    for kind in PAYOUTS
+    for name, numbers in BET_FAMILIES[kind].items()
+}
+
+
+def bet_vector(kind, name, stake=1):
+    """Net-return vector of `stake` units on a single bet."""
+    try:
+        unit = _UNIT_VECTORS[(kind, name)]
+    except KeyError:
+        raise ValueError(f"Unknown bet '{name}' of kind '{kind}'.") from None
+    return unit if stake == 1 else unit * stake
+
+
+def layout_vector(layout):
+    """Net-return vector of a whole layout.
+
+    layout is either a dict {(kind, name): stake} or an iterable of (kind, name)
+    pairs with one unit on each; a bet listed twice is staked twice.
+    """
+    items = layout.items() if isinstance(layout, dict) else ((bet, 1) for bet in layout)
+    total = np.zeros(37, dtype=np.int64)
+    for (kind, name), stake in items:
+        if isinstance(stake, (int, np.integer)):
+            total += bet_vector(kind, name, stake)
+        else:
+            total = total + bet_vector(kind, name) * float(stake)
+    return total
+
+
+def layout_stake(layout):
+    """Total units on the table for a layout."""
+    return sum(layout.values()) if isinstance(layout, dict) else sum(1 for _ in layout)
+
+
+@lru_cache(maxsize=4096)
+def _strategy_vector(key):
+    vector = layout_vector(key)
+    vector.flags.writeable = False
+    return vector
+
+
+def strategy_vector(bets):
+    """Net-return vector for a StrategyResult's bets, one unit each (cached per layout)."""
+    return _strategy_vector(tuple((kind, name) for kind, name, _, _ in bets))
+
+
+def expected_value(vector):
+    """Expected net units per spin."""
+    return float(vector.sum()) / 37
+
+
+def variance(vector):
+    """Variance of the net units per spin."""
+    mean = expected_value(vector)
+    return float(np.dot(vector, vector)) / 37 - mean * mean
+
+
+def layout_stats(vector, staked):
+    """Expected value, spread and hit probability of a layout staking `staked` units."""
+    var = variance(vector)
+    ev = expected_value(vector)
+    return {
+        "staked": staked,
+        "expected_value": ev,
+        "edge": ev / staked if staked else 0.0,
+        "variance": var,
+        "std_dev": var ** 0.5,
+        # A pocket pays something unless the whole stake is lost on it
+        "hit_probability": float(np.count_nonzero(vector > -staked)) / 37 if staked else 0.0
+    }
+
+
+def settle(vector, spin):
+    """Net units for the layout when `spin` comes in."""
+    return vector[int(spin)].item()
+
+
+def simulate_layout(vector, n_spins, n_sessions=1, seed=None):
+    """Net units after n_spins flat-bet spins of the layout, for each of n_sessions."""
+    rng = np.random.default_rng(seed)
+    pockets = rng.integers(0, 37, size=(n_sessions, n_spins))
+    return vector[pockets].sum(axis=1)
@@ -0,0 +1,143 @@
+# pocket_posterior.py
+"""Bayesian Dirichlet posterior over the 37 pocket probabilities.
+
+With a uniform Dirichlet(1, ..., 1) prior, the posterior after the observed
+counts is Dirichlet(1 + counts), so a spin is a single count increment. The
+rate of any section of k pockets with S hits after N spins is then exactly
+Beta(a, b) with a = k + S and b = 37 - k + N - S, both integers, so:
+
+- the chance the rate beats its fair share k/37 is a binomial CDF,
+  P(Binomial(N + 36, k/37) <= a - 1), one cumulative sum per section size
+  shared by every section of that size;
+- the 95% credible interval comes from Beta quantiles (Abramowitz & Stegun
+  26.5.22, polished by Newton steps on the exact CDF when a or b is small).
+
+Everything is closed form, so the same spins always give the same rankings.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from bias_tests import SECTIONS
+
+CREDIBLE_MASS = 0.95
+_TAIL = (1 - CREDIBLE_MASS) / 2
+# Upper-tail normal deviate of the lower interval bound (its negative gives the upper bound)
+_Z_TAIL = NormalDist().inv_cdf(1 - _TAIL)
+# Below this shape parameter the quantile approximation is refined on the exact CDF
+_REFINE_BELOW = 10
+_NEWTON_STEPS = 4
+
+
+def _binomial_cdf(n, p, upto):
+    """P(Binomial(n, p) <= j) for j = 0..upto, as a numpy array."""
+    j = np.arange(1, upto + 1)
+    log_pmf = n * math.log1p(-p) + np.concatenate(([0.0], np.cumsum(np.log((n - j + 1) / j) + math.log(p / (1 - p)))))
+    return np.minimum(np.cumsum(np.exp(log_pmf)), 1.0)
+
+
+def _beta_cdf(x, a, b):
+    """Regularized incomplete beta I_x(a, b) for integer a, b, summing min(a, b) binomial terms."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    n = a + b - 1
+    if a > b:
+        return 1.0 - _beta_cdf(1 - x, b, a)
+    # I_x(a, b) = P(Binomial(n, x) >= a)
+    log_x, log_1mx, log_n = math.log(x), math.log1p(-x), math.lgamma(n + 1)
+    lower = sum(math.exp(log_n - math.lgamma(j + 1) - math.lgamma(n - j + 1) + j * log_x + (n - j) * log_1mx) for j in range(a))
+    return 1.0 - lower
+
+
+def _beta_quantile(q, y, a, b):
+    """x with I_x(a, b) = q for integer a, b >= 1, where y is the normal deviate with upper tail q."""
+    lam = (y * y - 3) / 6
+    h = 2 / (1 / (2 * a - 1) + 1 / (2 * b - 1))
+    w = y * math.sqrt(h + lam) / h - (1 / (2 * b - 1) - 1 / (2 * a - 1)) * (lam + 5 / 6 - 2 / (3 * h))
+    x = a / (a + b * math.exp(2 * w))
+    if min(a, b) < _REFINE_BELOW:
+        log_beta = math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+        for _ in range(_NEWTON_STEPS):
+            density = math.exp((a - 1) * math.log(x) + (b - 1) * math.log1p(-x) - log_beta)
+            x = min(max(x - (_beta_cdf(x, a, b) - q) / density, x / 2), (1 + x) / 2)
+    return x
+
+
+class PocketPosterior:
+    """Dirichlet(1 + counts) with closed-form section rates and tail probabilities."""
+    __slots__ = ("counts", "total", "_cdfs")
+
+    def __init__(self, scores=None):
+        self.rebuild(scores or {})
+
+    def rebuild(self, scores):
+        """Recompute from a {number: hits} dict."""
+        self.counts = [int(scores.get(n, 0)) for n in range(37)]
+        self.total = sum(self.counts)
+        self._cdfs = {}
+
+    def push(self, spin):
+        self.counts[int(spin)] += 1
+        self.total += 1
+        self._cdfs = {}
+
+    def pop(self, spin):
+        pocket = int(spin)
+        # Mirrors the undo handler, which never lets a score go negative
+        if self.counts[pocket] == 0:
+            return
+        self.counts[pocket] -= 1
+        self.total -= 1
+        self._cdfs = {}
+
+    def _interval(self, a):
+        b = 37 + self.total - a
+        return a / (a + b), _beta_quantile(_TAIL, _Z_TAIL, a, b), _beta_quantile(1 - _TAIL, -_Z_TAIL, a, b)
+
+    def _hot_probability(self, size, a):
+        cdf = self._cdfs.get(size)
+        if cdf is None or len(cdf) < a:
+            # Shared by every section of this size until the next spin
+            cdf = self._cdfs[size] = _binomial_cdf(self.total + 36, size / 37, a - 1)
+        return float(cdf[a - 1])
+
+    def interval(self, numbers):
+        """(mean, low, high) of the 95% credible interval for the combined rate of `numbers`."""
+        return self._interval(len(numbers) + sum(self.counts[n] for n in numbers))
+
+    def hot_probability(self, numbers):
+        """P(the combined rate of `numbers` exceeds its fair share len(numbers)/37)."""
+        return self._hot_probability(len(numbers), len(numbers) + sum(self.counts[n] for n in numbers))
+
+    def ranking(self, count=None):
+        """Pockets as (number, hits, P(rate > 1/37)), most likely hot first, without intervals.
+
+        Only the first `count` rows (all by default) are built.
+        """
+        ranked = sorted(range(37), key=lambda number: (-self.counts[number], number))
+        counts = self.counts
+        # Most hits first, so the first lookup sizes the single-pocket CDF for all of them
+        return [(number, counts[number], self._hot_probability(1, 1 + counts[number])) for number in ranked[:count]]
+
+    def hot_numbers(self, count=None):
+        """Pockets as (number, hits, mean, low, high, P(rate > 1/37)), most likely hot first.
+
+        Only the first `count` rows (all by default) are built.
+        """
+        return [(number, hits) + self._interval(1 + hits) + (probability,) for number, hits, probability in self.ranking(count)]
+
+    def hot_sections(self, label):
+        """Sections of one family (bias_tests label, e.g. "Dozen") as (name, mean, low, high, probability)."""
+        sections = [
+            (len(numbers) + sum(self.counts[n] for n in numbers), len(numbers), name)
+            for section_label, name, numbers in SECTIONS if section_label == label
+        ]
+        rows = []
+        # Hottest first, so one CDF of each section size covers the whole family
+        for a, size, name in sorted(sections, key=lambda section: -section[0]):
+            rows.append((name,) + self._interval(a) + (self._hot_probability(size, a),))
+        rows.sort(key=lambda row: -row[4])
+        return rows
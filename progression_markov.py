@@ -0,0 +1,133 @@
+# progression_markov.py
+"""Exact Markov-chain analysis of the betting progressions.
+
+The tracker's state after any number of bets is fully described by
+(bankroll, current_bet, next_bet, progression snapshot), so the distribution over
+those tuples can be pushed forward one spin at a time with the exact win
+probability of the bet type. Stopped sessions are absorbed into stop win,
+stop loss or insufficient bankroll using the same rules as
+RouletteState.update_progression. Results are cached on disk per parameter set.
+
+Labouchere is simulation-only: its state carries the whole list, which grows
+with every loss, so the chain passes any state budget within a few dozen spins
+(over 200,000 states by 50 spins at the default settings).
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from payouts import BET_TYPE_PAYOUTS, BET_TYPE_WIN_PROBABILITY
+from progressions import PROGRESSIONS, make_progression
+
+MARKOV_CACHE_DIR = os.path.join(tempfile.gettempdir(), "roulette_markov_cache")
+# Bump when the transition rules change so stale cache entries are ignored
+CACHE_VERSION = 1
+DEFAULT_MAX_STATES = 200000
+# Progressions whose state space is too large to solve exactly; use progression_sim
+SIMULATION_ONLY = ("Labouchere",)
+
+def _cache_path(params):
+    key = hashlib.sha256(json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    return os.path.join(MARKOV_CACHE_DIR, f"{key}.json")
+
+
+def _solve(progression, bet_type, bankroll, base_unit, stop_loss, stop_win, max_spins, max_states):
+    payout = BET_TYPE_PAYOUTS[bet_type]
+    p_win = BET_TYPE_WIN_PROBABILITY[bet_type]
+    p_lose = 1.0 - p_win
+    engine = make_progression(progression, base_unit)
+    initial_extra = engine.snapshot()
+
+    # (bankroll, current_bet, next_bet, progression_state) -> probability
+    distribution = {(bankroll, base_unit, base_unit, initial_extra): 1.0}
+    absorbed = {"stop_win": 0.0, "stop_loss": 0.0, "ruin": 0.0}
+    expected_spins = 0.0
+    peak_states = 1
+    for _ in range(max_spins):
+        if not distribution:
+            break
+        # Every session still in play places one more bet
+        expected_spins += sum(distribution.values())
+        following = {}
+        for (balance, current, next_bet, extra), probability in distribution.items():
+            for won, p_outcome in ((True, p_win), (False, p_lose)):
+                mass = probability * p_outcome
+                new_balance = balance + (current * payout if won else -current)
+                if new_balance < current:
+                    absorbed["ruin"] += mass
+                    continue
+                profit = new_balance - bankroll
+                if profit <= stop_loss:
+                    absorbed["stop_loss"] += mass
+                    continue
+                if profit >= stop_win:
+                    absorbed["stop_win"] += mass
+                    continue
+                engine.restore(extra)
+                new_next = engine.step(won, next_bet, profit)
+                state_key = (new_balance, next_bet, new_next, engine.snapshot())
+                following[state_key] = following.get(state_key, 0.0) + mass
+        distribution = following
+        peak_states = max(peak_states, len(distribution))
+        if peak_states > max_states:
+            raise ValueError(
+                f"{progression} has more than {max_states:,} distinct states for these settings; "
+                "use the Monte Carlo simulator (progression_sim) instead."
+            )
+
+    result = dict(absorbed)
+    result["active"] = sum(distribution.values())
+    result["expected_spins"] = expected_spins
+    result["peak_states"] = peak_states
+    return result
+
+
+def analyze_progression(progression, bet_type="Even Money", bankroll=1000, base_unit=10, stop_loss=-500,
+                        stop_win=200, max_spins=1000,
+                        use_cache=True, max_states=DEFAULT_MAX_STATES):
+    """Exact probabilities of stop win, stop loss and insufficient bankroll within max_spins.
+
+    Also returns the probability of still being active after max_spins and the
+    expected number of bets placed (capped at max_spins). Raises ValueError for
+    the SIMULATION_ONLY progressions and when the exact state space would exceed
+    max_states.
+    """
+    if progression not in PROGRESSIONS:
+        raise ValueError(f"Unknown progression '{progression}'.")
+    if progression in SIMULATION_ONLY:
+        raise ValueError(f"{progression} is simulation-only; use the Monte Carlo simulator (progression_sim) instead.")
+    if bet_type not in BET_TYPE_PAYOUTS:
+        raise ValueError(f"Unknown bet type '{bet_type}'.")
+    params = {
+        "version": CACHE_VERSION,
+        "progression": progression,
+        "bet_type": bet_type,
+        "bankroll": int(bankroll),
+        "base_unit": int(base_unit),
+        "stop_loss": int(stop_loss),
+        "stop_win": int(stop_win),
+        "max_spins": int(max_spins)
+    }
+    path = _cache_path(params)
+    if use_cache and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable cache entry: recompute and overwrite
+
+    result = _solve(progression, bet_type, params["bankroll"], params["base_unit"], params["stop_loss"],
+                    params["stop_win"], params["max_spins"], max_states)
+
+    if use_cache:
+        os.makedirs(MARKOV_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=MARKOV_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"params": params, "result": result}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    return result
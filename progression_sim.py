@@ -0,0 +1,100 @@
+# progression_sim.py
+"""Vectorized Monte Carlo simulation of the betting progressions.
+
+Every array slot is one independent session following exactly the rules of
+RouletteState.update_progression / update_bankroll:
+  * each step settles the *current* bet, then promotes next_bet to current_bet
+    and derives the following next_bet (the tracker's one-step lag);
+  * after settling, a bankroll below the bet just settled stops the session
+    (insufficient bankroll), otherwise stop_loss / stop_win are checked on the
+    profit against the starting bankroll.
+The progression rules themselves are the step_batch() forms of the classes in
+progressions.py. Only the still-active sessions are advanced, so a batch that
+mostly stops early gets cheaper as it goes.
+
+The app runs this on a shared server, so it clamps requests to MAX_SESSIONS
+sessions of at most MAX_SPINS spins; the arrays grow with n_sessions.
+"""
+import numpy as np
+
+from payouts import BET_TYPE_PAYOUTS, BET_TYPE_WIN_PROBABILITY
+from progressions import DEFAULT_LABOUCHERE_SEQUENCE, PROGRESSIONS, make_progression
+
+OUTCOME_ACTIVE = 0
+OUTCOME_STOP_WIN = 1
+OUTCOME_STOP_LOSS = 2
+OUTCOME_RUIN = 3
+OUTCOME_NAMES = {OUTCOME_ACTIVE: "Still Active", OUTCOME_STOP_WIN: "Stop Win", OUTCOME_STOP_LOSS: "Stop Loss", OUTCOME_RUIN: "Insufficient Bankroll"}
+
+# Largest simulation the app accepts from the UI
+MAX_SESSIONS = 1_000_000
+MAX_SPINS = 10_000
+
+
+def simulate_progression(progression, bet_type="Even Money", bankroll=1000, base_unit=10, stop_loss=-500,
+                         stop_win=200, n_sessions=10000, max_spins=1000,
+                         labouchere_sequence=DEFAULT_LABOUCHERE_SEQUENCE, seed=None, outcomes=None):
+    """Simulate n_sessions independent sessions of up to max_spins bets each.
+
+    outcomes may be a (n_sessions, max_spins) boolean win matrix to replay fixed
+    results instead of drawing them. Returns a dict of per-session arrays:
+    final_bankroll, outcome (OUTCOME_* codes) and spins_played.
+    """
+    if bet_type not in BET_TYPE_PAYOUTS:
+        raise ValueError(f"Unknown bet type '{bet_type}'.")
+    if progression not in PROGRESSIONS:
+        raise ValueError(f"Unknown progression '{progression}'.")
+    payout = BET_TYPE_PAYOUTS[bet_type]
+    win_probability = BET_TYPE_WIN_PROBABILITY[bet_type]
+    initial_bankroll = int(bankroll)
+    base_unit = int(base_unit)
+    rng = np.random.default_rng(seed)
+
+    bankrolls = np.full(n_sessions, initial_bankroll, dtype=np.int64)
+    current = np.full(n_sessions, base_unit, dtype=np.int64)
+    next_bet = np.full(n_sessions, base_unit, dtype=np.int64)
+    outcome = np.zeros(n_sessions, dtype=np.int8)
+    spins_played = np.zeros(n_sessions, dtype=np.int32)
+    engine = make_progression(progression, base_unit, labouchere_sequence)
+    batch = engine.new_batch(n_sessions)
+
+    active = np.arange(n_sessions)
+    for step in range(max_spins):
+        if active.size == 0:
+            break
+        if outcomes is not None:
+            won = np.asarray(outcomes[active, step], dtype=bool)
+        else:
+            won = rng.random(active.size) < win_probability
+        settled = current[active]
+        balance = bankrolls[active] + np.where(won, settled * payout, -settled)
+        bankrolls[active] = balance
+        spins_played[active] += 1
+        profit = balance - initial_bankroll
+
+        # Promote next_bet and derive the one after it
+        promoted = next_bet[active]
+        current[active] = promoted
+        next_bet[active] = engine.step_batch(batch, active, won, promoted, profit)
+
+        result = np.where(profit <= stop_loss, OUTCOME_STOP_LOSS, np.where(profit >= stop_win, OUTCOME_STOP_WIN, OUTCOME_ACTIVE))
+        result = np.where(balance < settled, OUTCOME_RUIN, result)
+        outcome[active] = result
+        active = active[result == OUTCOME_ACTIVE]
+
+    return {"final_bankroll": bankrolls, "outcome": outcome, "spins_played": spins_played}
+
+
+def summarize_simulation(result, initial_bankroll):
+    """Outcome probabilities and profit distribution for a simulate_progression result."""
+    outcome = result["outcome"]
+    profit = result["final_bankroll"] - int(initial_bankroll)
+    n = len(outcome)
+    percentiles = np.percentile(profit, [5, 25, 50, 75, 95]) if n else np.zeros(5)
+    return {
+        "sessions": n,
+        "probabilities": {OUTCOME_NAMES[code]: float(np.count_nonzero(outcome == code)) / n if n else 0.0 for code in OUTCOME_NAMES},
+        "mean_profit": float(profit.mean()) if n else 0.0,
+        "profit_percentiles": dict(zip(["5%", "25%", "50%", "75%", "95%"], (float(p) for p in percentiles))),
+        "mean_spins": float(result["spins_played"].mean()) if n else 0.0
+    }
@@ -0,0 +1,315 @@
+# progressions.py
+"""Betting progressions as small state machines, registered by display name.
+
+Each class advances one session with step() (used by the Win/Lose buttons and
+the exact Markov solver) and many sessions at once with step_batch() over
+NumPy arrays (used by the Monte Carlo simulator), so the rules live in one
+place. step() receives the bet just promoted to current_bet and returns the
+following next_bet; messages are only built on demand by describe().
+"""
+from collections import deque
+
+import numpy as np
+
+DEFAULT_LABOUCHERE_SEQUENCE = (1, 2, 3, 4)
+FIBONACCI = (1, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+_FIBONACCI_ARRAY = np.array(FIBONACCI, dtype=np.int64)
+# Fibonacci index after a win (two steps back) or a loss (one step forward)
+_FIBONACCI_AFTER_WIN = tuple(max(0, i - 2) for i in range(len(FIBONACCI)))
+_FIBONACCI_AFTER_LOSS = tuple(min(len(FIBONACCI) - 1, i + 1) for i in range(len(FIBONACCI)))
+
+
+class Progression:
+    """Shared step interface. Subclasses only add the slots their state needs."""
+    __slots__ = ("base_unit",)
+    name = None
+
+    def __init__(self, base_unit=10, sequence=None):
+        self.base_unit = base_unit
+
+    def step(self, won, current, profit):
+        """Advance after `current` was promoted to current_bet; return the next bet."""
+        raise NotImplementedError
+
+    def describe(self, won, current, profit, next_bet):
+        return f"{'Win' if won else 'Loss'}! Next bet: {next_bet}"
+
+    def snapshot(self):
+        """Hashable copy of the internal state (None when stateless)."""
+        return None
+
+    def restore(self, snapshot):
+        pass
+
+    def new_batch(self, n_sessions):
+        """Per-session state arrays for step_batch (None when stateless)."""
+        return None
+
+    def step_batch(self, batch, rows, won, current, profit):
+        """Vectorized step() for the sessions in `rows`; returns their next bets."""
+        raise NotImplementedError
+
+
+class Martingale(Progression):
+    __slots__ = ()
+    name = "Martingale"
+    factor = 2
+
+    def step(self, won, current, profit):
+        return self.base_unit if won else current * self.factor
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won, self.base_unit, current * self.factor)
+
+
+class TripleMartingale(Martingale):
+    __slots__ = ()
+    name = "Triple Martingale"
+    factor = 3
+
+
+class Fibonacci(Progression):
+    __slots__ = ("index",)
+    name = "Fibonacci"
+
+    def __init__(self, base_unit=10, sequence=None):
+        super().__init__(base_unit)
+        self.index = 0
+
+    def step(self, won, current, profit):
+        self.index = index = _FIBONACCI_AFTER_WIN[self.index] if won else _FIBONACCI_AFTER_LOSS[self.index]
+        return FIBONACCI[index] * self.base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Move back to {next_bet}" if won else f"Loss! Next Fibonacci bet: {next_bet}"
+
+    def snapshot(self):
+        return self.index
+
+    def restore(self, snapshot):
+        self.index = snapshot
+
+    def new_batch(self, n_sessions):
+        return np.zeros(n_sessions, dtype=np.int64)
+
+    def step_batch(self, batch, rows, won, current, profit):
+        index = np.where(won, np.maximum(0, batch[rows] - 2), np.minimum(len(FIBONACCI) - 1, batch[rows] + 1))
+        batch[rows] = index
+        return _FIBONACCI_ARRAY[index] * self.base_unit
+
+
+class OscarsGrind(Progression):
+    __slots__ = ()
+    name = "Oscar’s Grind"
+
+    def step(self, won, current, profit):
+        if won:
+            return self.base_unit if profit > 0 else current + self.base_unit
+        return current
+
+    def describe(self, won, current, profit, next_bet):
+        if won and profit > 0:
+            return f"Win! Profit achieved, reset to {next_bet}"
+        return f"Win! Increase to {next_bet}" if won else f"Loss! Keep bet at {next_bet}"
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won & (profit > 0), self.base_unit, np.where(won, current + self.base_unit, current))
+
+
+class _LabouchereBatch:
+    """All sessions' Labouchere lists in one 2D buffer addressed by head/tail pointers."""
+
+    def __init__(self, n_sessions, sequence, width=64):
+        sequence = np.asarray(sequence, dtype=np.int64)
+        self.buf = np.zeros((n_sessions, max(width, 2 * len(sequence), 2 * len(DEFAULT_LABOUCHERE_SEQUENCE))), dtype=np.int64)
+        self.buf[:, :len(sequence)] = sequence
+        self.head = np.zeros(n_sessions, dtype=np.int64)
+        self.tail = np.full(n_sessions, len(sequence), dtype=np.int64)
+
+    def reserve(self, rows):
+        # Compact rows whose list has drifted right, then grow if any tail is still at the edge
+        width = self.buf.shape[1]
+        drifted = rows[self.tail[rows] >= width]
+        if drifted.size == 0:
+            return
+        for r in drifted:
+            h, t = self.head[r], self.tail[r]
+            self.buf[r, :t - h] = self.buf[r, h:t].copy()
+            self.head[r], self.tail[r] = 0, t - h
+        if (self.tail[rows] >= width).any():
+            self.buf = np.concatenate([self.buf, np.zeros_like(self.buf)], axis=1)
+
+
+class Labouchere(Progression):
+    __slots__ = ("sequence", "initial_sequence", "event")
+    name = "Labouchere"
+
+    def __init__(self, base_unit=10, sequence=None):
+        super().__init__(base_unit)
+        self.initial_sequence = tuple(sequence) if sequence else DEFAULT_LABOUCHERE_SEQUENCE
+        self.sequence = deque(self.initial_sequence)
+        self.event = None
+
+    def step(self, won, current, profit):
+        sequence = self.sequence
+        if not sequence:
+            # Cleared: restart from the default sequence (not the configured one)
+            sequence.extend(DEFAULT_LABOUCHERE_SEQUENCE)
+            self.event = "reset"
+            return self.base_unit
+        if len(sequence) == 1:
+            next_bet = sequence[0] * self.base_unit
+            if won:
+                sequence.clear()
+            self.event = "single"
+            return next_bet
+        self.event = "sequence"
+        if won:
+            # Cross off the first and last numbers
+            sequence.popleft()
+            sequence.pop()
+            return (sequence[0] + sequence[-1]) * self.base_unit if sequence else self.base_unit
+        # Add the lost bet to the end
+        sequence.append(current // self.base_unit)
+        return (sequence[0] + sequence[-1]) * self.base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        if self.event == "reset":
+            return f"Sequence cleared! Reset to {next_bet}"
+        if self.event == "single":
+            return f"Win! Sequence completed, next bet: {next_bet}" if won else f"Loss! Next bet: {next_bet}"
+        return f"{'Win' if won else 'Loss'}! Sequence: {list(self.sequence)}, next bet: {next_bet}"
+
+    def snapshot(self):
+        return tuple(self.sequence)
+
+    def restore(self, snapshot):
+        self.sequence = deque(snapshot)
+
+    def new_batch(self, n_sessions):
+        return _LabouchereBatch(n_sessions, self.initial_sequence)
+
+    def step_batch(self, batch, rows, won, current, profit):
+        base_unit = self.base_unit
+        head, tail = batch.head[rows], batch.tail[rows]
+        length = tail - head
+        next_bet = np.full(rows.size, base_unit, dtype=np.int64)
+
+        empty = length == 0
+        if empty.any():
+            r = rows[empty]
+            batch.buf[r, :len(DEFAULT_LABOUCHERE_SEQUENCE)] = DEFAULT_LABOUCHERE_SEQUENCE
+            batch.head[r] = 0
+            batch.tail[r] = len(DEFAULT_LABOUCHERE_SEQUENCE)
+
+        single = length == 1
+        if single.any():
+            next_bet[single] = batch.buf[rows[single], head[single]] * base_unit
+            cleared = rows[single & won]
+            batch.head[cleared] = batch.tail[cleared]
+
+        crossed = (length >= 2) & won
+        if crossed.any():
+            r = rows[crossed]
+            batch.head[r] += 1
+            batch.tail[r] -= 1
+            remaining = batch.tail[r] > batch.head[r]
+            ends = batch.buf[r, np.minimum(batch.head[r], batch.buf.shape[1] - 1)] + batch.buf[r, np.maximum(batch.tail[r] - 1, 0)]
+            next_bet[crossed] = np.where(remaining, ends * base_unit, base_unit)
+
+        appended = (length >= 2) & ~won
+        if appended.any():
+            r = rows[appended]
+            batch.reserve(r)
+            batch.buf[r, batch.tail[r]] = current[appended] // base_unit
+            batch.tail[r] += 1
+            next_bet[appended] = (batch.buf[r, batch.head[r]] + batch.buf[r, batch.tail[r] - 1]) * base_unit
+        return next_bet
+
+
+class Ladder(Progression):
+    __slots__ = ()
+    name = "Ladder"
+
+    def step(self, won, current, profit):
+        return current + self.base_unit if won else self.base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Increase to {next_bet}" if won else f"Loss! Reset to {next_bet}"
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won, current + self.base_unit, self.base_unit)
+
+
+class DAlembert(Progression):
+    __slots__ = ()
+    name = "D’Alembert"
+
+    def step(self, won, current, profit):
+        base_unit = self.base_unit
+        if won:
+            return current - base_unit if current > 2 * base_unit else base_unit
+        return current + base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Decrease to {next_bet}" if won else f"Loss! Increase to {next_bet}"
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won, np.maximum(self.base_unit, current - self.base_unit), current + self.base_unit)
+
+
+class DoubleAfterWin(Progression):
+    __slots__ = ()
+    name = "Double After a Win"
+
+    def step(self, won, current, profit):
+        return current * 2 if won else self.base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Double to {next_bet}" if won else f"Loss! Reset to {next_bet}"
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won, current * 2, self.base_unit)
+
+
+class PlusOneMinusOne(Progression):
+    __slots__ = ()
+    name = "+1 Win / -1 Loss"
+    win_units = 1
+
+    def step(self, won, current, profit):
+        base_unit = self.base_unit
+        if won:
+            return current + base_unit * self.win_units
+        return current - base_unit if current > 2 * base_unit else base_unit
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Increase to {next_bet}" if won else f"Loss! Decrease to {next_bet}"
+
+    def step_batch(self, batch, rows, won, current, profit):
+        return np.where(won, current + self.base_unit * self.win_units, np.maximum(self.base_unit, current - self.base_unit))
+
+
+class PlusTwoMinusOne(PlusOneMinusOne):
+    __slots__ = ()
+    name = "+2 Win / -1 Loss"
+    win_units = 2
+
+    def describe(self, won, current, profit, next_bet):
+        return f"Win! Increase by 2 units to {next_bet}" if won else f"Loss! Decrease to {next_bet}"
+
+
+PROGRESSION_CLASSES = {
+    cls.name: cls for cls in [
+        Martingale, Fibonacci, TripleMartingale, OscarsGrind, Labouchere, Ladder,
+        DAlembert, DoubleAfterWin, PlusOneMinusOne, PlusTwoMinusOne
+    ]
+}
+PROGRESSIONS = list(PROGRESSION_CLASSES)
+
+
+def make_progression(name, base_unit=10, sequence=None):
+    """Instantiate the registered progression `name`."""
+    if name not in PROGRESSION_CLASSES:
+        raise ValueError(f"Unknown progression '{name}'.")
+    return PROGRESSION_CLASSES[name](base_unit, sequence)
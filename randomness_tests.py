@@ -0,0 +1,139 @@
+# randomness_tests.py
+"""Battery of randomness tests over a whole spin history, vectorized with numpy.
+
+run_battery() takes the spins as a list or array (including a spin archive
+memmap) and returns one row per test:
+
+- Wald-Wolfowitz runs tests on red/black and odd/even (zeros dropped)
+- lag-1 serial correlation of the pocket numbers
+- lag-k autocorrelation of the wheel position, treated as an angle so the
+  wheel wraps around (mean cosine of the angle difference, about 0 at random)
+- approximate entropy of the red/black sequence (NIST SP 800-22 style)
+
+Every test is a handful of array passes, so 100,000 spins take a few
+milliseconds.
+"""
+import math
+
+import numpy as np
+
+from bias_tests import chi_square_p_value, normal_p_value
+from roulette_data import EVEN_MONEY, WHEEL_POSITION
+
+DEFAULT_MAX_LAG = 5
+APEN_BLOCK = 2
+# p-values below these are flagged
+FAIL_LEVEL = 0.01
+SUSPICIOUS_LEVEL = 0.05
+
+# Per-pocket lookups; -1 marks zero, which belongs to neither side of a bet
+_RED = np.full(37, -1, dtype=np.int8)
+_RED[1:] = 0
+_RED[list(EVEN_MONEY["Red"])] = 1
+_EVEN = np.full(37, -1, dtype=np.int8)
+_EVEN[list(EVEN_MONEY["Odd"])] = 0
+_EVEN[list(EVEN_MONEY["Even"])] = 1
+_ANGLE = 2 * np.pi * np.array(WHEEL_POSITION) / 37
+
+
+def _verdict(p_value):
+    if p_value is None:
+        return "Not enough spins"
+    if p_value < FAIL_LEVEL:
+        return "Fail"
+    if p_value < SUSPICIOUS_LEVEL:
+        return "Suspicious"
+    return "Pass"
+
+
+def _row(test, statistic, p_value, detail=""):
+    return {"test": test, "statistic": statistic, "p_value": p_value, "verdict": _verdict(p_value), "detail": detail}
+
+
+def runs_test(bits, label):
+    """Wald-Wolfowitz runs test on a 0/1 array."""
+    n = bits.size
+    ones = int(bits.sum())
+    zeros = n - ones
+    if ones == 0 or zeros == 0 or n < 3:
+        return _row(f"Runs ({label})", None, None)
+    runs = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+    expected = 2 * ones * zeros / n + 1
+    variance = 2 * ones * zeros * (2 * ones * zeros - n) / (n * n * (n - 1))
+    if variance <= 0:
+        return _row(f"Runs ({label})", None, None)
+    z = (runs - expected) / math.sqrt(variance)
+    return _row(f"Runs ({label})", z, normal_p_value(z), f"{runs} runs, {expected:.1f} expected")
+
+
+def serial_correlation(spins):
+    """Lag-1 correlation of consecutive pocket numbers; z = r * sqrt(n)."""
+    if spins.size < 3:
+        return _row("Serial Correlation (numbers)", None, None)
+    x = spins.astype(np.float64)
+    x -= x.mean()
+    denominator = float(np.dot(x, x))
+    if denominator == 0:
+        return _row("Serial Correlation (numbers)", None, None)
+    r = float(np.dot(x[:-1], x[1:])) / denominator
+    z = r * math.sqrt(spins.size)
+    return _row("Serial Correlation (numbers)", z, normal_p_value(z), f"r = {r:+.4f}")
+
+
+def wheel_autocorrelation(spins, max_lag=DEFAULT_MAX_LAG):
+    """Circular autocorrelation of wheel position at lags 1..max_lag.
+
+    Under independence cos(angle_t - angle_t+k) has mean 0 and variance 1/2,
+    so z = mean * sqrt(2 * (n - k)).
+    """
+    angles = _ANGLE[spins]
+    rows = []
+    for lag in range(1, max_lag + 1):
+        pairs = spins.size - lag
+        if pairs < 2:
+            rows.append(_row(f"Wheel Autocorrelation (lag {lag})", None, None))
+            continue
+        mean = float(np.cos(angles[lag:] - angles[:-lag]).mean())
+        z = mean * math.sqrt(2 * pairs)
+        rows.append(_row(f"Wheel Autocorrelation (lag {lag})", z, normal_p_value(z), f"mean cosine {mean:+.4f}"))
+    return rows
+
+
+def _phi(bits, m):
+    # Frequencies of every overlapping (cyclic) m-bit block, as sum p log p
+    n = bits.size
+    extended = np.concatenate((bits, bits[:m - 1])).astype(np.int64)
+    codes = np.zeros(n, dtype=np.int64)
+    for j in range(m):
+        codes = (codes << 1) | extended[j:j + n]
+    counts = np.bincount(codes, minlength=1 << m)
+    counts = counts[counts > 0] / n
+    return float(np.sum(counts * np.log(counts)))
+
+
+def approximate_entropy(bits, label, m=APEN_BLOCK):
+    """NIST approximate-entropy test: chi-square = 2n (ln 2 - ApEn(m)) with 2^m degrees of freedom."""
+    n = bits.size
+    if n < 2 ** (m + 5):
+        return _row(f"Approximate Entropy ({label})", None, None)
+    apen = _phi(bits, m) - _phi(bits, m + 1)
+    statistic = max(0.0, 2 * n * (math.log(2) - apen))
+    return _row(f"Approximate Entropy ({label})", statistic, chi_square_p_value(statistic, 2 ** m), f"ApEn = {apen:.5f}")
+
+
+def run_battery(spins, max_lag=DEFAULT_MAX_LAG):
+    """Run every test on a spin history. Returns a list of rows (test, statistic, p_value, verdict, detail)."""
+    if isinstance(spins, np.ndarray):
+        spins = spins.astype(np.int64)
+    else:
+        spins = np.fromiter((int(s) for s in spins), dtype=np.int64)
+    if spins.size and (spins.min() < 0 or spins.max() > 36):
+        raise ValueError("Spins must be between 0 and 36.")
+    red = _RED[spins]
+    red = red[red >= 0]
+    even = _EVEN[spins]
+    even = even[even >= 0]
+    rows = [runs_test(red, "Red/Black"), runs_test(even, "Even/Odd"), serial_correlation(spins)]
+    rows.extend(wheel_autocorrelation(spins, max_lag))
+    rows.append(approximate_entropy(red, "Red/Black"))
+    return rows
@@ -114,6 +114,21 @@ SPLITS = {
 
 LEFT_OF_ZERO_EUROPEAN = [26, 3, 35, 12, 28, 7, 29, 18, 22, 9, 31, 14, 20, 1, 33, 16, 24, 5]
 RIGHT_OF_ZERO_EUROPEAN = [32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10]
+SIDES_OF_ZERO = {"Left Side of Zero": LEFT_OF_ZERO_EUROPEAN, "Right Side of Zero": RIGHT_OF_ZERO_EUROPEAN}
+STRAIGHT_UPS = {n: [n] for n in range(37)}
+
+# Every bet family, by the kind used in strategy bets, payouts and trackers: kind -> {bet name: pockets}
+BET_FAMILIES = {
+    "even_money": EVEN_MONEY,
+    "dozen": DOZENS,
+    "column": COLUMNS,
+    "street": STREETS,
+    "corner": CORNERS,
+    "six_line": SIX_LINES,
+    "split": SPLITS,
+    "side": SIDES_OF_ZERO,
+    "number": STRAIGHT_UPS
+}
 
 colors = {
     "0": "green",
@@ -123,4 +138,16 @@ colors = {
     "2": "black", "4": "black", "6": "black", "8": "black", "10": "black", "11": "black",
     "13": "black", "15": "black", "17": "black", "20": "black", "22": "black", "24": "black",
     "26": "black", "28": "black", "29": "black", "31": "black", "33": "black", "35": "black"
-}
\ No newline at end of file
+}
+
+# Per-pocket lookup tables (index = pocket number 0-36)
+# Dozen/column/street index is 1-based; 0 means the pocket is not in any (i.e., zero)
+POCKET_DOZEN = [0] + [(n - 1) // 12 + 1 for n in range(1, 37)]
+POCKET_COLUMN = [0] + [(n - 1) % 3 + 1 for n in range(1, 37)]
+POCKET_STREET = [0] + [(n - 1) // 3 + 1 for n in range(1, 37)]
+# Side of zero: 0 = zero, 1 = left side, 2 = right side
+POCKET_SIDE = [0 if n == 0 else (1 if n in LEFT_OF_ZERO_EUROPEAN else 2) for n in range(37)]
+# Index of each pocket in WHEEL_EUROPEAN
+WHEEL_POSITION = [WHEEL_EUROPEAN.index(n) for n in range(37)]
+# Non-overlapping six-line (1-6, 7-12, ..., 31-36), 1-based; 0 for zero
+POCKET_SIX_LINE = [0] + [(n - 1) // 6 + 1 for n in range(1, 37)]
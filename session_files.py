@@ -0,0 +1,19 @@
+# session_files.py
+"""Reading the session files written by the app's Save Session button.
+
+Sessions are JSON, optionally gzip-compressed; the app and the batch
+backtester both load them through read_session_file().
+"""
+import gzip
+import json
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_session_file(path):
+    """Load a session file as a dict, transparently handling gzip-compressed saves."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
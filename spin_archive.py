@@ -0,0 +1,112 @@
+# spin_archive.py
+"""Flat spin archive: one unsigned byte (0-36) per spin, no header.
+
+The format is deliberately trivial so that tens of millions of recorded spins
+can be opened with np.memmap and scanned chunk by chunk without ever being
+turned into Python lists.
+"""
+import os
+
+import numpy as np
+
+from roulette_data import (
+    EVEN_MONEY, DOZENS, COLUMNS, STREETS, CORNERS, SIX_LINES, SPLITS,
+    LEFT_OF_ZERO_EUROPEAN, RIGHT_OF_ZERO_EUROPEAN, POCKET_DOZEN, POCKET_SIDE
+)
+
+ARCHIVE_EXTENSION = ".spins"
+ARCHIVE_DTYPE = np.uint8
+# 1 MiB of spins per chunk keeps the bincount scratch buffer cache-resident
+DEFAULT_CHUNK_SPINS = 1 << 20
+
+# Membership matrices (pocket x category) used to fold pocket counts into sections
+_DOZEN_MATRIX = np.zeros((37, 4), dtype=np.int64)
+_DOZEN_MATRIX[np.arange(37), POCKET_DOZEN] = 1
+_SIDE_MATRIX = np.zeros((37, 3), dtype=np.int64)
+_SIDE_MATRIX[np.arange(37), POCKET_SIDE] = 1
+
+
+def _as_spin_array(spins):
+    """Convert spins (ints, numeric strings or an array) to a validated uint8 array."""
+    if isinstance(spins, np.ndarray):
+        data = spins
+    else:
+        data = np.fromiter((int(s) for s in spins), dtype=np.int64)
+    if data.size and (data.min() < 0 or data.max() > 36):
+        raise ValueError("Spin archive values must be between 0 and 36.")
+    return data.astype(ARCHIVE_DTYPE, copy=False)
+
+
+def write_archive(path, spins, append=False):
+    """Write (or append) spins to a flat archive file. Returns the number of spins written."""
+    data = _as_spin_array(spins)
+    with open(path, "ab" if append else "wb") as f:
+        f.write(data.tobytes())
+    return int(data.size)
+
+
+def open_archive(path):
+    """Open an archive read-only as a zero-copy uint8 memmap."""
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=ARCHIVE_DTYPE)
+    return np.memmap(path, dtype=ARCHIVE_DTYPE, mode="r")
+
+
+def iter_chunks(archive, chunk_spins=DEFAULT_CHUNK_SPINS, start=0, stop=None):
+    """Yield consecutive views of the archive, chunk_spins spins at a time."""
+    if isinstance(archive, (str, os.PathLike)):
+        archive = open_archive(archive)
+    stop = len(archive) if stop is None else min(stop, len(archive))
+    for offset in range(start, stop, chunk_spins):
+        yield archive[offset:min(offset + chunk_spins, stop)]
+
+
+def pocket_counts(archive, chunk_spins=DEFAULT_CHUNK_SPINS, start=0, stop=None):
+    """Count hits per pocket over the archive (or a [start, stop) slice of it)."""
+    counts = np.zeros(37, dtype=np.int64)
+    for chunk in iter_chunks(archive, chunk_spins, start, stop):
+        chunk_counts = np.bincount(chunk, minlength=37)
+        if len(chunk_counts) > 37:
+            raise ValueError("Spin archive contains values outside 0-36; the file is not a spin archive.")
+        counts += chunk_counts
+    return counts
+
+
+def scores_from_counts(counts):
+    """Fold per-pocket counts into the same score dictionaries RouletteState keeps."""
+    counts = [int(c) for c in counts]
+
+    def fold(sections):
+        return {name: sum(counts[n] for n in numbers) for name, numbers in sections.items()}
+
+    return {
+        "scores": {n: counts[n] for n in range(37)},
+        "even_money_scores": fold(EVEN_MONEY),
+        "dozen_scores": fold(DOZENS),
+        "column_scores": fold(COLUMNS),
+        "street_scores": fold(STREETS),
+        "corner_scores": fold(CORNERS),
+        "six_line_scores": fold(SIX_LINES),
+        "split_scores": fold(SPLITS),
+        "side_scores": {
+            "Left Side of Zero": sum(counts[n] for n in LEFT_OF_ZERO_EUROPEAN),
+            "Right Side of Zero": sum(counts[n] for n in RIGHT_OF_ZERO_EUROPEAN)
+        }
+    }
+
+
+def archive_stats(archive, chunk_spins=DEFAULT_CHUNK_SPINS, start=0, stop=None):
+    """Full-archive frequency, dozen and side-of-zero statistics plus all section scores."""
+    counts = pocket_counts(archive, chunk_spins, start, stop)
+    total = int(counts.sum())
+    dozens = counts @ _DOZEN_MATRIX
+    sides = counts @ _SIDE_MATRIX
+    stats = {
+        "total_spins": total,
+        "pocket_counts": counts.tolist(),
+        "pocket_frequency": (counts / total).tolist() if total else [0.0] * 37,
+        "dozens": {"Zero": int(dozens[0]), "1st Dozen": int(dozens[1]), "2nd Dozen": int(dozens[2]), "3rd Dozen": int(dozens[3])},
+        "sides_of_zero": {"Zero": int(sides[0]), "Left Side of Zero": int(sides[1]), "Right Side of Zero": int(sides[2])}
+    }
+    stats.update(scores_from_counts(counts))
+    return stats
@@ -0,0 +1,69 @@
+# spin_export.py
+"""Columnar export of an annotated spin history (Parquet, Arrow/Feather or CSV).
+
+Every derived column is a lookup-table gather over the pocket array, so the
+whole history is annotated in one vectorized pass.
+"""
+import numpy as np
+import pandas as pd
+
+from roulette_data import (
+    EVEN_MONEY, colors, POCKET_DOZEN, POCKET_COLUMN, POCKET_STREET,
+    POCKET_SIX_LINE, POCKET_SIDE, WHEEL_POSITION
+)
+from spin_archive import _as_spin_array
+
+EXPORT_FORMATS = {"Parquet": ".parquet", "Arrow": ".arrow", "CSV": ".csv"}
+
+_COLOR_CATEGORIES = ["Green", "Red", "Black"]
+_COLOR_CODES = np.array([_COLOR_CATEGORIES.index(colors[str(n)].capitalize()) for n in range(37)], dtype=np.int8)
+_PARITY_CATEGORIES = ["Zero", "Even", "Odd"]
+_PARITY_CODES = np.array([0] + [1 if n in EVEN_MONEY["Even"] else 2 for n in range(1, 37)], dtype=np.int8)
+_LOW_HIGH_CATEGORIES = ["Zero", "Low", "High"]
+_LOW_HIGH_CODES = np.array([0] + [1 if n in EVEN_MONEY["Low"] else 2 for n in range(1, 37)], dtype=np.int8)
+_SIDE_CATEGORIES = ["Zero", "Left Side of Zero", "Right Side of Zero"]
+_SIDE_CODES = np.array(POCKET_SIDE, dtype=np.int8)
+_DOZEN_LUT = np.array(POCKET_DOZEN, dtype=np.int8)
+_COLUMN_LUT = np.array(POCKET_COLUMN, dtype=np.int8)
+_STREET_LUT = np.array(POCKET_STREET, dtype=np.int8)
+_SIX_LINE_LUT = np.array(POCKET_SIX_LINE, dtype=np.int8)
+_WHEEL_POSITION_LUT = np.array(WHEEL_POSITION, dtype=np.int8)
+
+
+def annotate_spins(spins):
+    """Return a DataFrame with one row per spin and all derived bet-family columns.
+
+    Dozen, column, street and six-line are 1-based indices (0 for zero); six-line
+    refers to the non-overlapping lines 1-6, 7-12, ..., 31-36.
+    """
+    pockets = _as_spin_array(spins)
+    return pd.DataFrame({
+        "index": np.arange(len(pockets), dtype=np.int64),
+        "pocket": pockets,
+        "color": pd.Categorical.from_codes(_COLOR_CODES[pockets], _COLOR_CATEGORIES),
+        "parity": pd.Categorical.from_codes(_PARITY_CODES[pockets], _PARITY_CATEGORIES),
+        "low_high": pd.Categorical.from_codes(_LOW_HIGH_CODES[pockets], _LOW_HIGH_CATEGORIES),
+        "dozen": _DOZEN_LUT[pockets],
+        "column": _COLUMN_LUT[pockets],
+        "street": _STREET_LUT[pockets],
+        "six_line": _SIX_LINE_LUT[pockets],
+        "side_of_zero": pd.Categorical.from_codes(_SIDE_CODES[pockets], _SIDE_CATEGORIES),
+        "wheel_position": _WHEEL_POSITION_LUT[pockets]
+    })
+
+
+def export_spin_history(spins, path, fmt="Parquet"):
+    """Write the annotated history to path in the given format. Returns the path."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'. Choose one of: {', '.join(EXPORT_FORMATS)}.")
+    df = annotate_spins(spins)
+    try:
+        if fmt == "Parquet":
+            df.to_parquet(path, index=False)
+        elif fmt == "Arrow":
+            df.to_feather(path)
+        else:
+            df.to_csv(path, index=False)
+    except ImportError as e:
+        raise ImportError(f"{fmt} export needs pyarrow installed ({e}). Use CSV or install pyarrow.") from e
+    return path
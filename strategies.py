@@ -0,0 +1,1195 @@
+# strategies.py
+"""Betting strategies evaluated against a scores state.
+
+Every strategy takes a state object (anything exposing the RouletteState score
+dictionaries plus ``wheel_sectors``, ``gaps``, ``dealer_signature``, ``posterior``, ``version`` and ``analysis_cache``) and returns a
+StrategyResult. The same result feeds the text recommendations and the
+dynamic table highlights, so each strategy is computed once per state version.
+A strategy that reads one of the trackers lists it under "needs" in
+STRATEGIES, so backtests only build and update the trackers it uses. Knobs a
+strategy takes as keyword arguments are listed under "params"; they keep the
+function's defaults unless evaluate_strategy is given other values. A
+strategy flagged "text_optional" takes with_text=False and then only works
+out its bets, which is all a backtest replay reads.
+
+A state may also carry ``custom_strategies``, a dict shaped like STRATEGIES
+holding that session's own (rule-based) strategies; they run everywhere a
+built-in does without ever being added to the shared STRATEGIES.
+"""
+from operator import itemgetter
+
+from bet_cover import best_cover
+from payouts import strategy_vector, variance
+from roulette_data import DOZENS, SIX_LINES, NEIGHBORS_EUROPEAN, POCKET_DOZEN, BET_FAMILIES
+from wheel_sectors import MAX_SECTOR_LENGTH, MIN_SECTOR_LENGTH
+
+TIER_LABELS = ["Top", "Middle", "Lower"]
+
+
+class StrategyResult:
+    """Structured strategy output: display text plus tiered bets.
+
+    bets is an ordered list of (kind, name, score, tier) tuples. kind is a key of
+    roulette_data.BET_FAMILIES ("number" bets are named by their pocket). tier 0/1/2 maps to the
+    top/middle/lower highlight colors; later bets override earlier ones on the table.
+    """
+    __slots__ = ("text", "bets", "is_html")
+
+    def __init__(self, text="", bets=None, is_html=False):
+        self.text = text
+        self.bets = bets if bets is not None else []
+        self.is_html = is_html
+
+    def add(self, kind, name, score, tier=0):
+        self.bets.append((kind, name, score, tier))
+
+
+def bet_numbers(kind, name):
+    """Return the pockets covered by a bet from a StrategyResult."""
+    if kind == "number":
+        return [name]
+    return BET_FAMILIES[kind][name]
+
+
+def _cache(state):
+    """Per-state cache that is dropped whenever the state version changes."""
+    cache = state.analysis_cache
+    if cache.get("version") != state.version:
+        cache.clear()
+        cache["version"] = state.version
+    return cache
+
+
+# Ranking key -> bet kind; the kind's scores live in the "<kind>_scores" state attribute
+RANKING_KINDS = {
+    "even_money": "even_money",
+    "dozens": "dozen",
+    "columns": "column",
+    "streets": "street",
+    "six_lines": "six_line",
+    "corners": "corner",
+    "splits": "split",
+    "sides": "side",
+    "numbers": "number"
+}
+
+
+def _number_rank(item):
+    return -item[1], item[0]
+
+
+class _Rankings(dict):
+    """Rankings sorted on first access, so a strategy only pays for the families it reads."""
+
+    def __init__(self, state):
+        super().__init__()
+        self.state = state
+
+    def __missing__(self, key):
+        if key == "numbers":
+            # Ties between numbers are broken by the lower number
+            ranking = sorted(self.state.scores.items(), key=_number_rank)
+        else:
+            ranking = sorted(getattr(self.state, f"{RANKING_KINDS[key]}_scores").items(), key=itemgetter(1), reverse=True)
+        self[key] = ranking
+        return ranking
+
+
+def get_rankings(state):
+    """Shared rankings (highest score first) computed once per state version."""
+    cache = _cache(state)
+    rankings = cache.get("rankings")
+    if rankings is None:
+        rankings = cache["rankings"] = _Rankings(state)
+    return rankings
+
+
+def find_strategy(strategy_name, custom_strategies=None):
+    """The STRATEGIES entry of a strategy, looking in custom_strategies first."""
+    if custom_strategies and strategy_name in custom_strategies:
+        return custom_strategies[strategy_name]
+    if strategy_name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy_name}'.")
+    return STRATEGIES[strategy_name]
+
+
+def strategy_names(custom_strategies=None):
+    """Names of the built-in strategies followed by the custom ones."""
+    return [*STRATEGIES, *(custom_strategies or ())]
+
+
+def evaluate_strategy(state, strategy_name, neighbours_count=2, strong_numbers_count=1, params=None, with_text=True):
+    """Run a strategy once per state version and parameter set, returning its StrategyResult.
+
+    params maps knobs listed under the strategy's "params" to values; knobs left
+    out keep the strategy's defaults. with_text=False asks for the bets only:
+    "text_optional" strategies then leave result.text empty.
+    """
+    strategy = find_strategy(strategy_name, getattr(state, "custom_strategies", None))
+    strategy_func = strategy["function"]
+    params = params or {}
+    unknown = set(params) - set(strategy.get("params", ()))
+    if unknown:
+        raise ValueError(f"Strategy '{strategy_name}' has no parameter(s) {', '.join(sorted(unknown))}.")
+    if strategy_name == "Neighbours of Strong Number":
+        key = (strategy_name, neighbours_count, strong_numbers_count)
+    else:
+        key = (strategy_name, *sorted(params.items()))
+    bets_only = not with_text and strategy.get("text_optional", False)
+    results = _cache(state).setdefault("strategies", {})
+    # A full result serves a bets-only caller as well
+    result = results.get(key)
+    if result is None and bets_only:
+        key += ("bets only",)
+        result = results.get(key)
+    if result is None:
+        if bets_only:
+            params = {**params, "with_text": False}
+        if strategy_name == "Neighbours of Strong Number":
+            result = strategy_func(state, neighbours_count, strong_numbers_count, **params)
+        else:
+            result = strategy_func(state, **params)
+        results[key] = result
+    return result
+
+
+def _hits(sorted_items):
+    return [item for item in sorted_items if item[1] > 0]
+
+
+def _top_with_ties(sorted_items, count):
+    """Collect the top `count` entries, extended by any entries tied with them."""
+    top = []
+    scores_seen = set()
+    for name, score in sorted_items:
+        if len(top) < count or score in scores_seen:
+            top.append((name, score))
+            scores_seen.add(score)
+        else:
+            break
+    return top
+
+
+def _tie_notes(top, places, recommendations):
+    places_text = ["1st", "2nd", "3rd"]
+    for idx in range(places):
+        if len(top) > max(idx, 1):
+            place_score = top[idx][1]
+            tied = [name for name, score in top if score == place_score]
+            if len(tied) > 1:
+                recommendations.append(f"Note: Tie for {places_text[idx]} place among {', '.join(tied)} with score {place_score}")
+
+
+def _ranked_top_lines(title, sorted_items, count, recommendations):
+    """Top-N listing with tie notes, shared by the best-X (+ Top 18) strategies."""
+    top = _top_with_ties(sorted_items, count)
+    recommendations.append(f"{title} (Top {count}):")
+    for i, (name, score) in enumerate(top[:count], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    _tie_notes(top, count, recommendations)
+
+
+def _add_tiered_sections(result, kind, items, tier_size=3):
+    for i, (name, score) in enumerate(items):
+        result.add(kind, name, score, min(i // tier_size, 2))
+
+
+def _add_top_hits(result, kind, sorted_items, count):
+    for tier, (name, score) in enumerate(_hits(sorted_items)[:count]):
+        result.add(kind, name, score, tier)
+
+
+def _top_18_section(state, result, recommendations=None):
+    """Bet the 18 strongest numbers in tiers of six; recommendations=None skips the text."""
+    numbers_hits = _hits(get_rankings(state)["numbers"])
+    if len(numbers_hits) < 18:
+        if recommendations is not None:
+            recommendations.append("Top Pick 18 Numbers without Neighbours: Not enough numbers have hit yet (need at least 18).")
+        return
+    top_18 = numbers_hits[:18]
+    for i, (num, score) in enumerate(top_18):
+        result.add("number", num, score, i // 6)
+    if recommendations is None:
+        return
+    recommendations.append("Top Pick 18 Numbers without Neighbours:")
+    for tier, heading in enumerate(["\nTop 6 Numbers (Yellow):", "\nNext 6 Numbers (Blue):", "\nLast 6 Numbers (Green):"]):
+        recommendations.append(heading)
+        for i, (num, score) in enumerate(top_18[tier * 6:(tier + 1) * 6], 1):
+            recommendations.append(f"{i}. Number {num} (Score: {score})")
+
+
+def _neighbour_walk(number, count):
+    """Numbers up to `count` pockets to the left and right of `number` on the wheel."""
+    neighbors = set()
+    for side in (0, 1):
+        current_number = number
+        for _ in range(count):
+            next_number = NEIGHBORS_EUROPEAN.get(current_number, (None, None))[side]
+            if next_number is None:
+                break
+            neighbors.add(next_number)
+            current_number = next_number
+    return neighbors
+
+
+def best_even_money_bets(state):
+    result = StrategyResult()
+    recommendations = []
+    sorted_even_money = get_rankings(state)["even_money"]
+    if not _hits(sorted_even_money):
+        recommendations.append("Best Even Money Bets: No hits yet.")
+    else:
+        _ranked_top_lines("Best Even Money Bets", sorted_even_money, 3, recommendations)
+        _add_top_hits(result, "even_money", sorted_even_money, 3)
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def hot_bet_strategy(state, with_text=True):
+    result = StrategyResult()
+    rankings = get_rankings(state)
+
+    # Table: top two of each outside bet, top nine streets/corners/splits in tiers of three
+    for kind, key in [("even_money", "even_money"), ("dozen", "dozens"), ("column", "columns")]:
+        for tier, (name, score) in enumerate(rankings[key][:2]):
+            result.add(kind, name, score, tier)
+    for kind, key in [("street", "streets"), ("corner", "corners"), ("split", "splits")]:
+        _add_tiered_sections(result, kind, rankings[key][:9])
+    if not with_text:
+        return result
+
+    recommendations = []
+    for key, label, limit, blank in [("even_money", "Even Money", 2, ""), ("dozens", "Dozens", 2, "\n"), ("columns", "Columns", 2, "\n")]:
+        hits = _hits(rankings[key])
+        if hits:
+            recommendations.append(f"{blank}{label} (Top 2):")
+            for i, (name, score) in enumerate(hits[:limit], 1):
+                recommendations.append(f"{i}. {name}: {score}")
+        else:
+            recommendations.append(f"{blank}{label}: No hits yet.")
+
+    for key, label in [("streets", "Streets"), ("corners", "Corners"), ("six_lines", "Double Streets"), ("splits", "Splits")]:
+        hits = _hits(rankings[key])
+        if hits:
+            recommendations.append(f"\n{label} (Ranked):")
+            for i, (name, score) in enumerate(hits, 1):
+                recommendations.append(f"{i}. {name}: {score}")
+        else:
+            recommendations.append(f"\n{label}: No hits yet.")
+
+    sides_hits = _hits(rankings["sides"])
+    if sides_hits:
+        recommendations.append("\nSides of Zero:")
+        recommendations.append(f"1. {sides_hits[0][0]}: {sides_hits[0][1]}")
+    else:
+        recommendations.append("\nSides of Zero: No hits yet.")
+
+    numbers_hits = _hits(rankings["numbers"])
+    if numbers_hits:
+        number_best = numbers_hits[0]
+        left_neighbor, right_neighbor = NEIGHBORS_EUROPEAN[number_best[0]]
+        recommendations.append(f"\nStrongest Number: {number_best[0]} (Score: {number_best[1]}) with neighbors {left_neighbor} and {right_neighbor}")
+    else:
+        recommendations.append("\nStrongest Number: No hits yet.")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def cold_bet_strategy(state, with_text=True):
+    result = StrategyResult()
+    families = [
+        ("even_money", state.even_money_scores, "Even Money", 2, ""),
+        ("dozen", state.dozen_scores, "Dozens", 2, "\n"),
+        ("column", state.column_scores, "Columns", 2, "\n"),
+        ("street", state.street_scores, "Streets", 3, "\n"),
+        ("corner", state.corner_scores, "Corners", 3, "\n"),
+        ("six_line", state.six_line_scores, "Double Streets", 3, "\n"),
+        ("split", state.split_scores, "Splits", 3, "\n")
+    ]
+    ascending = {kind: sorted(score_dict.items(), key=lambda x: x[1]) for kind, score_dict, _, _, _ in families}
+
+    # Table: the two coldest outside bets, nine coldest streets/corners/splits in tiers of three
+    for kind in ["even_money", "dozen", "column"]:
+        for tier, (name, score) in enumerate(ascending[kind][:2]):
+            result.add(kind, name, score, tier)
+    for kind in ["street", "corner", "split"]:
+        _add_tiered_sections(result, kind, ascending[kind][:9])
+    if not with_text:
+        return result
+
+    recommendations = []
+    for kind, score_dict, label, limit, blank in families:
+        sorted_items = ascending[kind]
+        non_hits = [item for item in sorted_items if item[1] == 0]
+        hits = [item for item in sorted_items if item[1] > 0]
+        if non_hits:
+            recommendations.append(f"{blank}{label} (Not Hit):")
+            recommendations.append(", ".join(item[0] for item in non_hits))
+        if hits:
+            recommendations.append(f"\n{label} (Lowest Scores):")
+            for i, (name, score) in enumerate(hits[:limit], 1):
+                recommendations.append(f"{i}. {name}: {score}")
+
+    sorted_sides = sorted(state.side_scores.items(), key=lambda x: x[1])
+    sides_non_hits = [item for item in sorted_sides if item[1] == 0]
+    sides_hits = [item for item in sorted_sides if item[1] > 0]
+    if sides_non_hits:
+        recommendations.append("\nSides of Zero (Not Hit):")
+        recommendations.append(", ".join(item[0] for item in sides_non_hits))
+    if sides_hits:
+        recommendations.append("\nSides of Zero (Lowest Score):")
+        recommendations.append(f"1. {sides_hits[0][0]}: {sides_hits[0][1]}")
+
+    sorted_numbers = sorted(state.scores.items(), key=lambda x: x[1])
+    numbers_non_hits = [item for item in sorted_numbers if item[1] == 0]
+    numbers_hits = [item for item in sorted_numbers if item[1] > 0]
+    if numbers_non_hits:
+        recommendations.append("\nNumbers (Not Hit):")
+        recommendations.append(", ".join(str(item[0]) for item in numbers_non_hits))
+    if numbers_hits:
+        number_worst = numbers_hits[0]
+        left_neighbor, right_neighbor = NEIGHBORS_EUROPEAN[number_worst[0]]
+        recommendations.append(f"\nColdest Number: {number_worst[0]} (Score: {number_worst[1]}) with neighbors {left_neighbor} and {right_neighbor}")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def best_dozens(state):
+    result = StrategyResult()
+    recommendations = []
+    dozens_hits = _hits(get_rankings(state)["dozens"])
+    if dozens_hits:
+        recommendations.append("Best Dozens (Top 2):")
+        for i, (name, score) in enumerate(dozens_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+        _add_top_hits(result, "dozen", dozens_hits, 2)
+    else:
+        recommendations.append("Best Dozens: No hits yet.")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def best_columns(state):
+    result = StrategyResult()
+    recommendations = []
+    columns_hits = _hits(get_rankings(state)["columns"])
+    if columns_hits:
+        recommendations.append("Best Columns (Top 2):")
+        for i, (name, score) in enumerate(columns_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+        _add_top_hits(result, "column", columns_hits, 2)
+    else:
+        recommendations.append("Best Columns: No hits yet.")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def fibonacci_strategy(state):
+    result = StrategyResult()
+    recommendations = []
+    rankings = get_rankings(state)
+    dozens_hits = _hits(rankings["dozens"])
+    columns_hits = _hits(rankings["columns"])
+
+    if not dozens_hits and not columns_hits:
+        recommendations.append("Fibonacci Strategy: No hits in Dozens or Columns yet.")
+        result.text = "\n".join(recommendations)
+        return result
+
+    best_dozen_score = dozens_hits[0][1] if dozens_hits else 0
+    best_column_score = columns_hits[0][1] if columns_hits else 0
+
+    if best_dozen_score > best_column_score:
+        recommendations.append("Best Category: Dozens")
+        recommendations.append(f"Best Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
+    elif best_column_score > best_dozen_score:
+        recommendations.append("Best Category: Columns")
+        recommendations.append(f"Best Column: {columns_hits[0][0]} (Score: {columns_hits[0][1]})")
+    else:
+        recommendations.append(f"Best Category (Tied): Dozens and Columns (Score: {best_dozen_score})")
+        if dozens_hits:
+            recommendations.append(f"Best Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
+        if columns_hits:
+            recommendations.append(f"Best Column: {columns_hits[0][0]} (Score: {columns_hits[0][1]})")
+
+    # Table: one bet on the stronger category, dozens win ties
+    if best_dozen_score >= best_column_score:
+        result.add("dozen", rankings["dozens"][0][0], best_dozen_score, 0)
+    else:
+        result.add("column", rankings["columns"][0][0], best_column_score, 0)
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def _ranked_family_strategy(state, key, kind, label, title, with_text):
+    result = StrategyResult()
+    recommendations = []
+    sorted_items = get_rankings(state)[key]
+    hits = _hits(sorted_items)
+    if not hits:
+        recommendations.append(f"{label}: No hits yet.")
+        result.text = "\n".join(recommendations)
+        return result
+    _add_tiered_sections(result, kind, sorted_items[:9])
+    if not with_text:
+        return result
+    recommendations.append(f"{title} (Ranked):")
+    for i, (name, score) in enumerate(hits, 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def best_streets(state):
+    result = StrategyResult()
+    recommendations = []
+    sorted_streets = get_rankings(state)["streets"]
+    streets_hits = _hits(sorted_streets)
+
+    if not streets_hits:
+        recommendations.append("Best Streets: No hits yet.")
+        result.text = "\n".join(recommendations)
+        return result
+
+    recommendations.append("Top 3 Streets:")
+    for i, (name, score) in enumerate(streets_hits[:3], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+
+    recommendations.append("\nTop 6 Streets:")
+    for i, (name, score) in enumerate(streets_hits[:6], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+
+    _add_tiered_sections(result, "street", sorted_streets[:9])
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def best_double_streets(state, with_text=True):
+    return _ranked_family_strategy(state, "six_lines", "six_line", "Best Double Streets", "Double Streets", with_text)
+
+
+def best_corners(state, with_text=True):
+    return _ranked_family_strategy(state, "corners", "corner", "Best Corners", "Corners", with_text)
+
+
+def best_splits(state, with_text=True):
+    return _ranked_family_strategy(state, "splits", "split", "Best Splits", "Splits", with_text)
+
+
+def _tiered_streets_lines(state, result, recommendations, bottom_count=3):
+    sorted_streets = get_rankings(state)["streets"]
+    streets_hits = _hits(sorted_streets)
+    if not streets_hits:
+        return False
+    recommendations.append("\nTop 3 Streets (Yellow):")
+    for i, (name, score) in enumerate(streets_hits[:3], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    recommendations.append("\nMiddle 3 Streets (Cyan):")
+    for i, (name, score) in enumerate(streets_hits[3:6], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    recommendations.append(f"\nBottom {bottom_count} Streets (Green):")
+    for i, (name, score) in enumerate(streets_hits[6:6 + bottom_count], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    _add_tiered_sections(result, "street", sorted_streets[:6 + bottom_count])
+    return True
+
+
+def best_dozens_and_streets(state):
+    result = StrategyResult()
+    recommendations = []
+    dozens_hits = _hits(get_rankings(state)["dozens"])
+    if dozens_hits:
+        recommendations.append("Best Dozens (Top 2):")
+        for i, (name, score) in enumerate(dozens_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+        _add_top_hits(result, "dozen", dozens_hits, 2)
+    else:
+        recommendations.append("Best Dozens: No hits yet.")
+
+    if not _tiered_streets_lines(state, result, recommendations):
+        recommendations.append("\nBest Streets: No hits yet.")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def best_columns_and_streets(state):
+    result = StrategyResult()
+    recommendations = []
+    columns_hits = _hits(get_rankings(state)["columns"])
+    if columns_hits:
+        recommendations.append("Best Columns (Top 2):")
+        for i, (name, score) in enumerate(columns_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+        _add_top_hits(result, "column", columns_hits, 2)
+    else:
+        recommendations.append("Best Columns: No hits yet.")
+
+    if not _tiered_streets_lines(state, result, recommendations):
+        recommendations.append("\nBest Streets: No hits yet.")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def _non_overlapping_set_strategy(score_dict, kind, count, title, subtitle):
+    result = StrategyResult()
+    best_set_score, best_set_names = best_cover(score_dict, kind, count)
+    sorted_names = sorted(best_set_names, key=lambda name: score_dict[name], reverse=True)
+
+    recommendations = []
+    recommendations.append(f"{title} (Best {count} with Total Score: {best_set_score})")
+    recommendations.append(subtitle)
+    for i, name in enumerate(sorted_names, 1):
+        recommendations.append(f"{i}. {name}: {score_dict[name]}")
+    _add_tiered_sections(result, kind, [(name, score_dict[name]) for name in sorted_names])
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def non_overlapping_double_street_strategy(state):
+    return _non_overlapping_set_strategy(state.six_line_scores, "six_line", 5,
+                                         "Non-Overlapping Double Streets Strategy",
+                                         "Hottest Non-Overlapping Double Streets (Sorted by Hotness):")
+
+
+def non_overlapping_corner_strategy(state):
+    return _non_overlapping_set_strategy(state.corner_scores, "corner", 6,
+                                         "Non-Overlapping Corner Strategy",
+                                         "Hottest Non-Overlapping Corners (Sorted by Hotness):")
+
+
+def romanowksy_missing_dozen_strategy(state):
+    result = StrategyResult()
+    recommendations = []
+    rankings = get_rankings(state)
+    sorted_dozens = rankings["dozens"]
+    dozens_hits = _hits(sorted_dozens)
+
+    if len(dozens_hits) < 2:
+        recommendations.append("Romanowksy Missing Dozen Strategy: Not enough dozens have hit yet.")
+        if dozens_hits:
+            recommendations.append(f"Hottest Dozen: {dozens_hits[0][0]} (Score: {dozens_hits[0][1]})")
+            result.add("dozen", dozens_hits[0][0], dozens_hits[0][1], 0)
+        result.text = "\n".join(recommendations)
+        return result
+
+    top_dozens = _top_with_ties(sorted_dozens, 2)
+    recommendations.append("Hottest Dozens (Top 2):")
+    for i, (name, score) in enumerate(top_dozens[:2], 1):
+        recommendations.append(f"{i}. {name}: {score}")
+    if len(top_dozens) > 2 and top_dozens[1][1] == top_dozens[2][1]:
+        tied_dozens = [name for name, score in top_dozens if score == top_dozens[1][1]]
+        recommendations.append(f"Note: Tie detected among {', '.join(tied_dozens)} with score {top_dozens[1][1]}")
+    _add_top_hits(result, "dozen", dozens_hits, 2)
+
+    weakest_dozen_name, weakest_dozen_score = sorted_dozens[-1]
+    recommendations.append(f"\nWeakest Dozen: {weakest_dozen_name} (Score: {weakest_dozen_score})")
+
+    weakest_dozen_numbers = set(DOZENS[weakest_dozen_name])
+    numbers_hits = _hits(rankings["numbers"])
+
+    if not numbers_hits:
+        recommendations.append("No strong numbers have hit yet in any dozen.")
+        result.text = "\n".join(recommendations)
+        return result
+
+    strong_numbers_in_weakest = []
+    neighbors_in_weakest = []
+    for number, score in numbers_hits:
+        if number in weakest_dozen_numbers:
+            strong_numbers_in_weakest.append((number, score))
+        elif number in NEIGHBORS_EUROPEAN:
+            left, right = NEIGHBORS_EUROPEAN[number]
+            if left in weakest_dozen_numbers:
+                neighbors_in_weakest.append((left, number, score))
+            if right in weakest_dozen_numbers:
+                neighbors_in_weakest.append((right, number, score))
+
+    if strong_numbers_in_weakest:
+        recommendations.append("\nStrongest Numbers in Weakest Dozen:")
+        for number, score in strong_numbers_in_weakest:
+            recommendations.append(f"Number {number} (Score: {score})")
+    else:
+        recommendations.append("\nNo strong numbers directly in the Weakest Dozen.")
+
+    if neighbors_in_weakest:
+        recommendations.append("\nNeighbors of Strong Numbers in Weakest Dozen:")
+        for neighbor, strong_number, score in neighbors_in_weakest:
+            recommendations.append(f"Number {neighbor} (Neighbor of {strong_number}, Score: {score})")
+    elif not strong_numbers_in_weakest:
+        recommendations.append("No neighbors of strong numbers in the Weakest Dozen.")
+
+    # Table: up to eight of the strongest numbers inside the weakest dozen
+    for number, score in strong_numbers_in_weakest[:8]:
+        result.add("number", number, score, 0)
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def fibonacci_to_fortune_strategy(state):
+    result = StrategyResult()
+    recommendations = []
+    rankings = get_rankings(state)
+
+    fib_result = fibonacci_strategy(state)
+    recommendations.append("Fibonacci Strategy:")
+    recommendations.append(fib_result.text)
+
+    even_money_hits = _hits(rankings["even_money"])
+    if even_money_hits:
+        name, score = even_money_hits[0]
+        recommendations.append("\nBest Even Money Bet:")
+        recommendations.append(f"1. {name}: {score}")
+    else:
+        recommendations.append("\nBest Even Money Bet: No hits yet.")
+
+    columns_hits = _hits(rankings["columns"])
+    if columns_hits:
+        recommendations.append("\nBest Two Columns:")
+        for i, (name, score) in enumerate(columns_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+    else:
+        recommendations.append("\nBest Two Columns: No hits yet.")
+
+    dozens_sorted = rankings["dozens"]
+    dozens_hits = _hits(dozens_sorted)
+    if dozens_hits:
+        recommendations.append("\nBest Two Dozens:")
+        for i, (name, score) in enumerate(dozens_hits[:2], 1):
+            recommendations.append(f"{i}. {name}: {score}")
+    else:
+        recommendations.append("\nBest Two Dozens: No hits yet.")
+
+    weakest_dozen_name = min(state.dozen_scores.items(), key=lambda x: x[1])[0]
+    weakest_dozen_numbers = set(DOZENS[weakest_dozen_name])
+
+    top_two_dozen_numbers = set()
+    for dozen_name, _ in dozens_sorted[:2]:
+        top_two_dozen_numbers.update(DOZENS[dozen_name])
+
+    double_streets_in_weakest = []
+    for name, numbers in SIX_LINES.items():
+        numbers_set = set(numbers)
+        if numbers_set.issubset(weakest_dozen_numbers) and not numbers_set.intersection(top_two_dozen_numbers):
+            double_streets_in_weakest.append((name, state.six_line_scores[name]))
+
+    best_double_street = None
+    if double_streets_in_weakest:
+        best_double_street = sorted(double_streets_in_weakest, key=lambda x: x[1], reverse=True)[0]
+        name, score = best_double_street
+        recommendations.append(f"\nBest Double Street in Weakest Dozen ({weakest_dozen_name}):")
+        recommendations.append(f"1. {name}: {score}")
+    else:
+        recommendations.append(f"\nBest Double Street in Weakest Dozen ({weakest_dozen_name}): No suitable double street available.")
+
+    # Table: best even money bet, best dozen (when dozens lead columns) and the weak-dozen double street
+    if rankings["even_money"]:
+        result.add("even_money", rankings["even_money"][0][0], rankings["even_money"][0][1], 0)
+    best_dozen_score = dozens_sorted[0][1] if dozens_sorted else 0
+    best_column_score = rankings["columns"][0][1] if rankings["columns"] else 0
+    if dozens_sorted and best_dozen_score >= best_column_score:
+        result.add("dozen", dozens_sorted[0][0], best_dozen_score, 0)
+    if best_double_street:
+        result.add("six_line", best_double_street[0], best_double_street[1], 0)
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def three_eight_six_rising_martingale(state):
+    result = StrategyResult()
+    recommendations = []
+    rankings = get_rankings(state)
+    if rankings["even_money"]:
+        result.add("even_money", rankings["even_money"][0][0], rankings["even_money"][0][1], 0)
+    if not _hits(rankings["streets"]):
+        recommendations.append("3-8-6 Rising Martingale: No streets have hit yet.")
+        result.text = "\n".join(recommendations)
+        return result
+    _tiered_streets_lines(state, result, recommendations, bottom_count=2)
+    # The first heading has no leading blank line in this strategy
+    recommendations[0] = recommendations[0].lstrip("\n")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def one_dozen_one_column_strategy(state):
+    result = StrategyResult()
+    recommendations = []
+    rankings = get_rankings(state)
+    for kind, key, singular, plural in [("dozen", "dozens", "Best Dozen", "Best Dozens"), ("column", "columns", "Best Column", "Best Columns")]:
+        sorted_items = rankings[key]
+        hits = _hits(sorted_items)
+        if not hits:
+            recommendations.append(f"{singular}: No {key} have hit yet.")
+            continue
+        top_score = hits[0][1]
+        top_items = [item for item in sorted_items if item[1] == top_score]
+        if len(top_items) == 1:
+            recommendations.append(f"{singular}: {top_items[0][0]}")
+        else:
+            recommendations.append(f"{plural} (Tied):")
+            for name, _ in top_items:
+                recommendations.append(f"- {name}")
+        result.add(kind, hits[0][0], top_score, 0)
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def top_pick_18_numbers_without_neighbours(state, with_text=True):
+    result = StrategyResult()
+    recommendations = [] if with_text else None
+    _top_18_section(state, result, recommendations)
+    if with_text:
+        result.text = "\n".join(recommendations)
+    return result
+
+
+def _best_outside_and_top_18(state, sections, with_text):
+    """Top hits of each (ranking key, kind, label, count) section, then the Top Pick 18 Numbers."""
+    result = StrategyResult()
+    recommendations = [] if with_text else None
+    rankings = get_rankings(state)
+    for key, kind, label, count in sections:
+        if _hits(rankings[key]):
+            _add_top_hits(result, kind, rankings[key], count)
+            if with_text:
+                _ranked_top_lines(label, rankings[key], count, recommendations)
+        elif with_text:
+            recommendations.append(f"{label}: No hits yet.")
+        if with_text:
+            recommendations.append("")  # Add a blank line for separation
+    _top_18_section(state, result, recommendations)
+    if with_text:
+        result.text = "\n".join(recommendations)
+    return result
+
+
+_BEST_EVEN_MONEY = ("even_money", "even_money", "Best Even Money Bets", 3)
+_BEST_DOZENS = ("dozens", "dozen", "Best Dozens", 2)
+_BEST_COLUMNS = ("columns", "column", "Best Columns", 2)
+
+
+def best_even_money_and_top_18(state, with_text=True):
+    return _best_outside_and_top_18(state, [_BEST_EVEN_MONEY], with_text)
+
+
+def best_dozens_and_top_18(state, with_text=True):
+    return _best_outside_and_top_18(state, [_BEST_DOZENS], with_text)
+
+
+def best_columns_and_top_18(state, with_text=True):
+    return _best_outside_and_top_18(state, [_BEST_COLUMNS], with_text)
+
+
+def best_dozens_even_money_and_top_18(state, with_text=True):
+    return _best_outside_and_top_18(state, [_BEST_DOZENS, _BEST_EVEN_MONEY], with_text)
+
+
+def best_columns_even_money_and_top_18(state, with_text=True):
+    return _best_outside_and_top_18(state, [_BEST_COLUMNS, _BEST_EVEN_MONEY], with_text)
+
+
+def top_numbers_with_neighbours_tiered(state, top_count=8, tier_size=8, with_text=True):
+    """The `top_count` strongest numbers with their wheel neighbours, in three tiers of `tier_size`."""
+    if top_count < 1 or tier_size < 1:
+        raise ValueError("Top count and tier size must be at least 1.")
+    result = StrategyResult(is_html=True)
+    recommendations = []
+    numbers_hits = _hits(get_rankings(state)["numbers"])
+
+    if not numbers_hits:
+        result.text = "<p>Top Numbers with Neighbours (Tiered): No numbers have hit yet.</p>"
+        return result
+
+    top_numbers = numbers_hits[:top_count]
+    number_scores = dict(top_numbers)
+    ordered_numbers = []
+    for num, _ in top_numbers:
+        left, right = NEIGHBORS_EUROPEAN.get(num, (None, None))
+        ordered_numbers.append(num)
+        if left is not None:
+            ordered_numbers.append(left)
+        if right is not None:
+            ordered_numbers.append(right)
+    ordered_numbers = ordered_numbers[:3 * tier_size]
+    for i, num in enumerate(ordered_numbers):
+        result.add("number", num, number_scores.get(num, 0), i // tier_size)
+    if not with_text:
+        return result
+
+    # Start with the HTML table for Strongest Numbers
+    table_html = '<table border="1" style="border-collapse: collapse; text-align: center; font-family: Arial, sans-serif;">'
+    table_html += "<tr><th>Hit</th><th>Left N.</th><th>Right N.</th></tr>"  # Table header
+    for num, _ in numbers_hits:
+        left, right = NEIGHBORS_EUROPEAN.get(num, ("", ""))
+        left = str(left) if left is not None else ""
+        right = str(right) if right is not None else ""
+        table_html += f"<tr><td>{num}</td><td>{left}</td><td>{right}</td></tr>"
+    table_html += "</table>"
+
+    recommendations.append("<h3>Strongest Numbers:</h3>")
+    recommendations.append(table_html)
+
+    recommendations.append("<h3>Top Numbers with Neighbours (Tiered):</h3>")
+    for tier, heading in enumerate(["Top Tier (Yellow)", "Second Tier (Blue)", "Third Tier (Green)"]):
+        recommendations.append(f"<p><strong>{heading}:</strong></p>")
+        for i, num in enumerate(ordered_numbers[tier * tier_size:(tier + 1) * tier_size], 1):
+            score = number_scores.get(num, "Neighbor")
+            recommendations.append(f"<p>{i}. Number {num} (Score: {score})</p>")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def neighbours_of_strong_number(state, neighbours_count, strong_numbers_count):
+    """Recommend numbers and their neighbors based on hit frequency."""
+    result = StrategyResult()
+    recommendations = []
+
+    # Validate inputs
+    try:
+        neighbours_count = int(neighbours_count)
+        strong_numbers_count = int(strong_numbers_count)
+        if neighbours_count < 0 or strong_numbers_count < 0:
+            raise ValueError("Neighbours count and strong numbers count must be non-negative.")
+        if strong_numbers_count == 0:
+            raise ValueError("Strong numbers count must be at least 1.")
+    except (ValueError, TypeError) as e:
+        result.text = f"Error: Invalid input - {str(e)}. Please use positive integers for neighbours and strong numbers."
+        return result
+
+    numbers_hits = _hits(get_rankings(state)["numbers"])
+    if not numbers_hits:
+        recommendations.append("Neighbours of Strong Number: No numbers have hit yet.")
+        result.text = "\n".join(recommendations)
+        return result
+
+    # Limit strong_numbers_count to available hits
+    strong_numbers_count = min(strong_numbers_count, len(numbers_hits))
+    top_scores = dict(numbers_hits[:strong_numbers_count])
+    selected_numbers = set(top_scores)
+    neighbors_set = set()
+    for strong_number in top_scores:
+        if strong_number not in NEIGHBORS_EUROPEAN:
+            recommendations.append(f"Warning: No neighbor data for number {strong_number}. Skipping its neighbors.")
+            continue
+        neighbors_set.update(_neighbour_walk(strong_number, neighbours_count))
+
+    # Remove overlap (strong numbers take precedence)
+    neighbors_set = neighbors_set - selected_numbers
+
+    recommendations.append(f"Top {strong_numbers_count} Strongest Numbers and Their Neighbours:")
+    recommendations.append("\nStrongest Numbers (Yellow):")
+    for i, num in enumerate(sorted(top_scores), 1):
+        recommendations.append(f"{i}. Number {num} (Score: {top_scores[num]})")
+        result.add("number", num, top_scores[num], 0)
+
+    if neighbors_set:
+        recommendations.append(f"\nNeighbours ({neighbours_count} Left + {neighbours_count} Right, Cyan):")
+        for i, num in enumerate(sorted(neighbors_set), 1):
+            recommendations.append(f"{i}. Number {num}")
+            result.add("number", num, state.scores.get(num, 0), 1)
+    else:
+        recommendations.append(f"\nNeighbours ({neighbours_count} Left + {neighbours_count} Right, Cyan): None")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def hottest_wheel_sector(state, with_text=True):
+    """Bet the contiguous arc of the wheel that is furthest above its expected hits."""
+    result = StrategyResult()
+    tracker = state.wheel_sectors
+    best = tracker.strongest()
+    if best is None:
+        result.text = "Hottest Wheel Sector: No spins yet."
+        return result
+    for num in best["hot_numbers"]:
+        # Arc numbers that have hit in Top color, the rest of the arc in Middle
+        result.add("number", num, state.scores.get(num, 0), 0 if state.scores.get(num, 0) > 0 else 1)
+    if not with_text:
+        return result
+
+    recommendations = []
+    recommendations.append(
+        f"Hottest Wheel Sector: {best['length']} numbers with {best['hot_hits']} hits "
+        f"(expected {best['expected']:.1f}, z = {best['z']:.2f})"
+    )
+    recommendations.append("Numbers in wheel order: " + ", ".join(str(num) for num in best["hot_numbers"]))
+
+    recommendations.append("\nHottest and Coldest Arcs by Length:")
+    for row in tracker.sectors(range(MIN_SECTOR_LENGTH, MAX_SECTOR_LENGTH + 1, 3)):
+        recommendations.append(
+            f"{row['length']} numbers: hot {row['hot_numbers'][0]}–{row['hot_numbers'][-1]} ({row['hot_hits']} hits), "
+            f"cold {row['cold_numbers'][0]}–{row['cold_numbers'][-1]} ({row['cold_hits']} hits), expected {row['expected']:.1f}"
+        )
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+# (kind, label, sleepers listed) of the Sleepers strategy, in display order
+_SLEEPER_FAMILIES = [
+    ("even_money", "Even Money", 2),
+    ("dozen", "Dozens", 1),
+    ("column", "Columns", 1),
+    ("six_line", "Double Streets", 2),
+    ("street", "Streets", 3),
+    ("number", "Numbers", 6)
+]
+
+
+def sleepers_strategy(state, with_text=True):
+    """Bet the sections whose current drought is longest against an unbiased wheel's gaps."""
+    result = StrategyResult()
+    tracker = state.gaps
+    if not tracker.spins:
+        result.text = "Sleepers: No spins yet."
+        return result
+
+    for kind, _, count in _SLEEPER_FAMILIES:
+        for percentile, name, since in tracker.ranked(kind, count):
+            if percentile >= 50:
+                # Top color from the 90th percentile, Middle from the 75th, Lower otherwise
+                tier = 0 if percentile >= 90 else (1 if percentile >= 75 else 2)
+                result.add(kind, name, since, tier)
+    if not with_text:
+        return result
+
+    recommendations = ["Sleepers (droughts longer than most gaps on a fair wheel):"]
+    for kind, label, count in _SLEEPER_FAMILIES:
+        recommendations.append(f"\n{label}:")
+        for row in tracker.sleepers(kind, count):
+            recommendations.append(
+                f"{row['name']}: {row['since']} spins since last hit (expected gap {row['expected']:.1f}, "
+                f"longest {row['longest']}, longer than {row['percentile']:.1f}% of fair gaps)"
+            )
+
+    if not result.bets:
+        recommendations.append("\nNo section is overdue yet.")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def dealer_signature_strategy(state, with_text=True):
+    """Bet where the most common wheel offsets between spins would land from the latest spin."""
+    result = StrategyResult()
+    signature = state.dealer_signature
+    predicted = signature.predicted_sector()
+    if not predicted:
+        result.text = "Dealer Signature: Need at least two spins."
+        return result
+    for number, _, distance in predicted:
+        result.add("number", number, state.scores.get(number, 0), 0 if distance == 0 else 1)
+    if not with_text:
+        return result
+
+    total = signature.total
+    recommendations = [f"Dealer Signature ({total} spin-to-spin offsets, {total / 37:.1f} expected per offset):"]
+    for offset, hits in signature.top_offsets():
+        recommendations.append(f"{offset:+d} pockets: {hits} times")
+    statistic, p_value = signature.chi_square()
+    recommendations.append(f"Uniformity of offsets: chi-square = {statistic:.1f}, p = {p_value:.3f}")
+    recommendations.append("\nPredicted Sector (exact landing in Top color, neighbours in Middle):")
+    recommendations.append(", ".join(str(number) for number, _, _ in predicted))
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def bayesian_hot_numbers(state, with_text=True):
+    """Rank numbers by the posterior probability that their true rate beats 1/37, not by raw hits."""
+    result = StrategyResult()
+    posterior = state.posterior
+    if posterior.total == 0:
+        result.text = "Bayesian Hot Numbers: No spins yet."
+        return result
+
+    # Shared by the bets-only and the full evaluation of the same spins
+    cache = _cache(state)
+    ranking = cache.get("posterior_ranking")
+    if ranking is None:
+        ranking = cache["posterior_ranking"] = posterior.ranking(12)
+    hot = []
+    for number, hits, probability in ranking:
+        if probability < 0.6:
+            break
+        # Top color from 90% confidence, Middle from 75%, Lower from 60%
+        tier = 0 if probability >= 0.9 else (1 if probability >= 0.75 else 2)
+        result.add("number", number, hits, tier)
+        hot.append((number, hits, probability))
+    if not with_text:
+        return result
+
+    recommendations = [f"Bayesian Hot Numbers ({posterior.total} spins, fair rate {1 / 37:.2%}):"]
+    for number, hits, probability in hot:
+        mean, low, high = posterior.interval([number])
+        recommendations.append(
+            f"{number}: {hits} hits, rate {mean:.2%} (95% interval {low:.2%}–{high:.2%}), "
+            f"P(hot) = {probability:.0%}"
+        )
+    if not hot:
+        recommendations.append("No number is likely to be hot yet.")
+
+    for label, title in (("Dozen", "Dozens"), ("Column", "Columns")):
+        recommendations.append(f"\n{title}:")
+        for name, mean, low, high, probability in posterior.hot_sections(label):
+            recommendations.append(f"{name}: rate {mean:.1%} ({low:.1%}–{high:.1%}), P(hot) = {probability:.0%}")
+
+    result.text = "\n".join(recommendations)
+    return result
+
+
+# Dozen names by POCKET_DOZEN index (0 is zero, which is in no dozen)
+_DOZEN_NAMES = (None, *DOZENS)
+
+
+def dozen_tracker_strategy(state, window=5, streak_threshold=3, sequence_length=4):
+    """The Dozen Tracker's two alerts over the last `window` spins, turned into bets.
+
+    A dozen that has just hit `streak_threshold` times in a row is ridden. When
+    the last `sequence_length` dozens already appeared earlier in the window,
+    the tracker bets against the dozen that followed their first occurrence,
+    i.e. on the other two.
+    """
+    if window < 1 or streak_threshold < 1 or sequence_length < 1:
+        raise ValueError("Window, streak threshold and sequence length must be at least 1.")
+    result = StrategyResult()
+    pattern = [POCKET_DOZEN[int(spin)] for spin in state.last_spins[-window:]]
+    if not pattern:
+        result.text = "Dozen Tracker: No spins yet."
+        return result
+
+    recommendations = [
+        f"Dozen Tracker (Last {len(pattern)} Spins): " + ", ".join(_DOZEN_NAMES[d] or "Not in Dozen" for d in pattern)
+    ]
+    if len(pattern) > sequence_length:
+        tail = pattern[-sequence_length:]
+        for start in range(len(pattern) - sequence_length):
+            if pattern[start:start + sequence_length] == tail:
+                follow_up = pattern[start + sequence_length]
+                if follow_up:
+                    against = _DOZEN_NAMES[follow_up]
+                    recommendations.append(
+                        f"Sequence repeated from spin {start + 1}; it was followed by {against}. Bet against it:"
+                    )
+                    for tier, name in enumerate(name for name in DOZENS if name != against):
+                        recommendations.append(f"{name}: {state.dozen_scores[name]}")
+                        result.add("dozen", name, state.dozen_scores[name], tier)
+                else:
+                    recommendations.append(f"Sequence repeated from spin {start + 1}; it was followed by 0. No bet.")
+                break
+
+    last = pattern[-1]
+    streak = 0
+    for dozen in reversed(pattern):
+        if dozen != last:
+            break
+        streak += 1
+    if last and streak >= streak_threshold:
+        name = _DOZEN_NAMES[last]
+        recommendations.append(f"Streak: {name} has hit {streak} times in a row.")
+        result.add("dozen", name, state.dozen_scores[name], 0)
+
+    if not result.bets:
+        recommendations.append("No streak or repeated sequence to bet on.")
+    result.text = "\n".join(recommendations)
+    return result
+
+
+def evaluate_all_strategies(state, neighbours_count=2, strong_numbers_count=1):
+    """Evaluate every strategy against the shared rankings and compare their coverage.
+
+    Returns one row per strategy with:
+      coverage  - number of pockets the strategy bets on
+      overlap   - pockets bet more than once within the strategy
+      shared    - covered pockets that at least one other strategy also covers
+      stake     - units on the table with one unit per recommended bet
+      std_dev   - standard deviation of the net units per spin for that layout
+    The result is cached per state version like the individual strategies.
+    Hit rates are left to backtest.StrategyTally: scoring today's layout
+    against the spins it was ranked from would flatter every strategy.
+    """
+    key = ("__all__", neighbours_count, strong_numbers_count)
+    results = _cache(state).setdefault("strategies", {})
+    rows = results.get(key)
+    if rows is not None:
+        return rows
+
+    masks = {}
+    overlaps = {}
+    layouts = {}
+    for name in strategy_names(getattr(state, "custom_strategies", None)):
+        result = evaluate_strategy(state, name, neighbours_count, strong_numbers_count)
+        layouts[name] = result.bets
+        mask = 0
+        repeated = 0
+        for kind, bet_name, _, _ in result.bets:
+            for num in bet_numbers(kind, bet_name):
+                bit = 1 << num
+                repeated |= mask & bit
+                mask |= bit
+        masks[name] = mask
+        overlaps[name] = repeated
+
+    # Pockets covered by two or more strategies
+    seen = 0
+    shared_any = 0
+    for mask in masks.values():
+        shared_any |= seen & mask
+        seen |= mask
+
+    rows = []
+    for name, mask in masks.items():
+        rows.append({
+            "strategy": name,
+            "mask": mask,
+            "coverage": bin(mask).count("1"),
+            "overlap": bin(overlaps[name]).count("1"),
+            "shared": bin(mask & shared_any).count("1"),
+            "stake": len(layouts[name]),
+            "std_dev": variance(strategy_vector(layouts[name])) ** 0.5 if layouts[name] else 0.0
+        })
+    results[key] = rows
+    return rows
+
+STRATEGIES = {
+    "Hot Bet Strategy": {"function": hot_bet_strategy, "categories": ["even_money", "dozens", "columns", "streets", "corners", "six_lines", "splits", "sides", "numbers"], "text_optional": True},
+    "Cold Bet Strategy": {"function": cold_bet_strategy, "categories": ["even_money", "dozens", "columns", "streets", "corners", "six_lines", "splits", "sides", "numbers"], "text_optional": True},
+    "Best Even Money Bets": {"function": best_even_money_bets, "categories": ["even_money"]},
+    "Best Even Money Bets + Top Pick 18 Numbers": {"function": best_even_money_and_top_18, "categories": ["even_money", "numbers"], "text_optional": True},
+    "Best Dozens": {"function": best_dozens, "categories": ["dozens"]},
+    "Best Dozens + Top Pick 18 Numbers": {"function": best_dozens_and_top_18, "categories": ["dozens", "numbers"], "text_optional": True},
+    "Best Columns": {"function": best_columns, "categories": ["columns"]},
+    "Best Columns + Top Pick 18 Numbers": {"function": best_columns_and_top_18, "categories": ["columns", "numbers"], "text_optional": True},
+    "Best Dozens + Best Even Money Bets + Top Pick 18 Numbers": {"function": best_dozens_even_money_and_top_18, "categories": ["dozens", "even_money", "numbers", "trends"], "text_optional": True},
+    "Best Columns + Best Even Money Bets + Top Pick 18 Numbers": {"function": best_columns_even_money_and_top_18, "categories": ["columns", "even_money", "numbers", "trends"], "text_optional": True},
+    "Fibonacci Strategy": {"function": fibonacci_strategy, "categories": ["dozens", "columns"]},
+    "Best Streets": {"function": best_streets, "categories": ["streets"]},
+    "Best Double Streets": {"function": best_double_streets, "categories": ["six_lines"], "text_optional": True},
+    "Best Corners": {"function": best_corners, "categories": ["corners"], "text_optional": True},
+    "Best Splits": {"function": best_splits, "categories": ["splits"], "text_optional": True},
+    "Best Dozens + Best Streets": {"function": best_dozens_and_streets, "categories": ["dozens", "streets"]},
+    "Best Columns + Best Streets": {"function": best_columns_and_streets, "categories": ["columns", "streets"]},
+    "Non-Overlapping Double Street Strategy": {"function": non_overlapping_double_street_strategy, "categories": ["six_lines"]},
+    "Non-Overlapping Corner Strategy": {"function": non_overlapping_corner_strategy, "categories": ["corners"]},
+    "Romanowksy Missing Dozen": {"function": romanowksy_missing_dozen_strategy, "categories": ["dozens", "numbers"]},
+    "Fibonacci To Fortune": {"function": fibonacci_to_fortune_strategy, "categories": ["even_money", "dozens", "columns", "six_lines"]},
+    "3-8-6 Rising Martingale": {"function": three_eight_six_rising_martingale, "categories": ["streets"]},
+    "1 Dozen +1 Column Strategy": {"function": one_dozen_one_column_strategy, "categories": ["dozens", "columns"]},
+    "Top Pick 18 Numbers without Neighbours": {"function": top_pick_18_numbers_without_neighbours, "categories": ["numbers"], "text_optional": True},
+    "Top Numbers with Neighbours (Tiered)": {"function": top_numbers_with_neighbours_tiered, "categories": ["numbers"], "params": ["top_count", "tier_size"], "text_optional": True},
+    "Neighbours of Strong Number": {"function": neighbours_of_strong_number, "categories": ["neighbours"]},
+    "Hottest Wheel Sector": {"function": hottest_wheel_sector, "categories": ["numbers"], "needs": ["wheel_sectors"], "text_optional": True},
+    "Dealer Signature": {"function": dealer_signature_strategy, "categories": ["numbers"], "needs": ["dealer_signature"], "text_optional": True},
+    "Bayesian Hot Numbers": {"function": bayesian_hot_numbers, "categories": ["numbers"], "needs": ["posterior"], "text_optional": True},
+    "Sleepers": {"function": sleepers_strategy, "categories": ["even_money", "dozens", "columns", "streets", "six_lines", "numbers"], "needs": ["gaps"], "text_optional": True},
+    "Dozen Tracker": {"function": dozen_tracker_strategy, "categories": ["dozens"], "params": ["window", "streak_threshold", "sequence_length"]}
+}
@@ -0,0 +1,314 @@
+# strategy_dsl.py
+"""A small rule language for user-defined strategies, compiled to pocket bitmasks.
+
+A rule describes a set of pockets built from the shared rankings, e.g.
+
+    top 2 dozens ∩ not(top street) ∪ neighbours(top 3, 2)
+    (top even money | top column) - cold 6 numbers
+    sector(9) & top 18 numbers
+
+Grammar, lowest precedence first (ASCII and set-symbol spellings are equivalent):
+
+    rule      := term (("∪" | "|" | "or" | "+" | "-" | "minus") term)*
+    term      := factor (("∩" | "&" | "and") factor)*
+    factor    := ("not" | "¬" | "~") factor | "(" rule ")" | call | selector
+    call      := "neighbours" "(" rule "," N ")" | "numbers" "(" N ("," N)* ")" | "sector" "(" N ")"
+    selector  := ("top" | "hot" | "cold" | "bottom") [N] [family]
+
+"top N family" takes the N highest-scoring bets of the family that have hit;
+"cold N family" the N lowest-scoring (including those not hit yet). N defaults
+to 1 and family to numbers. "sector(N)" is the hottest N-pocket arc of the
+wheel. compile_rule() parses once into nested closures over 37-bit masks,
+so evaluating a rule is a handful of integer operations per spin. Rules are
+limited to MAX_RULE_TOKENS tokens and MAX_NESTING levels of brackets, "not"
+and calls, which keeps both the parser and the closures well inside Python's
+recursion limit.
+"""
+import re
+from functools import lru_cache
+
+from roulette_data import NEIGHBORS_EUROPEAN, BET_FAMILIES
+from strategies import RANKING_KINDS, STRATEGIES, StrategyResult, get_rankings
+from wheel_sectors import MAX_SECTOR_LENGTH, sector_numbers
+
+ALL_POCKETS = (1 << 37) - 1
+# Half the wheel each side already covers every pocket
+MAX_NEIGHBOURS = 18
+MAX_RULE_TOKENS = 300
+MAX_NESTING = 30
+
+
+def _mask(numbers):
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
+# Ranking key -> {bet name: pocket mask}
+_FAMILY_MASKS = {
+    ranking: {name: _mask(numbers) for name, numbers in BET_FAMILIES[kind].items()}
+    for ranking, kind in RANKING_KINDS.items()
+}
+
+# Family words (longest first so "even money" wins over a bare word) -> ranking key
+_FAMILY_WORDS = [
+    (("even", "money"), "even_money"),
+    (("six", "lines"), "six_lines"), (("six", "line"), "six_lines"),
+    (("double", "streets"), "six_lines"), (("double", "street"), "six_lines"),
+    (("dozens",), "dozens"), (("dozen",), "dozens"),
+    (("columns",), "columns"), (("column",), "columns"),
+    (("streets",), "streets"), (("street",), "streets"),
+    (("corners",), "corners"), (("corner",), "corners"),
+    (("splits",), "splits"), (("split",), "splits"),
+    (("sides",), "sides"), (("side",), "sides"),
+    (("numbers",), "numbers"), (("number",), "numbers")
+]
+
+_UNION = {"∪", "|", "or", "+"}
+_DIFFERENCE = {"-", "minus"}
+_INTERSECTION = {"∩", "&", "and"}
+_NEGATION = {"not", "¬", "~"}
+_TOKEN = re.compile(r"(\d+)|([A-Za-z]+)|(∪|∩|¬|[|&~+\-(),])")
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        if text[position].isspace():
+            position += 1
+            continue
+        match = _TOKEN.match(text, position)
+        if not match:
+            raise ValueError(f"Unexpected character '{text[position]}' at position {position + 1}.")
+        number, word, symbol = match.groups()
+        tokens.append(int(number) if number is not None else (word.lower() if word else symbol))
+        position = match.end()
+        if len(tokens) > MAX_RULE_TOKENS:
+            raise ValueError(f"Rule is too long (more than {MAX_RULE_TOKENS} words and symbols).")
+    return tokens
+
+
+@lru_cache(maxsize=MAX_NEIGHBOURS + 1)
+def _neighbour_masks(count):
+    """For each pocket, the mask of itself plus `count` wheel neighbours each side."""
+    masks = []
+    for number in range(37):
+        mask = 1 << number
+        for side in (0, 1):
+            current = number
+            for _ in range(count):
+                current = NEIGHBORS_EUROPEAN.get(current, (None, None))[side]
+                if current is None:
+                    break
+                mask |= 1 << current
+        masks.append(mask)
+    return masks
+
+
+def mask_numbers(mask):
+    """Pockets set in a mask, ascending."""
+    return [n for n in range(37) if mask >> n & 1]
+
+
+class _Parser:
+    """Recursive-descent parser producing closures of (state, rankings) -> mask."""
+
+    def __init__(self, text):
+        self.tokens = _tokenize(text)
+        self.index = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Rule ended early{f', expected {expected!r}' if expected else ''}.")
+        if expected is not None and token != expected:
+            raise ValueError(f"Expected {expected!r} but found {token!r}.")
+        self.index += 1
+        return token
+
+    def take_count(self):
+        token = self.take()
+        if not isinstance(token, int):
+            raise ValueError(f"Expected a number but found {token!r}.")
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Rule is empty.")
+        node = self.rule()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self.peek()!r} after the end of the rule.")
+        return node
+
+    def rule(self):
+        node = self.term()
+        while self.peek() in _UNION or self.peek() in _DIFFERENCE:
+            operator = self.take()
+            left, right = node, self.term()
+            if operator in _UNION:
+                node = lambda s, r, a=left, b=right: a(s, r) | b(s, r)
+            else:
+                node = lambda s, r, a=left, b=right: a(s, r) & ~b(s, r)
+        return node
+
+    def term(self):
+        node = self.factor()
+        while self.peek() in _INTERSECTION:
+            self.take()
+            left, right = node, self.factor()
+            node = lambda s, r, a=left, b=right: a(s, r) & b(s, r)
+        return node
+
+    def factor(self):
+        # Brackets, "not" and calls all nest through here
+        self.depth += 1
+        if self.depth > MAX_NESTING:
+            raise ValueError(f"Rule is nested too deeply (more than {MAX_NESTING} levels).")
+        node = self.nested_factor()
+        self.depth -= 1
+        return node
+
+    def nested_factor(self):
+        token = self.peek()
+        if token in _NEGATION:
+            self.take()
+            inner = self.factor()
+            return lambda s, r, a=inner: ALL_POCKETS ^ a(s, r)
+        if token == "(":
+            self.take()
+            node = self.rule()
+            self.take(")")
+            return node
+        if token in ("neighbours", "neighbors"):
+            return self.neighbours()
+        if token == "numbers" and self.index + 1 < len(self.tokens) and self.tokens[self.index + 1] == "(":
+            return self.numbers()
+        if token == "sector":
+            return self.sector()
+        if token in ("top", "hot", "cold", "bottom"):
+            return self.selector()
+        raise ValueError(f"Unexpected {token!r}." if token is not None else "Rule ended early.")
+
+    def neighbours(self):
+        self.take()
+        self.take("(")
+        inner = self.rule()
+        self.take(",")
+        count = self.take_count()
+        if count > MAX_NEIGHBOURS:
+            raise ValueError(f"Neighbours count must be between 0 and {MAX_NEIGHBOURS}.")
+        masks = _neighbour_masks(count)
+        self.take(")")
+
+        def node(s, r, a=inner):
+            mask = a(s, r)
+            expanded = 0
+            while mask:
+                low = mask & -mask
+                expanded |= masks[low.bit_length() - 1]
+                mask ^= low
+            return expanded
+        return node
+
+    def numbers(self):
+        self.take()
+        self.take("(")
+        mask = 0
+        while True:
+            number = self.take_count()
+            if not 0 <= number <= 36:
+                raise ValueError(f"Number {number} is not on the wheel.")
+            mask |= 1 << number
+            if self.peek() != ",":
+                break
+            self.take(",")
+        self.take(")")
+        return lambda s, r: mask
+
+    def sector(self):
+        self.take()
+        self.take("(")
+        length = self.take_count()
+        self.take(")")
+        if not 1 <= length <= MAX_SECTOR_LENGTH:
+            raise ValueError(f"Sector length must be between 1 and {MAX_SECTOR_LENGTH}.")
+
+        def node(s, r):
+            start, hits = s.wheel_sectors.hottest(length)
+            return _mask(sector_numbers(start, length)) if hits else 0
+        return node
+
+    def selector(self):
+        hot = self.take() in ("top", "hot")
+        count = self.take_count() if isinstance(self.peek(), int) else 1
+        family = "numbers"
+        for words, key in _FAMILY_WORDS:
+            if tuple(self.tokens[self.index:self.index + len(words)]) == words:
+                self.index += len(words)
+                family = key
+                break
+        masks = _FAMILY_MASKS[family]
+
+        if hot:
+            def node(s, r):
+                mask = 0
+                for name, score in r[family][:count]:
+                    if score <= 0:
+                        break
+                    mask |= masks[name]
+                return mask
+        else:
+            def node(s, r):
+                mask = 0
+                for name, _ in r[family][::-1][:count]:
+                    mask |= masks[name]
+                return mask
+        return node
+
+
+@lru_cache(maxsize=256)
+def compile_rule(text):
+    """Compile a rule once into a function state -> 37-bit pocket mask. Raises ValueError on bad syntax."""
+    node = _Parser(text).parse()
+
+    def evaluate(state):
+        return node(state, get_rankings(state))
+    return evaluate
+
+
+def rule_strategy(rule):
+    """A strategy function betting every pocket the rule selects (hit pockets in the Top tier)."""
+    evaluate = compile_rule(rule)
+
+    def strategy(state):
+        result = StrategyResult()
+        numbers = mask_numbers(evaluate(state))
+        if not numbers:
+            result.text = f"Custom Rule: {rule}\nNo numbers selected yet."
+            return result
+        for num in numbers:
+            score = state.scores.get(num, 0)
+            result.add("number", num, score, 0 if score > 0 else 1)
+        result.text = f"Custom Rule: {rule}\nNumbers ({len(numbers)}): " + ", ".join(str(num) for num in numbers)
+        return result
+    return strategy
+
+
+def register_rule_strategy(custom_strategies, name, rule):
+    """Add (or replace) a rule-based strategy in a session's custom_strategies dict.
+
+    The shared STRATEGIES are never touched, so one session's rules stay out of
+    everyone else's dashboard and backtests.
+    """
+    name = name.strip()
+    if not name:
+        raise ValueError("Please give the custom strategy a name.")
+    if name in STRATEGIES:
+        raise ValueError(f"'{name}' is a built-in strategy.")
+    custom_strategies[name] = {"function": rule_strategy(rule), "categories": ["numbers"], "needs": ["wheel_sectors"], "rule": rule}
@@ -0,0 +1,54 @@
+# streaks.py
+"""Run-length state of a stream of spin categories.
+
+StreakTracker keeps the spin stream as runs of identical categories (e.g. the
+dozen of each spin, or its Red/Black, Even/Odd, Low/High traits). A new spin
+either lengthens the last run or opens a new one, and undoing a spin shortens
+or drops it, so the stream is never rescanned. The trackers read streaks off
+the runs inside their window: one step per run instead of one per spin.
+"""
+from bisect import bisect_right
+
+
+class StreakTracker:
+    """Runs of equal categories of the pushed spins, with undo."""
+    __slots__ = ("symbol_of", "size", "run_starts", "run_symbols")
+
+    def __init__(self, symbol_of):
+        self.symbol_of = symbol_of
+        self.clear()
+
+    def push(self, spin):
+        symbol = self.symbol_of(spin)
+        if not self.run_symbols or self.run_symbols[-1] != symbol:
+            self.run_starts.append(self.size)
+            self.run_symbols.append(symbol)
+        self.size += 1
+
+    def pop(self):
+        self.size -= 1
+        if self.run_starts[-1] == self.size:
+            self.run_starts.pop()
+            self.run_symbols.pop()
+
+    def clear(self):
+        self.size = 0
+        self.run_starts = []
+        self.run_symbols = []
+
+    def runs(self, start=0):
+        """(symbol, offset, length) of each run from spin `start` on, the first one cut at `start`.
+
+        Offsets are counted from `start`, so they index the window directly.
+        """
+        end = self.size
+        if start >= end:
+            return []
+        first = bisect_right(self.run_starts, start) - 1
+        bounds = self.run_starts[first + 1:] + [end]
+        runs = []
+        run_start = start
+        for symbol, run_end in zip(self.run_symbols[first:], bounds):
+            runs.append((symbol, run_start - start, run_end - run_start))
+            run_start = run_end
+        return runs
@@ -0,0 +1,118 @@
+# suffix_automaton.py
+"""Online suffix automaton over a spin stream, for longest-repeat queries.
+
+The automaton of a sequence has one state per class of substrings that end at
+the same set of positions, and is extended one symbol at a time in amortized
+O(1). The suffix link of the newest state is the longest suffix of the
+stream that occurred before, so "has the recent tail happened already, and
+where" is a single lookup, and keeping the best of those over every prefix
+gives the longest repeated run in the whole session.
+
+Every change an extension makes (new states, redirected transitions, moved
+suffix links) is logged, so pop() undoes the latest spin exactly and the
+automaton follows undo like the other trackers.
+"""
+
+
+class SuffixAutomaton:
+    """Suffix automaton of symbol_of(spin) for every pushed spin, with undo."""
+    __slots__ = ("symbol_of", "next", "link", "length", "first_end", "last", "best", "_log")
+
+    def __init__(self, symbol_of=int):
+        self.symbol_of = symbol_of
+        self.clear()
+
+    def clear(self):
+        # State 0 is the empty string
+        self.next = [{}]
+        self.link = [-1]
+        self.length = [0]
+        self.first_end = [-1]  # End position of the first occurrence of each state's strings
+        self.last = 0
+        # (length, first end, end) of the longest repeated run so far
+        self.best = (0, -1, -1)
+        self._log = []
+
+    def _new_state(self, length, first_end, transitions, link):
+        self.next.append(transitions)
+        self.link.append(link)
+        self.length.append(length)
+        self.first_end.append(first_end)
+        return len(self.length) - 1
+
+    def push(self, spin):
+        symbol = self.symbol_of(spin)
+        # One log entry per pushed spin
+        position = len(self._log)
+        nxt, link, length = self.next, self.link, self.length
+        # (states before, last, best, [(state, symbol, old target)], [(state, old link)])
+        changes = (len(length), self.last, self.best, [], [])
+        self._log.append(changes)
+        transitions, links = changes[3], changes[4]
+
+        cur = self._new_state(length[self.last] + 1, position, {}, 0)
+        p = self.last
+        while p != -1 and symbol not in nxt[p]:
+            nxt[p][symbol] = cur
+            transitions.append((p, symbol, None))
+            p = link[p]
+        if p != -1:
+            q = nxt[p][symbol]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = self._new_state(length[p] + 1, self.first_end[q], dict(nxt[q]), link[q])
+                while p != -1 and nxt[p].get(symbol) == q:
+                    nxt[p][symbol] = clone
+                    transitions.append((p, symbol, q))
+                    p = link[p]
+                links.append((q, link[q]))
+                link[q] = clone
+                link[cur] = clone
+        self.last = cur
+
+        repeat = link[cur]
+        if length[repeat] > self.best[0]:
+            self.best = (length[repeat], self.first_end[repeat], position)
+
+    def pop(self):
+        states, last, best, transitions, links = self._log.pop()
+        nxt, link = self.next, self.link
+        for state, old_link in reversed(links):
+            link[state] = old_link
+        for state, symbol, old_target in reversed(transitions):
+            if old_target is None:
+                del nxt[state][symbol]
+            else:
+                nxt[state][symbol] = old_target
+        del nxt[states:], link[states:], self.length[states:], self.first_end[states:]
+        self.last = last
+        self.best = best
+
+    def tail_repeat(self):
+        """(length, first_end) of the longest run ending on the latest spin that occurred before.
+
+        first_end is the position its first occurrence ended at; (0, -1) if the
+        latest symbol is new.
+        """
+        repeat = self.link[self.last] if self.last else -1
+        if repeat <= 0:
+            return 0, -1
+        return self.length[repeat], self.first_end[repeat]
+
+    def longest_repeat(self):
+        """(length, first_end, end) of the longest run seen at least twice, or None.
+
+        first_end and end are the positions the first and the later occurrence
+        ended at (the later one is the first time the run recurred).
+        """
+        return self.best if self.best[0] else None
+
+    def first_occurrence(self, sequence):
+        """End position of the first occurrence of `sequence` (a list of symbols), or None."""
+        state = 0
+        for symbol in sequence:
+            state = self.next[state].get(symbol)
+            if state is None:
+                return None
+        return self.first_end[state] if state else None
@@ -0,0 +1,123 @@
+# wheel_sectors.py
+"""Hottest and coldest contiguous arcs of the European wheel.
+
+Hits are kept in wheel order (WHEEL_EUROPEAN) together with the total of
+every circular window of length 1 to MAX_SECTOR_LENGTH. A spin adds one to
+each window that contains its pocket, so push/pop are a single indexed add;
+rebuild() recomputes all windows from a scores dict with one circular
+prefix-sum scan per length. Finding the hottest or coldest arc of a length
+is then an argmax/argmin over 37 window totals.
+"""
+import numpy as np
+
+from roulette_data import WHEEL_EUROPEAN, WHEEL_POSITION
+
+MAX_SECTOR_LENGTH = 18
+# Shortest arc the strategy and the wheel strip consider a sector
+MIN_SECTOR_LENGTH = 3
+
+_POCKETS = len(WHEEL_EUROPEAN)
+# Flat indices into the (length, start) window table of every window containing wheel position p
+_WINDOWS_CONTAINING = [
+    np.array([(length - 1) * _POCKETS + (p - k) % _POCKETS
+              for length in range(1, MAX_SECTOR_LENGTH + 1) for k in range(length)], dtype=np.int64)
+    for p in range(_POCKETS)
+]
+
+
+def sector_numbers(start, length):
+    """Pockets of the arc starting at wheel position `start`, in wheel order."""
+    return list(_SECTOR_NUMBERS[length - 1][start])
+
+
+_SECTOR_NUMBERS = [
+    [tuple(WHEEL_EUROPEAN[(start + k) % _POCKETS] for k in range(length)) for start in range(_POCKETS)]
+    for length in range(1, MAX_SECTOR_LENGTH + 1)
+]
+_LENGTHS = np.arange(1, MAX_SECTOR_LENGTH + 1)
+
+
+class WheelSectorTracker:
+    """Per-length circular window totals over wheel-ordered hit counts."""
+    __slots__ = ("counts", "windows", "total")
+
+    def __init__(self, scores=None):
+        self.counts = np.zeros(_POCKETS, dtype=np.int64)
+        self.windows = np.zeros((MAX_SECTOR_LENGTH, _POCKETS), dtype=np.int64)
+        self.total = 0
+        if scores is not None:
+            self.rebuild(scores)
+
+    def push(self, spin):
+        position = WHEEL_POSITION[int(spin)]
+        self.counts[position] += 1
+        self.windows.ravel()[_WINDOWS_CONTAINING[position]] += 1
+        self.total += 1
+
+    def pop(self, spin):
+        position = WHEEL_POSITION[int(spin)]
+        # Mirrors the undo handler, which never lets a score go negative
+        if self.counts[position] == 0:
+            return
+        self.counts[position] -= 1
+        self.windows.ravel()[_WINDOWS_CONTAINING[position]] -= 1
+        self.total -= 1
+
+    def rebuild(self, scores):
+        """Recompute everything from a {number: hits} dict."""
+        self.counts = np.array([scores.get(n, 0) for n in WHEEL_EUROPEAN], dtype=np.int64)
+        self.total = int(self.counts.sum())
+        # Prefix sums over the wheel walked twice, so every window is a difference of two entries
+        prefix = np.concatenate(([0], np.cumsum(np.concatenate((self.counts, self.counts)))))
+        starts = np.arange(_POCKETS)
+        for length in range(1, MAX_SECTOR_LENGTH + 1):
+            self.windows[length - 1] = prefix[starts + length] - prefix[starts]
+
+    def hottest(self, length):
+        """(start, hits) of the arc of `length` with the most hits; ties go to the first from zero."""
+        row = self.windows[length - 1]
+        start = int(row.argmax())
+        return start, int(row[start])
+
+    def coldest(self, length):
+        row = self.windows[length - 1]
+        start = int(row.argmin())
+        return start, int(row[start])
+
+    def _row(self, length, hot_start, cold_start):
+        return {
+            "length": length,
+            "expected": self.total * length / _POCKETS,
+            "hot_start": hot_start,
+            "hot_hits": int(self.windows[length - 1, hot_start]),
+            "hot_numbers": sector_numbers(hot_start, length),
+            "cold_start": cold_start,
+            "cold_hits": int(self.windows[length - 1, cold_start]),
+            "cold_numbers": sector_numbers(cold_start, length)
+        }
+
+    def sectors(self, lengths=None):
+        """Hottest and coldest arc of every length (or just `lengths`), with hits expected from an unbiased wheel."""
+        hot_starts = self.windows.argmax(axis=1).tolist()
+        cold_starts = self.windows.argmin(axis=1).tolist()
+        lengths = range(1, MAX_SECTOR_LENGTH + 1) if lengths is None else lengths
+        return [self._row(length, hot_starts[length - 1], cold_starts[length - 1]) for length in lengths]
+
+    def strongest(self, min_length=MIN_SECTOR_LENGTH):
+        """The hot arc furthest above expectation in standard deviations, or None without spins.
+
+        Returns a sectors() row with an added "z" entry.
+        """
+        if self.total == 0:
+            return None
+        windows = self.windows[min_length - 1:]
+        hot_starts = windows.argmax(axis=1)
+        hot_hits = windows[np.arange(len(windows)), hot_starts]
+        p = _LENGTHS[min_length - 1:] / _POCKETS
+        z = (hot_hits - self.total * p) / np.sqrt(self.total * p * (1 - p))
+        # argmax keeps the shortest arc on ties, like the strict > scan it replaces
+        best = int(z.argmax())
+        length = min_length + best
+        row = self._row(length, int(hot_starts[best]), int(self.windows[length - 1].argmin()))
+        row["z"] = float(z[best])
+        return row
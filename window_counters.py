@@ -0,0 +1,107 @@
+# window_counters.py
+"""Hit counts over the last `size` spins, for filling casino_data from the session.
+
+WindowCounters keeps the count of every pocket inside a rolling window plus
+the even-money, dozen and column totals the casino marquee shows. A new spin
+adds its pocket and, once the window is full, removes the spin that falls
+out of it; undoing a spin does the reverse, so each step touches two pockets
+whatever the window size. It is pushed and popped with the session's spins,
+like the other trackers.
+"""
+from roulette_data import EVEN_MONEY, DOZENS, COLUMNS
+
+# casino_data key -> {name: pockets} of the percentages it holds
+CASINO_SECTIONS = {
+    "even_odd": {name: EVEN_MONEY[name] for name in ("Even", "Odd")},
+    "red_black": {name: EVEN_MONEY[name] for name in ("Red", "Black")},
+    "low_high": {name: EVEN_MONEY[name] for name in ("Low", "High")},
+    "dozens": DOZENS,
+    "columns": COLUMNS
+}
+HOT_COLD_COUNT = 5
+
+# For each pocket, the (casino_data key, name) of every section covering it
+_POCKET_KEYS = [
+    [(key, name) for key, sections in CASINO_SECTIONS.items() for name, numbers in sections.items() if pocket in numbers]
+    for pocket in range(37)
+]
+
+
+class WindowCounters:
+    """Pocket and section counts over the last `size` spins of a spin list."""
+    __slots__ = ("size", "spins", "counts", "section_counts")
+
+    def __init__(self, size=100):
+        if int(size) < 1:
+            raise ValueError("Window size must be at least 1.")
+        self.size = int(size)
+        self.clear()
+
+    def clear(self):
+        self.spins = []
+        self.counts = [0] * 37
+        self.section_counts = {key: {name: 0 for name in sections} for key, sections in CASINO_SECTIONS.items()}
+
+    def _add(self, pocket, step):
+        self.counts[pocket] += step
+        for key, name in _POCKET_KEYS[pocket]:
+            self.section_counts[key][name] += step
+
+    def push(self, spin):
+        self.spins.append(int(spin))
+        self._add(self.spins[-1], 1)
+        if len(self.spins) > self.size:
+            self._add(self.spins[-1 - self.size], -1)
+
+    def pop(self):
+        if not self.spins:
+            return None
+        spin = self.spins.pop()
+        self._add(spin, -1)
+        if len(self.spins) >= self.size:
+            self._add(self.spins[-self.size], 1)
+        return spin
+
+    def rebuild(self, spins):
+        """Start over from a whole spin list (e.g. a loaded session)."""
+        self.clear()
+        for spin in spins:
+            self.push(spin)
+
+    def resize(self, size):
+        """Change the window length, recounting the spins already seen."""
+        if int(size) < 1:
+            raise ValueError("Window size must be at least 1.")
+        if int(size) != self.size:
+            self.size = int(size)
+            self.rebuild(self.spins)
+
+    @property
+    def window(self):
+        """Number of spins currently inside the window."""
+        return min(len(self.spins), self.size)
+
+    def percentages(self):
+        """Section percentages of the window, shaped like the casino_data entries."""
+        window = self.window
+        return {
+            key: {name: 100 * count / window if window else 0.0 for name, count in counts.items()}
+            for key, counts in self.section_counts.items()
+        }
+
+    def hot_cold(self, count=HOT_COLD_COUNT):
+        """({number: percentage} of the `count` most hit numbers, same for the least hit), empty without spins."""
+        window = self.window
+        if not window:
+            return {}, {}
+        ranked = sorted(range(37), key=lambda number: (-self.counts[number], number))
+        hot = {number: 100 * self.counts[number] / window for number in ranked[:count] if self.counts[number] > 0}
+        cold = {number: 100 * self.counts[number] / window for number in sorted(ranked[-count:])}
+        return hot, cold
+
+    def casino_data(self):
+        """A complete casino_data dict for the current window."""
+        hot, cold = self.hot_cold()
+        data = {"spins_count": self.size, "hot_numbers": hot, "cold_numbers": cold}
+        data.update(self.percentages())
+        return data